@@ -1,11 +1,15 @@
 """
 Data models for storing GNSS observations and satellite states.
+
+SignalData and SatelliteState are slotted: they are created and read per
+satellite per epoch, so attribute access skips the instance __dict__.
+Consumers use the declared attribute names (elevation, azimuth, snr, ...).
 """
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class SignalData:
     """
     Holds observation data for a specific frequency/signal.
@@ -18,7 +22,7 @@ class SignalData:
     half_cycle: int
     doppler: float
 
-@dataclass
+@dataclass(slots=True)
 class SatelliteState:
     """
     Represents the state of a single satellite at a specific epoch.
@@ -34,6 +38,16 @@ class SatelliteState:
     # Signal Data: Key is signal_id (e.g., "1C")
     signals: Dict[str, SignalData] = field(default_factory=dict)
 
+    # Cached sorted(signals) for consumers; reset to None whenever a signal is inserted
+    _sorted_codes: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def sorted_codes(self) -> List[str]:
+        """Return signal codes in sorted order, re-sorting only after signals changed."""
+        codes = self._sorted_codes
+        if codes is None:
+            codes = self._sorted_codes = sorted(self.signals)
+        return codes
+
 @dataclass
 class EpochObservation:
     """
@@ -41,4 +55,14 @@ class EpochObservation:
     """
     gps_time: float       # GPS Time of Week (seconds)
     satellites: Dict[str, SatelliteState] = field(default_factory=dict)
-    utc_datetime: Optional[datetime] = None  # Absolute UTC time (year, month, day, hour, minute, second)
\ No newline at end of file
+    utc_datetime: Optional[datetime] = None  # Absolute UTC time (year, month, day, hour, minute, second)
+    num_signals: int = 0  # Signals over all satellites, counted at ingest and kept by merge()
+
+    def merge(self, other: "EpochObservation"):
+        """Add the satellites of other (replacing same keys), keeping num_signals current."""
+        satellites = self.satellites
+        # Messages of one epoch rarely share satellites: only overlapping keys
+        # are visited in Python, the rest is a single dict.update
+        replaced = satellites.keys() & other.satellites.keys()
+        self.num_signals += other.num_signals - sum(len(satellites[k].signals) for k in replaced)
+        satellites.update(other.satellites)
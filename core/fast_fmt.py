@@ -0,0 +1,25 @@
+"""
+Column-wise fixed-point float formatting for text logging.
+
+Formats a whole numeric column (e.g. all elevations of one flush) in a single
+call instead of one Python format() per value, using NumPy's vectorized string
+formatting, which produces exactly the same text as '%.Nf'.
+"""
+import numpy as np
+
+
+def format_fixed(values, decimals: int) -> list:
+    """
+    Format a numeric column with a fixed number of decimals.
+
+    Args:
+        values: Sequence or array of floats
+        decimals: Digits after the decimal point (as in '%.Nf')
+
+    Returns:
+        List of formatted strings, same length as values.
+    """
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return []
+    return np.char.mod(f'%.{decimals}f', arr).tolist()
@@ -1,20 +1,24 @@
 import threading
 from collections import deque
-from typing import Optional, Any
+from typing import Optional, Any, Callable
 
 
 class RingBuffer:
     """
     Thread-safe ring buffer implementation for efficient data transfer between I/O and processing threads.
     """
-    def __init__(self, maxsize: int = 1000):
+    def __init__(self, maxsize: int = 1000, on_data: Optional[Callable[[], None]] = None):
         """
         Initialize the ring buffer.
         
         Args:
             maxsize: The maximum size of the buffer. If the buffer is full, the oldest data is discarded.
+            on_data: Optional callback invoked (outside the lock, in the writer's thread) when a put
+                makes an empty buffer non-empty. Lets a consumer that drains the buffer completely
+                be woken once per batch instead of polling.
         """
         self.maxsize = maxsize
+        self.on_data = on_data
         self.buffer = deque(maxlen=maxsize)
         self.lock = threading.Lock()
         self.not_empty = threading.Condition(self.lock)
@@ -40,17 +44,21 @@ class RingBuffer:
             # Non-blocking mode: If the buffer is full, discard the oldest data (ring buffer feature).
             if not block:
                 # If the buffer is full, deque will discard the oldest data.
+                was_empty = not self.buffer
                 self.buffer.append(item)
                 self.not_empty.notify()
-                return True
             else:
                 # Blocking mode: Wait for space to be available.
                 if len(self.buffer) >= self.maxsize:
                     if not self.not_full.wait(timeout):
                         return False
+                was_empty = not self.buffer
                 self.buffer.append(item)
                 self.not_empty.notify()
-                return True
+
+        if was_empty and self.on_data is not None:
+            self.on_data()
+        return True
     
     def get(self, block: bool = True, timeout: Optional[float] = None) -> Optional[Any]:
         """
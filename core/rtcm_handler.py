@@ -459,7 +459,10 @@ class RTCMHandler:
                         half_cycle=int(half_cycle),
                         doppler=float(doppler),
                     )
+                    if sig_id not in sat_state.signals:
+                        epoch_data.num_signals += 1
                     sat_state.signals[sig_id] = obs
+                    sat_state._sorted_codes = None
 
             return epoch_data
 
@@ -0,0 +1,221 @@
+"""
+Raw RTCM file writer running in a dedicated subprocess.
+
+The LoggingThread only forwards raw RTCM bytes through a multiprocessing queue;
+the child process owns the file handle and performs batched writes and flushes,
+so disk writes never contend for the GIL with the Qt UI thread.
+
+The child is always started with the 'spawn' start method. It imports this
+module and re-imports the application's main module (gui_main, which only
+imports Qt and the UI inside main()), so this module deliberately has no Qt
+imports either.
+"""
+import multiprocessing
+import os
+from queue import Empty, Full
+
+
+# Positional / scatter-gather writes are available on POSIX (not on Windows)
+_HAS_PWRITE = hasattr(os, 'pwrite')
+_HAS_PWRITEV = hasattr(os, 'pwritev')
+_HAS_WRITEV = hasattr(os, 'writev')
+
+# Max buffers per writev call (Linux IOV_MAX is 1024)
+_IOV_MAX = 1024
+
+
+def _write_all(fd, buf, offset):
+    """
+    Write buf to fd at offset, retrying on short writes (no extra copy).
+
+    Uses os.pwrite where available so the writer never depends on the
+    shared file position; falls back to os.write elsewhere.
+
+    Returns:
+        The new file offset.
+    """
+    view = memoryview(buf)
+    while view:
+        if _HAS_PWRITE:
+            n = os.pwrite(fd, view, offset)
+        else:
+            n = os.write(fd, view)
+        offset += n
+        view = view[n:]
+    return offset
+
+
+def _writev_all(fd, chunks, offset):
+    """
+    Write a list of byte chunks to fd at offset with one gather syscall per
+    _IOV_MAX chunks, handling short writes by slicing the partial chunk.
+
+    Falls back to _write_all for a single chunk or when writev is unavailable.
+
+    Returns:
+        The new file offset.
+    """
+    if len(chunks) == 1:
+        return _write_all(fd, chunks[0], offset)
+    if not _HAS_WRITEV:
+        return _write_all(fd, b''.join(chunks), offset)
+
+    while chunks:
+        iov = chunks[:_IOV_MAX]
+        if _HAS_PWRITEV:
+            n = os.pwritev(fd, iov, offset)
+        else:
+            n = os.writev(fd, iov)
+        offset += n
+
+        # Drop fully written chunks, keep the unwritten tail of a partial one
+        i = 0
+        while i < len(iov) and n >= len(iov[i]):
+            n -= len(iov[i])
+            i += 1
+        chunks = chunks[i:]
+        if n:
+            chunks[0] = memoryview(chunks[0])[n:]
+    return offset
+
+
+def _rtcm_writer_main(path, queue, err_conn):
+    """
+    Subprocess entry point: append raw RTCM chunks from queue to path.
+
+    Procedure:
+    1. Open the file and report the outcome on err_conn (None when ready,
+       the error text otherwise)
+    2. Block until at least one chunk is available
+    3. Drain all other queued chunks without blocking into an iovec list
+    4. Gather-write the list with os.pwritev/os.writev at the tracked offset
+       (no user-side concatenation copy, one syscall per drain)
+    5. Exit on the None sentinel (after writing what was already drained), fsync and close;
+       a write error is reported on err_conn and ends the process with exit code 1
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(path, flags, 0o644)
+    except OSError as e:
+        err_conn.send(f"cannot open {path}: {e}")
+        raise SystemExit(1)
+    err_conn.send(None)
+
+    offset = 0
+    try:
+        running = True
+        while running:
+            item = queue.get()
+            if item is None:
+                break
+            iov = [item]
+
+            # Collect everything already queued for a single gather write
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                iov.append(item)
+
+            offset = _writev_all(fd, iov, offset)
+        os.fsync(fd)
+    except OSError as e:
+        err_conn.send(f"write to {path} failed: {e}")
+        raise SystemExit(1)
+    finally:
+        os.close(fd)
+
+
+class RtcmWriterProcess:
+    """
+    File-like proxy for a raw RTCM log file owned by a writer subprocess.
+
+    Provides write()/close() so LoggingThread can treat it like the file
+    handle it replaces. Errors from the subprocess come back through a pipe:
+    start() raises OSError if the file cannot be opened, and poll_error()
+    returns a later write failure.
+    """
+
+    def __init__(self, path: str, maxsize: int = 5000, put_timeout: float = 1.0):
+        """
+        Args:
+            path: Output .rtcm file path (opened by the subprocess)
+            maxsize: Maximum number of queued chunks
+            put_timeout: Seconds write() waits for queue space before dropping a chunk
+        """
+        self.path = path
+        self.put_timeout = put_timeout
+        # 'spawn' on every platform: forking the multithreaded Qt process is unsafe
+        ctx = multiprocessing.get_context('spawn')
+        self.queue = ctx.Queue(maxsize=maxsize)
+        self._err_recv, self._err_send = ctx.Pipe(duplex=False)
+        self.process = ctx.Process(
+            target=_rtcm_writer_main, args=(path, self.queue, self._err_send), daemon=True
+        )
+        self.dropped = 0
+        self.error = None
+
+    def start(self, timeout: float = 10.0):
+        """
+        Spawn the writer subprocess and wait until it has opened the file.
+
+        Raises:
+            OSError: If the subprocess cannot open the file or does not start within timeout
+        """
+        self.process.start()
+        self._err_send.close()    # the child holds its own end
+        if not self._err_recv.poll(timeout):
+            self.process.terminate()
+            self.process.join(timeout)
+            raise OSError(f"RTCM writer for {self.path} did not start (exit code {self.process.exitcode})")
+        msg = self._err_recv.recv()
+        if msg is not None:
+            self.process.join(timeout)
+            raise OSError(msg)
+
+    def write(self, raw: bytes):
+        """Queue raw bytes for the subprocess, waiting up to put_timeout for space (dropped after that)."""
+        try:
+            self.queue.put(raw, timeout=self.put_timeout)
+        except Full:
+            self.dropped += 1
+
+    def poll_error(self):
+        """
+        Check whether the subprocess has failed.
+
+        Returns:
+            The error text (returned once per failure), or None while the writer is healthy.
+        """
+        if self.error is not None:
+            return None
+        try:
+            if self._err_recv.poll():
+                self.error = self._err_recv.recv()
+        except (EOFError, OSError):
+            pass
+        if self.error is None and self.process.exitcode:
+            self.error = f"RTCM writer for {self.path} exited (exit code {self.process.exitcode})"
+        return self.error
+
+    def close(self, timeout: float = 2.0):
+        """
+        Send the sentinel and wait for the subprocess to finish writing.
+
+        Returns:
+            The subprocess exit code (None if it did not exit within timeout).
+        """
+        if self.process.is_alive():
+            try:
+                self.queue.put(None, timeout=timeout)
+            except Full:
+                pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        return self.process.exitcode
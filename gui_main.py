@@ -18,11 +18,19 @@ Created for research and engineering purposes in the field of
 real-time GNSS data processing and analysis.
 """
 
+import multiprocessing
 import sys
-from PySide6.QtWidgets import QApplication
-from ui.app_manager import AppManager
 
 def main():
+    # GUI imports live here, not at module level: the 'spawn' RTCM writer
+    # subprocess re-imports this module and should not load Qt or the UI
+    from PySide6.QtCore import Qt, QCoreApplication
+    from PySide6.QtWidgets import QApplication
+    from ui.app_manager import AppManager
+
+    # QtWebEngine (optional web position map) is imported after the application
+    # is created, which requires shared OpenGL contexts to be enabled up front
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     app.setApplicationName("RTGS - RealTimeGNSS Studio")
     app.setApplicationVersion("0.1")
@@ -34,4 +42,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for 'spawn' subprocesses in frozen (e.g. PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,45 @@
+"""
+Tests for the monitoring window's dense satellite slot map.
+"""
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from core.data_models import SatelliteState, EpochObservation
+from ui.monitoring_module import MonitoringModule, _prn_to_idx, _N_SAT_SLOTS
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_prn_slots_are_distinct_and_in_range():
+    prns = ['G01', 'R24', 'E36', 'C63', 'J193', 'J202', 'S120', 'S158', 'I01', 'I56']
+    slots = [_prn_to_idx(prn) for prn in prns]
+    assert all(0 <= i < _N_SAT_SLOTS for i in slots)
+    assert len(set(slots)) == len(slots)
+
+
+def test_unknown_prns_have_no_slot():
+    for prn in ('X01', 'J01', 'S119', 'G65', 'EGIOVE-A', ''):
+        assert _prn_to_idx(prn) == -1
+
+
+def test_merge_qzss_and_sbas(app):
+    module = MonitoringModule()
+    epoch = EpochObservation(gps_time=1.0)
+    for prn in ('G01', 'J193', 'S120', 'I56'):
+        epoch.satellites[prn] = SatelliteState(sys_id=prn[0], prn=int(prn[1:]))
+
+    module._merge_epoch(epoch)
+
+    assert sorted(module.merged_satellites) == ['G01', 'I56', 'J193', 'S120']
+    assert module._sorted_prns == ['G01', 'I56', 'J193', 'S120']
+    for prn in ('J193', 'S120', 'I56'):
+        assert module._slot_prns[_prn_to_idx(prn)] == prn
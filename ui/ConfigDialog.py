@@ -1,14 +1,129 @@
-import importlib.util
+import threading
+import time
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QGroupBox, QFormLayout, 
                              QLineEdit, QCheckBox, QHBoxLayout, QPushButton, 
                              QFileDialog, QMessageBox, QStyle, QComboBox, QLabel,
                              QSpinBox, QScrollArea, QWidget, QDoubleSpinBox, QSizePolicy)
 from PySide6.QtGui import QIcon
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker, Slot, Signal, QObject, QTimer
+
+# Seconds a serial port enumeration is reused by later dialogs (and the
+# rescan interval while a dialog with serial fields is open)
+_PORTS_TTL = 5.0
+
+
+def _scan_ports():
+    """List serial port device names (slow: scans the OS device tree)"""
+    try:
+        import serial.tools.list_ports
+        return [port.device for port in serial.tools.list_ports.comports()]
+    except:
+        return ["COM1", "COM2", "COM3"]
+
+
+class _PortScanner(QObject):
+    """Runs serial port scans on a background thread and publishes the result to the dialogs"""
+    ports_ready = Signal(object)  # Emitted from the scan thread (queued to the UI thread)
+
+    def __init__(self):
+        super().__init__()
+        self._thread = None
+
+    def scan(self):
+        """Start a background scan unless one is already running"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="SerialPortScan", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        ports = _scan_ports()
+        ConfigDialog._ports_shared = (time.monotonic(), ports)
+        self.ports_ready.emit(ports)
+
+
+_port_scanner = None
+
+
+def _get_port_scanner():
+    """Return the shared _PortScanner (created on first use, from the UI thread)"""
+    global _port_scanner
+    if _port_scanner is None:
+        _port_scanner = _PortScanner()
+    return _port_scanner
+
+
+def prefetch_serial_ports():
+    """Warm the shared serial port list in the background so the first dialog does not scan"""
+    _get_port_scanner().scan()
+
+
+def _read_config_constants(path):
+    """
+    Read the top-level literal constants of a Python config file without executing it.
+
+    Args:
+        path: Path of the .py config file
+
+    Returns:
+        {name: value} for every `NAME = <literal>` assignment; assignments of
+        non-literal expressions are skipped.
+    """
+    import ast  # Only needed when a config file is loaded
+    with open(path, encoding='utf-8') as fh:
+        tree = ast.parse(fh.read(), filename=path)
+
+    values = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except (ValueError, TypeError):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                values[target.id] = value
+    return values
+
 
 class ConfigDialog(QDialog):
+    # Last serial port enumeration shared by all dialogs: (monotonic time, ports)
+    _ports_shared = None
+
+    # Config file constant -> line edit attribute, used by load_file
+    _OBS_LOAD_MAP = (
+        ('NTRIP_HOST', 'obs_h'), ('NTRIP_PORT', 'obs_p'), ('MOUNTPOINT', 'obs_m'),
+        ('USER', 'obs_u'), ('PASSWORD', 'obs_pw'),
+    )
+    _EPH_LOAD_MAP = (
+        ('EPH_HOST', 'eph_h'), ('EPH_PORT', 'eph_p'), ('EPH_MOUNTPOINT', 'eph_m'),
+        ('EPH_USER', 'eph_u'), ('EPH_PASSWORD', 'eph_pw'),
+    )
+
+    # Button icons (open, save) shared by all dialogs, looked up on first use
+    _icons = None
+
+    @classmethod
+    def _get_icons(cls, style):
+        """Return the (open, save) button icons, asking the style only once"""
+        if cls._icons is None:
+            cls._icons = (
+                style.standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon),
+                style.standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton),
+            )
+        return cls._icons
+
     def __init__(self, parent=None, initial_settings=None):
         super().__init__(parent)
+        self._ports_cache = None  # Serial ports listed by this dialog (one scan for OBS and EPH)
+        self._port_selection = {}  # {prefix: saved serial port} for port combos not yet filled
+        # Keep filled port combos current: rescan in the background while shown
+        _get_port_scanner().ports_ready.connect(self._on_ports_scanned)
+        self._ports_timer = QTimer(self)
+        self._ports_timer.setInterval(int(_PORTS_TTL * 1000))
+        self._ports_timer.timeout.connect(self._rescan_ports)
+        self._visibility_applied = False  # Source-dependent field visibility set on first show
         self.setWindowTitle("Data Source Settings")
         self.resize(500, 800)  # Reduced default height
         self.settings = initial_settings or {}
@@ -33,61 +148,7 @@ class ConfigDialog(QDialog):
         # OBS Stream Configuration
         # =====================================================================
         grp_obs = QGroupBox("Observation Stream (OBS)")
-        fl_obs = QFormLayout()
-        fl_obs.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
-        fl_obs.setRowWrapPolicy(QFormLayout.DontWrapRows)
-        fl_obs.setFormAlignment(Qt.AlignHCenter | Qt.AlignTop)
-        fl_obs.setLabelAlignment(Qt.AlignLeft)
-        
-        # Data source type selector
-        self.obs_source = QComboBox()
-        self.obs_source.addItems(["NTRIP Server", "Serial Port"])
-        obs_source_val = self.settings.get('OBS', {}).get('source', 'NTRIP Server')
-        self.obs_source.setCurrentText(obs_source_val)
-        self.obs_source.currentTextChanged.connect(self.on_obs_source_changed)
-        fl_obs.addRow("Data Source:", self.obs_source)
-        
-        # NTRIP fields
-        self.obs_h = QLineEdit(self.settings.get('OBS', {}).get('host',''))
-        self.obs_p = QLineEdit(str(self.settings.get('OBS', {}).get('port','2101')))
-        self.obs_m = QLineEdit(self.settings.get('OBS', {}).get('mountpoint',''))
-        self.obs_u = QLineEdit(self.settings.get('OBS', {}).get('user',''))
-        self.obs_pw = QLineEdit(self.settings.get('OBS', {}).get('password',''))
-        self.obs_pw.setEchoMode(QLineEdit.EchoMode.Password)
-        
-        self.lbl_obs_host = QLabel("Host:")
-        self.lbl_obs_port = QLabel("Port:")
-        self.lbl_obs_mount = QLabel("Mountpoint:")
-        self.lbl_obs_user = QLabel("User:")
-        self.lbl_obs_pw = QLabel("Password:")
-        
-        # Set size policy for better resizing behavior
-        self._set_size_policy_for_widgets([self.obs_h, self.obs_p, self.obs_m, self.obs_u, self.obs_pw])
-        
-        fl_obs.addRow(self.lbl_obs_host, self.obs_h)
-        fl_obs.addRow(self.lbl_obs_port, self.obs_p)
-        fl_obs.addRow(self.lbl_obs_mount, self.obs_m)
-        fl_obs.addRow(self.lbl_obs_user, self.obs_u)
-        fl_obs.addRow(self.lbl_obs_pw, self.obs_pw)
-        
-        # Serial port fields
-        self.obs_port = QComboBox()
-        self.obs_port.addItems(self._get_available_ports() or ["No ports found"])
-        obs_port_setting = self.settings.get('OBS', {}).get('port', 'COM1')
-        self.obs_port.setCurrentText(str(obs_port_setting))
-        
-        self.obs_baudrate = QSpinBox()
-        self.obs_baudrate.setMinimum(300)
-        self.obs_baudrate.setMaximum(921600)
-        self.obs_baudrate.setValue(int(self.settings.get('OBS', {}).get('baudrate', 115200)))
-        
-        self.lbl_obs_serial_port = QLabel("Serial Port:")
-        self.lbl_obs_baudrate = QLabel("Baud Rate:")
-        
-        self._set_size_policy_for_widgets([self.obs_port, self.obs_baudrate])
-        
-        fl_obs.addRow(self.lbl_obs_serial_port, self.obs_port)
-        fl_obs.addRow(self.lbl_obs_baudrate, self.obs_baudrate)
+        fl_obs = self._build_stream_form('obs', self.settings.get('OBS', {}), 'COM1')
         
         grp_obs.setLayout(fl_obs)
         scroll_layout.addWidget(grp_obs)
@@ -97,69 +158,15 @@ class ConfigDialog(QDialog):
         # =====================================================================
         self.chk_eph = QCheckBox("Enable Ephemeris Stream (EPH)")
         self.chk_eph.setChecked(self.settings.get('EPH_ENABLED', False))
-        self.chk_eph.stateChanged.connect(self.on_eph_enabled_changed)
+        self.chk_eph.toggled.connect(self.on_eph_enabled_changed)
         scroll_layout.addWidget(self.chk_eph)
         
-        grp_eph = QGroupBox("Ephemeris Stream (EPH)")
-        fl_eph = QFormLayout()
-        fl_eph.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
-        fl_eph.setRowWrapPolicy(QFormLayout.DontWrapRows)
-        fl_eph.setFormAlignment(Qt.AlignHCenter | Qt.AlignTop)
-        fl_eph.setLabelAlignment(Qt.AlignLeft)
-        
-        # Data source type selector for EPH
-        self.eph_source = QComboBox()
-        self.eph_source.addItems(["NTRIP Server", "Serial Port"])
-        eph_source_val = self.settings.get('EPH', {}).get('source', 'NTRIP Server')
-        self.eph_source.setCurrentText(eph_source_val)
-        self.eph_source.currentTextChanged.connect(self.on_eph_source_changed)
-        fl_eph.addRow("Data Source:", self.eph_source)
-        
-        # NTRIP fields for EPH
-        self.eph_h = QLineEdit(self.settings.get('EPH', {}).get('host',''))
-        self.eph_p = QLineEdit(str(self.settings.get('EPH', {}).get('port','2101')))
-        self.eph_m = QLineEdit(self.settings.get('EPH', {}).get('mountpoint',''))
-        self.eph_u = QLineEdit(self.settings.get('EPH', {}).get('user',''))
-        self.eph_pw = QLineEdit(self.settings.get('EPH', {}).get('password',''))
-        self.eph_pw.setEchoMode(QLineEdit.EchoMode.Password)
-        
-        self.lbl_eph_host = QLabel("Host:")
-        self.lbl_eph_port = QLabel("Port:")
-        self.lbl_eph_mount = QLabel("Mountpoint:")
-        self.lbl_eph_user = QLabel("User:")
-        self.lbl_eph_pw = QLabel("Password:")
-        
-        self._set_size_policy_for_widgets([self.eph_h, self.eph_p, self.eph_m, self.eph_u, self.eph_pw])
-        
-        fl_eph.addRow(self.lbl_eph_host, self.eph_h)
-        fl_eph.addRow(self.lbl_eph_port, self.eph_p)
-        fl_eph.addRow(self.lbl_eph_mount, self.eph_m)
-        fl_eph.addRow(self.lbl_eph_user, self.eph_u)
-        fl_eph.addRow(self.lbl_eph_pw, self.eph_pw)
-        
-        # Serial port fields for EPH
-        self.eph_port = QComboBox()
-        self.eph_port.addItems(self._get_available_ports() or ["No ports found"])
-        eph_port_setting = self.settings.get('EPH', {}).get('port', 'COM2')
-        self.eph_port.setCurrentText(str(eph_port_setting))
-        
-        self.eph_baudrate = QSpinBox()
-        self.eph_baudrate.setMinimum(300)
-        self.eph_baudrate.setMaximum(921600)
-        self.eph_baudrate.setValue(int(self.settings.get('EPH', {}).get('baudrate', 115200)))
-        
-        self.lbl_eph_serial_port = QLabel("Serial Port:")
-        self.lbl_eph_baudrate = QLabel("Baud Rate:")
-        
-        self._set_size_policy_for_widgets([self.eph_port, self.eph_baudrate])
-        
-        fl_eph.addRow(self.lbl_eph_serial_port, self.eph_port)
-        fl_eph.addRow(self.lbl_eph_baudrate, self.eph_baudrate)
-        
-        grp_eph.setLayout(fl_eph)
-        grp_eph.setEnabled(self.chk_eph.isChecked())
-        self.grp_eph = grp_eph
-        scroll_layout.addWidget(grp_eph)
+        # The EPH form is only built once the stream is enabled; until then a
+        # placeholder holds its place in the layout
+        self.grp_eph = None
+        self._eph_placeholder = QWidget()
+        self._scroll_layout = scroll_layout
+        scroll_layout.addWidget(self._eph_placeholder)
         
         # =====================================================================
         # General Settings
@@ -172,16 +179,17 @@ class ConfigDialog(QDialog):
         fl_general.setLabelAlignment(Qt.AlignLeft)
         
         # Receiver Approximate Position (ECEF X, Y, Z in meters) - using QLineEdit for display
+        rec_pos = self.settings.get('APPROX_REC_POS', [0, 0, 0])
         self.rec_pos_x = QLineEdit()
-        self.rec_pos_x.setText(str(self.settings.get('APPROX_REC_POS', [0, 0, 0])[0]))
+        self.rec_pos_x.setText(str(rec_pos[0]))
         self.rec_pos_x.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         
         self.rec_pos_y = QLineEdit()
-        self.rec_pos_y.setText(str(self.settings.get('APPROX_REC_POS', [0, 0, 0])[1]))
+        self.rec_pos_y.setText(str(rec_pos[1]))
         self.rec_pos_y.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         
         self.rec_pos_z = QLineEdit()
-        self.rec_pos_z.setText(str(self.settings.get('APPROX_REC_POS', [0, 0, 0])[2]))
+        self.rec_pos_z.setText(str(rec_pos[2]))
         self.rec_pos_z.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         
         hlayout_pos = QHBoxLayout()
@@ -213,14 +221,13 @@ class ConfigDialog(QDialog):
         btns = QHBoxLayout()
         b_load = QPushButton("Load File")
         b_load.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
-        open_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon)
+        open_icon, save_icon = self._get_icons(self.style())
         if not open_icon.isNull():
             b_load.setIcon(open_icon)
         b_load.clicked.connect(self.load_file)
         
         b_save = QPushButton("Connect")
         b_save.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
-        save_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton)
         if not save_icon.isNull():
             b_save.setIcon(save_icon)
         # When Connect is clicked, mark auto_connect and accept dialog
@@ -230,68 +237,283 @@ class ConfigDialog(QDialog):
         btns.addWidget(b_save)
         layout.addLayout(btns)
         
-        # Initialize visibility
-        self.on_obs_source_changed()
+        # Build the EPH form if the stream is enabled; field visibility is
+        # applied in one pass when the dialog is first shown
         self.on_eph_enabled_changed()
-        self.on_eph_source_changed()
+
+    def showEvent(self, event):
+        if not self._visibility_applied:
+            self._visibility_applied = True
+            self._apply_initial_visibility()
+        self._ports_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._ports_timer.stop()
+        super().hideEvent(event)
+
+    def _apply_initial_visibility(self):
+        """Show the NTRIP or serial fields of both streams in a single layout pass"""
+        self.setUpdatesEnabled(False)
+        try:
+            is_obs_ntrip = self.obs_source.currentText() == "NTRIP Server"
+            self.obs_ntrip_box.setVisible(is_obs_ntrip)
+            self.obs_serial_box.setVisible(not is_obs_ntrip)
+            if not is_obs_ntrip:
+                self._populate_ports('obs')
+            if self.grp_eph is not None:
+                is_eph_ntrip = self.eph_source.currentText() == "NTRIP Server"
+                self.eph_ntrip_box.setVisible(is_eph_ntrip)
+                self.eph_serial_box.setVisible(not is_eph_ntrip)
+                if not is_eph_ntrip:
+                    self._populate_ports('eph')
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_eph_group(self):
+        """
+        Build the EPH stream form (NTRIP and serial fields) and its eph_* widgets.
+
+        Returns:
+            The EPH QGroupBox.
+        """
+        grp_eph = QGroupBox("Ephemeris Stream (EPH)")
+        fl_eph = self._build_stream_form('eph', self.settings.get('EPH', {}), 'COM2')
+        
+        grp_eph.setLayout(fl_eph)
+        return grp_eph
+
+    def reload(self, initial_settings=None):
+        """
+        Reset the form to initial_settings so the dialog can be reopened without rebuilding it.
+
+        Args:
+            initial_settings: Legacy settings dictionary, as passed to __init__
+        """
+        self.settings = initial_settings or {}
+        self.auto_connect = False
+        obs = self.settings.get('OBS', {})
+        eph = self.settings.get('EPH', {})
+
+        # Serial ports may have been plugged or unplugged since the last open:
+        # port combos are refilled when next needed
+        self._ports_cache = None
+        self.obs_port.clear()
+        self._port_selection['obs'] = str(obs.get('port', 'COM1'))
+
+        self.obs_source.setCurrentText(obs.get('source', 'NTRIP Server'))
+        self.obs_h.setText(obs.get('host', ''))
+        self.obs_p.setText(str(obs.get('port', '2101')))
+        self.obs_m.setText(obs.get('mountpoint', ''))
+        self.obs_u.setText(obs.get('user', ''))
+        self.obs_pw.setText(obs.get('password', ''))
+        if self.obs_source.currentText() != "NTRIP Server":
+            self._populate_ports('obs')
+        self.obs_baudrate.setValue(int(obs.get('baudrate', 115200)))
+
+        # An unbuilt EPH form reads self.settings when first enabled
+        if self.grp_eph is not None:
+            self.eph_port.clear()
+            self._port_selection['eph'] = str(eph.get('port', 'COM2'))
+            self.eph_source.setCurrentText(eph.get('source', 'NTRIP Server'))
+            self.eph_h.setText(eph.get('host', ''))
+            self.eph_p.setText(str(eph.get('port', '2101')))
+            self.eph_m.setText(eph.get('mountpoint', ''))
+            self.eph_u.setText(eph.get('user', ''))
+            self.eph_pw.setText(eph.get('password', ''))
+            if self.eph_source.currentText() != "NTRIP Server":
+                self._populate_ports('eph')
+            self.eph_baudrate.setValue(int(eph.get('baudrate', 115200)))
+        self.chk_eph.setChecked(self.settings.get('EPH_ENABLED', False))
+
+        pos = self.settings.get('APPROX_REC_POS', [0, 0, 0])
+        self.rec_pos_x.setText(str(pos[0]))
+        self.rec_pos_y.setText(str(pos[1]))
+        self.rec_pos_z.setText(str(pos[2]))
+        self.target_systems.setText(",".join(self.settings.get('TARGET_SYSTEMS', ['G', 'R', 'E', 'C'])))
 
     def _set_size_policy_for_widgets(self, widgets):
         """Helper function to set expanding size policy for widgets"""
         for widget in widgets:
             widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
+    def _build_stream_form(self, prefix, cfg, default_serial_port):
+        """
+        Build the source selector, NTRIP fields and serial fields of one stream.
+
+        Widgets are stored on self as {prefix}_source, {prefix}_h/_p/_m/_u/_pw,
+        {prefix}_port, {prefix}_baudrate and the {prefix}_ntrip_box /
+        {prefix}_serial_box containers toggled by on_{prefix}_source_changed.
+
+        Args:
+            prefix: 'obs' or 'eph'
+            cfg: Legacy settings dictionary of the stream
+            default_serial_port: Serial port selected when cfg has none
+
+        Returns:
+            The stream's QFormLayout.
+        """
+        fl = QFormLayout()
+        fl.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
+        fl.setRowWrapPolicy(QFormLayout.DontWrapRows)
+        fl.setFormAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        fl.setLabelAlignment(Qt.AlignLeft)
+        
+        # Data source type selector
+        source = QComboBox()
+        source.addItems(["NTRIP Server", "Serial Port"])
+        source.setCurrentText(cfg.get('source', 'NTRIP Server'))
+        source.currentTextChanged.connect(getattr(self, f'on_{prefix}_source_changed'))
+        setattr(self, f'{prefix}_source', source)
+        fl.addRow("Data Source:", source)
+        
+        # NTRIP fields
+        ntrip_rows = []
+        # (widget suffix, settings key, default, placeholder, label text)
+        for suffix, key, default, placeholder, text in (
+            ('h', 'host', '', "Hostname or IP", "Host:"),
+            ('p', 'port', '2101', '', "Port:"),
+            ('m', 'mountpoint', '', '', "Mountpoint:"),
+            ('u', 'user', '', "Optional", "User:"),
+            ('pw', 'password', '', "Optional", "Password:"),
+        ):
+            edit = self._line_edit(cfg.get(key, default), placeholder)
+            setattr(self, f'{prefix}_{suffix}', edit)
+            ntrip_rows.append((text, edit))
+        getattr(self, f'{prefix}_pw').setEchoMode(QLineEdit.EchoMode.Password)
+        self._set_size_policy_for_widgets([edit for _, edit in ntrip_rows])
+        
+        # NTRIP rows live in one container so a source switch is a single setVisible
+        ntrip_box = self._form_box(ntrip_rows)
+        setattr(self, f'{prefix}_ntrip_box', ntrip_box)
+        fl.addRow(ntrip_box)
+        
+        # Serial port fields
+        # (filled by _populate_ports once the serial source is selected)
+        port = QComboBox()
+        self._port_selection[prefix] = str(cfg.get('port', default_serial_port))
+        
+        baudrate = QSpinBox()
+        baudrate.setMinimum(300)
+        baudrate.setMaximum(921600)
+        with QSignalBlocker(baudrate):  # Initial value, nothing to notify
+            baudrate.setValue(int(cfg.get('baudrate', 115200)))
+        
+        setattr(self, f'{prefix}_port', port)
+        setattr(self, f'{prefix}_baudrate', baudrate)
+        self._set_size_policy_for_widgets([port, baudrate])
+        
+        serial_box = self._form_box([("Serial Port:", port), ("Baud Rate:", baudrate)])
+        setattr(self, f'{prefix}_serial_box', serial_box)
+        fl.addRow(serial_box)
+        return fl
+
+    def _line_edit(self, value, placeholder=''):
+        """Create a QLineEdit holding value; empty values set no text and only show the placeholder"""
+        edit = QLineEdit()
+        if placeholder:
+            edit.setPlaceholderText(placeholder)
+        if value not in (None, ''):
+            edit.setText(str(value))
+        return edit
+
+    def _form_box(self, rows):
+        """Return a widget laying out (label text, field) rows as a form, shown or hidden as one unit"""
+        box = QWidget()
+        fl = QFormLayout(box)
+        fl.setContentsMargins(0, 0, 0, 0)
+        fl.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
+        fl.setRowWrapPolicy(QFormLayout.DontWrapRows)
+        fl.setLabelAlignment(Qt.AlignLeft)
+        for label, field in rows:
+            fl.addRow(label, field)
+        return box
+
+    @Slot()
     def on_obs_source_changed(self):
         """Update OBS field visibility based on source type"""
         is_ntrip = self.obs_source.currentText() == "NTRIP Server"
-        
-        self.lbl_obs_host.setVisible(is_ntrip)
-        self.obs_h.setVisible(is_ntrip)
-        self.lbl_obs_port.setVisible(is_ntrip)
-        self.obs_p.setVisible(is_ntrip)
-        self.lbl_obs_mount.setVisible(is_ntrip)
-        self.obs_m.setVisible(is_ntrip)
-        self.lbl_obs_user.setVisible(is_ntrip)
-        self.obs_u.setVisible(is_ntrip)
-        self.lbl_obs_pw.setVisible(is_ntrip)
-        self.obs_pw.setVisible(is_ntrip)
-        
-        self.lbl_obs_serial_port.setVisible(not is_ntrip)
-        self.obs_port.setVisible(not is_ntrip)
-        self.lbl_obs_baudrate.setVisible(not is_ntrip)
-        self.obs_baudrate.setVisible(not is_ntrip)
+        self.obs_ntrip_box.setVisible(is_ntrip)
+        self.obs_serial_box.setVisible(not is_ntrip)
+        if not is_ntrip:
+            self._populate_ports('obs')
 
+    @Slot()
     def on_eph_enabled_changed(self):
-        """Update EPH group visibility based on enable checkbox"""
+        """Update EPH group state based on enable checkbox, building it on first enable"""
+        if self.grp_eph is None:
+            if not self.chk_eph.isChecked():
+                return
+            self.grp_eph = self._build_eph_group()
+            self._scroll_layout.replaceWidget(self._eph_placeholder, self.grp_eph)
+            self._eph_placeholder.deleteLater()
+            self._eph_placeholder = None
+            if self._visibility_applied:
+                self.on_eph_source_changed()
         self.grp_eph.setEnabled(self.chk_eph.isChecked())
 
+    @Slot()
     def on_eph_source_changed(self):
         """Update EPH field visibility based on source type"""
         is_ntrip = self.eph_source.currentText() == "NTRIP Server"
-        
-        self.lbl_eph_host.setVisible(is_ntrip)
-        self.eph_h.setVisible(is_ntrip)
-        self.lbl_eph_port.setVisible(is_ntrip)
-        self.eph_p.setVisible(is_ntrip)
-        self.lbl_eph_mount.setVisible(is_ntrip)
-        self.eph_m.setVisible(is_ntrip)
-        self.lbl_eph_user.setVisible(is_ntrip)
-        self.eph_u.setVisible(is_ntrip)
-        self.lbl_eph_pw.setVisible(is_ntrip)
-        self.eph_pw.setVisible(is_ntrip)
-        
-        self.lbl_eph_serial_port.setVisible(not is_ntrip)
-        self.eph_port.setVisible(not is_ntrip)
-        self.lbl_eph_baudrate.setVisible(not is_ntrip)
-        self.eph_baudrate.setVisible(not is_ntrip)
+        self.eph_ntrip_box.setVisible(is_ntrip)
+        self.eph_serial_box.setVisible(not is_ntrip)
+        if not is_ntrip:
+            self._populate_ports('eph')
+
+    def _populate_ports(self, prefix):
+        """Fill the serial port combo of a stream on first use and select its saved port"""
+        selection = self._port_selection.pop(prefix, None)
+        if selection is None:
+            return
+        combo = getattr(self, f'{prefix}_port')
+        combo.addItems(self._get_available_ports() or ["No ports found"])
+        combo.setCurrentText(selection)
 
     def _get_available_ports(self):
-        """Get list of available serial ports"""
-        try:
-            import serial.tools.list_ports
-            return [port.device for port in serial.tools.list_ports.comports()]
-        except:
-            return ["COM1", "COM2", "COM3"]
+        """
+        Get list of available serial ports.
+
+        Scanned once per dialog. A shared list from a recent (or background
+        prefetch) scan is reused; when it is older than _PORTS_TTL it is still
+        shown immediately and refreshed by a background scan.
+        """
+        if self._ports_cache is None:
+            shared = ConfigDialog._ports_shared
+            if shared is None:
+                # Nothing prefetched yet: scan synchronously
+                self._ports_cache = _scan_ports()
+                ConfigDialog._ports_shared = (time.monotonic(), self._ports_cache)
+            else:
+                self._ports_cache = shared[1]
+                if time.monotonic() - shared[0] >= _PORTS_TTL:
+                    _get_port_scanner().scan()
+        return self._ports_cache
 
+    def _rescan_ports(self):
+        """Periodic background rescan, only once a port combo has been filled"""
+        if self._ports_cache is not None:
+            _get_port_scanner().scan()
+
+    @Slot(object)
+    def _on_ports_scanned(self, ports):
+        """Refresh the filled port combos with a background scan result, keeping selections"""
+        self._ports_cache = ports
+        items = ports or ["No ports found"]
+        for prefix in ('obs', 'eph'):
+            combo = getattr(self, f'{prefix}_port', None)
+            # Skip forms not built yet and combos still waiting for _populate_ports
+            if combo is None or prefix in self._port_selection:
+                continue
+            if [combo.itemText(i) for i in range(combo.count())] == items:
+                continue
+            current = combo.currentText()
+            with QSignalBlocker(combo):
+                combo.clear()
+                combo.addItems(items)
+                combo.setCurrentText(current)
+
+    @Slot()
     def on_connect(self):
         """User pressed Connect: mark auto_connect and accept dialog."""
         self.auto_connect = True
@@ -301,36 +523,33 @@ class ConfigDialog(QDialog):
         f, _ = QFileDialog.getOpenFileName(self, "Select Config", "", "Python (*.py)")
         if f:
             try:
-                spec = importlib.util.spec_from_file_location("cfg", f)
-                m = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(m)
+                values = _read_config_constants(f)
                 
-                # Load OBS settings
-                if hasattr(m, 'NTRIP_HOST'): self.obs_h.setText(str(m.NTRIP_HOST))
-                if hasattr(m, 'NTRIP_PORT'): self.obs_p.setText(str(m.NTRIP_PORT))
-                if hasattr(m, 'MOUNTPOINT'): self.obs_m.setText(str(m.MOUNTPOINT))
-                if hasattr(m, 'USER'): self.obs_u.setText(str(m.USER))
-                if hasattr(m, 'PASSWORD'): self.obs_pw.setText(str(m.PASSWORD))
+                # Load OBS settings (each constant is optional)
+                for attr, field in self._OBS_LOAD_MAP:
+                    value = values.get(attr)
+                    if value is not None:
+                        getattr(self, field).setText(str(value))
                 
-                # Load EPH settings
-                if hasattr(m, 'EPH_HOST'): 
+                # Load EPH settings (all constants required once EPH_HOST is set)
+                if 'EPH_HOST' in values: 
+                    missing = [attr for attr, _ in self._EPH_LOAD_MAP if attr not in values]
+                    if missing:
+                        raise ValueError(f"Missing EPH settings: {', '.join(missing)}")
                     self.chk_eph.setChecked(True)
-                    self.eph_h.setText(str(m.EPH_HOST))
-                    self.eph_p.setText(str(m.EPH_PORT))
-                    self.eph_m.setText(str(m.EPH_MOUNTPOINT))
-                    self.eph_u.setText(str(m.EPH_USER))
-                    self.eph_pw.setText(str(m.EPH_PASSWORD))
+                    for attr, field in self._EPH_LOAD_MAP:
+                        getattr(self, field).setText(str(values[attr]))
                     
                 # Load general settings
-                if hasattr(m, 'APPROX_REC_POS'):
-                    pos = m.APPROX_REC_POS
+                if 'APPROX_REC_POS' in values:
+                    pos = values['APPROX_REC_POS']
                     if len(pos) >= 3:
                         self.rec_pos_x.setText(str(pos[0]))
                         self.rec_pos_y.setText(str(pos[1]))
                         self.rec_pos_z.setText(str(pos[2]))
                         
-                if hasattr(m, 'TARGET_SYSTEMS'):
-                    systems = m.TARGET_SYSTEMS
+                if 'TARGET_SYSTEMS' in values:
+                    systems = values['TARGET_SYSTEMS']
                     if isinstance(systems, list):
                         systems_str = ','.join(systems)
                         self.target_systems.setText(systems_str)
@@ -346,10 +565,11 @@ class ConfigDialog(QDialog):
         
         # Update OBS settings
         obs_source_type = self.obs_source.currentText()
+        obs_port = self.obs_p.text() if obs_source_type == "NTRIP Server" else self.obs_port.currentText()
         obs_settings = {
             'source_type': obs_source_type,
             'host': self.obs_h.text(),
-            'port': self.obs_p.text() if obs_source_type == "NTRIP Server" else self.obs_port.currentText(),
+            'port': obs_port,
             'serial_port': self.obs_port.currentText(),
             'baudrate': self.obs_baudrate.value(),
             'mountpoint': self.obs_m.text(),
@@ -411,22 +631,29 @@ class ConfigDialog(QDialog):
             'OBS': {
                 'source': obs_source_type,
                 'host': self.obs_h.text(),
-                'port': self.obs_p.text() if obs_source_type == "NTRIP Server" else self.obs_port.currentText(),
+                'port': obs_port,
                 'baudrate': self.obs_baudrate.value(),
                 'mountpoint': self.obs_m.text(),
                 'user': self.obs_u.text(),
                 'password': self.obs_pw.text()
             },
             'EPH_ENABLED': eph_enabled,
-            'EPH': {
-                'source': self.eph_source.currentText(),
-                'host': self.eph_h.text(),
-                'port': self.eph_p.text() if self.eph_source.currentText() == "NTRIP Server" else self.eph_port.currentText(),
-                'baudrate': self.eph_baudrate.value(),
-                'mountpoint': self.eph_m.text(),
-                'user': self.eph_u.text(),
-                'password': self.eph_pw.text()
-            },
+            'EPH': self._eph_legacy_settings(),
             'APPROX_REC_POS': [coord_x, coord_y, coord_z],
             'TARGET_SYSTEMS': target_systems
-        }
\ No newline at end of file
+        }
+
+    def _eph_legacy_settings(self):
+        """Return the legacy EPH settings, from the stored settings if the EPH form was never built"""
+        if self.grp_eph is None:
+            return dict(self.settings.get('EPH', {}))
+        eph_source_type = self.eph_source.currentText()
+        return {
+            'source': eph_source_type,
+            'host': self.eph_h.text(),
+            'port': self.eph_p.text() if eph_source_type == "NTRIP Server" else self.eph_port.currentText(),
+            'baudrate': self.eph_baudrate.value(),
+            'mountpoint': self.eph_m.text(),
+            'user': self.eph_u.text(),
+            'password': self.eph_pw.text()
+        }
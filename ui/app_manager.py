@@ -1,9 +1,10 @@
 # ui/app_manager.py
 from PySide6.QtWidgets import QApplication, QMainWindow
-from PySide6.QtCore import Signal, QObject
+from PySide6.QtCore import Signal, QObject, QTimer
 from PySide6.QtGui import QPalette, QColor, QFont
 
 from ui.launch_screen import LaunchScreen
+from ui.ConfigDialog import prefetch_serial_ports
 from ui.monitoring_module import MonitoringModule
 from ui.positioning_module import PositioningModule
 from ui.reflectometry_module import ReflectometryModule
@@ -27,6 +28,10 @@ class AppManager(QObject):
         self.current_module = None
         
         self.apply_global_style()
+        
+        # Enumerate serial ports in the background once the event loop runs,
+        # so the data source dialog opens with a warm port list
+        QTimer.singleShot(0, prefetch_serial_ports)
     
     def apply_global_style(self):
         """Apply global application style"""
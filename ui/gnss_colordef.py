@@ -1,3 +1,18 @@
+from functools import lru_cache
+
+
+# System colors, built once at import (get_sys_color is called per satellite)
+SYS_COLORS = {
+    'G': '#5E8C61', # GPS - 森林绿 
+    'R': '#B05E5E', # GLONASS - 铁锈红 
+    'E': '#5B84B1', # Galileo - 钢青色 
+    'C': '#8E77A4', # BeiDou - 灰紫色
+    'J': '#C48D4D', # QZSS - 赭石色
+    'S': '#7F8C8D'  # SBAS - 冷灰色
+}
+DEFAULT_SYS_COLOR = '#555555'
+
+
 def get_sys_color(sys_char):
     """
     Return a predefined color (hex string) based on satellite system identifier.
@@ -14,17 +29,10 @@ def get_sys_color(sys_char):
     str
         Hex color code associated with the satellite system.
     """
-    colors = {
-        'G': '#5E8C61', # GPS - 森林绿 
-        'R': '#B05E5E', # GLONASS - 铁锈红 
-        'E': '#5B84B1', # Galileo - 钢青色 
-        'C': '#8E77A4', # BeiDou - 灰紫色
-        'J': '#C48D4D', # QZSS - 赭石色
-        'S': '#7F8C8D'  # SBAS - 冷灰色
-    }
-    return colors.get(sys_char, '#555555')
+    return SYS_COLORS.get(sys_char, DEFAULT_SYS_COLOR)
 
 
+@lru_cache(maxsize=None)
 def get_signal_color(sig_code):
     """
     Determine display color for a GNSS signal based on its frequency band
@@ -51,6 +59,8 @@ def get_signal_color(sig_code):
     -------
     str
         Hex color code representing this signal type for visualization.
+        Results are memoized: the set of signal codes is small and the plots
+        look colors up per signal on every refresh.
     """
     code = str(sig_code).upper()
     band = '1'
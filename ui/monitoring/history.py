@@ -0,0 +1,170 @@
+"""
+Satellite history store for the SNR analysis plot.
+
+All satellites share dense 2-D ring buffers (one row per PRN, one column per
+sample), so a whole epoch is written with a few fancy-indexed NumPy
+assignments instead of per-satellite Python containers.
+
+Elevation and SNR are stored quantized as int16 (0.01 deg, 0.1 dB-Hz), well
+below what the analysis plot resolves, with INT16_MIN marking missing values.
+"""
+import numpy as np
+
+
+_MISSING = np.iinfo(np.int16).min
+_EL_SCALE = 100     # centidegrees
+_SNR_SCALE = 10     # 0.1 dB-Hz
+
+
+def _quantize(values, scale):
+    """Scale floats to int16 with rounding; NaN becomes _MISSING."""
+    arr = np.asarray(values, dtype='f8') * scale
+    out = np.rint(arr, out=arr)
+    out[np.isnan(out)] = _MISSING
+    return out.astype(np.int16)
+
+
+def _dequantize(values, scale):
+    """Convert quantized int16 values back to float32, _MISSING becoming NaN."""
+    out = values.astype(np.float32) / scale
+    out[values == _MISSING] = np.nan
+    return out
+
+
+class SatHistory:
+    """
+    Fixed-length per-PRN history of time, elevation and per-signal SNR.
+
+    Rows are assigned to PRNs on first sight and recycled when a PRN is
+    removed. Missing values (unknown elevation, signal not observed in an
+    epoch) are returned as NaN.
+    """
+
+    def __init__(self, length: int = 500, capacity: int = 64):
+        """
+        Args:
+            length: Samples kept per satellite
+            capacity: Initial number of PRN rows (grows on demand)
+        """
+        self.length = length
+        self._rows = {}     # {prn: row}
+        self._free = []     # Rows released by remove()
+        self._n_rows = 0    # Rows handed out so far (high-water mark)
+
+        self.t = np.empty((capacity, length), 'f8')     # Unix time
+        self.el = np.empty((capacity, length), 'i2')    # Elevation [0.01 deg]
+        self.head = np.zeros(capacity, 'i8')            # Total samples written per row
+        self.snr = {}                                   # {signal_code: (capacity, length) i2 [0.1 dB-Hz]}
+
+    def __contains__(self, prn):
+        return prn in self._rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def _row(self, prn):
+        """Return the row of prn, assigning one on first sight."""
+        row = self._rows.get(prn)
+        if row is not None:
+            return row
+
+        if self._free:
+            row = self._free.pop()
+        else:
+            row = self._n_rows
+            self._n_rows += 1
+            if row >= len(self.head):
+                self._grow()
+        self.head[row] = 0
+        self._rows[prn] = row
+        return row
+
+    def _grow(self):
+        """Double the row capacity of all buffers."""
+        extra = len(self.head)
+        self.t = np.concatenate((self.t, np.empty((extra, self.length), 'f8')))
+        self.el = np.concatenate((self.el, np.empty((extra, self.length), 'i2')))
+        self.head = np.concatenate((self.head, np.zeros(extra, 'i8')))
+        for code, arr in self.snr.items():
+            self.snr[code] = np.concatenate((arr, np.full((extra, self.length), _MISSING, 'i2')))
+
+    def append_epoch(self, t, prns, els, sig_sat, sig_codes, sig_snr):
+        """
+        Append one sample for every satellite of an epoch.
+
+        Args:
+            t: Unix timestamp of the epoch
+            prns: Satellite keys in this epoch
+            els: Elevations [deg] aligned with prns (NaN if unknown)
+            sig_sat: For each valid signal, the index of its satellite in prns
+            sig_codes: Signal codes aligned with sig_sat
+            sig_snr: SNR values aligned with sig_sat
+        """
+        if not prns:
+            return
+        rows = np.fromiter((self._row(p) for p in prns), dtype=np.intp, count=len(prns))
+        cols = self.head[rows] % self.length
+
+        self.t[rows, cols] = t
+        self.el[rows, cols] = _quantize(els, _EL_SCALE)
+
+        # Signals not observed this epoch read as missing
+        for arr in self.snr.values():
+            arr[rows, cols] = _MISSING
+
+        if sig_codes:
+            codes, inverse = np.unique(np.asarray(sig_codes), return_inverse=True)
+            sat_idx = np.asarray(sig_sat, dtype=np.intp)
+            vals = _quantize(sig_snr, _SNR_SCALE)
+            for k, code in enumerate(codes.tolist()):
+                arr = self.snr.get(code)
+                if arr is None:
+                    # Signal first seen: earlier samples have no value
+                    arr = self.snr[code] = np.full((len(self.head), self.length), _MISSING, 'i2')
+                sel = sat_idx[inverse == k]
+                arr[rows[sel], cols[sel]] = vals[inverse == k]
+
+        self.head[rows] += 1
+
+    def arrays(self, prn):
+        """
+        Return the PRN's history in chronological order.
+
+        Returns:
+            (times, els, snr): unix-time array, float32 elevation array and
+            {signal_code: float32 snr array}, all of equal length (empty if no
+            history), with NaN for missing values. snr only holds signals with
+            at least one sample in the window.
+        """
+        row = self._rows.get(prn)
+        if row is None:
+            return np.empty(0, 'f8'), np.empty(0, 'f4'), {}
+
+        head = int(self.head[row])
+        n = min(head, self.length)
+        if head <= self.length:
+            unwrap = lambda arr: arr[row, :head]
+        else:
+            idx = head % self.length
+            unwrap = lambda arr: np.concatenate((arr[row, idx:], arr[row, :idx]))
+        return (
+            unwrap(self.t),
+            _dequantize(unwrap(self.el), _EL_SCALE),
+            {
+                c: _dequantize(unwrap(a), _SNR_SCALE) for c, a in self.snr.items()
+                # Skip signals this PRN never had (checked on the raw int16 window)
+                if (a[row, :n] != _MISSING).any()
+            },
+        )
+
+    def remove(self, prn):
+        """Forget prn (if recorded) and recycle its row."""
+        row = self._rows.pop(prn, None)
+        if row is not None:
+            self._free.append(row)
+
+    def clear(self):
+        """Forget all satellites (buffers are kept for reuse)."""
+        self._rows.clear()
+        self._free.clear()
+        self._n_rows = 0
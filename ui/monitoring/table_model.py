@@ -0,0 +1,253 @@
+"""
+Table model for the Dashboard satellite observation tables.
+
+All rows (one per satellite signal) live in a single NumPy structured array
+owned by SatTableModel. The per-constellation sub-tables are QTableViews on
+QSortFilterProxyModels that filter the shared model by a per-system boolean mask,
+so a refresh is one model update instead of per-cell QTableWidgetItem churn.
+"""
+import numpy as np
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PySide6.QtGui import QColor, QFont, QBrush
+
+from core.fast_fmt import format_fixed
+
+
+# One row per (satellite, signal). 'color' is the alternating background index
+# of the satellite (0/1), so all signals of a satellite share one shade.
+SAT_ROW_DTYPE = np.dtype([
+    ('prn', 'U4'), ('sys', 'U3'), ('el', 'f4'), ('az', 'f4'), ('code', 'U4'),
+    ('snr', 'f4'), ('pr', 'f8'), ('ph', 'f8'), ('dop', 'f8'), ('color', 'u1'),
+])
+
+SAT_TABLE_HEADERS = [
+    "PRN", "Sys", "El(°)", "Az(°)", "Freq",
+    "SNR (dBHz)", "Pseudorange (m)", "Phase (cyc)", "Doppler (Hz)"
+]
+
+_SNR_COL = 5
+# Fields that can change for a persisting (prn, code) row; 'color' shifts when
+# satellites before the row appear or vanish
+_CHANGE_FIELDS = ('el', 'az', 'snr', 'pr', 'ph', 'dop', 'color')
+
+# Above this many inserted/removed row ranges a model reset is cheaper
+_MAX_ROW_RUNS = 8
+
+
+def _optional_column(values, decimals, width):
+    """Format a column as '%{width}.{decimals}f', leaving zero (unavailable) values empty."""
+    if not len(values):
+        return []
+    text = np.char.rjust(np.array(format_fixed(values, decimals)), width)
+    return np.where(values != 0, text, "").tolist()
+
+
+def _format_columns(arr):
+    """
+    Pre-format all display columns of a SAT_ROW_DTYPE array.
+
+    Numeric columns are formatted column-wise with format_fixed instead of
+    one f-string per cell per paint.
+
+    Returns:
+        List of per-column string lists, indexed [column][row].
+    """
+    return [
+        arr['prn'].tolist(),
+        arr['sys'].tolist(),
+        format_fixed(arr['el'], 1),
+        format_fixed(arr['az'], 1),
+        arr['code'].tolist(),
+        format_fixed(arr['snr'], 1),
+        _optional_column(arr['pr'], 3, 12),
+        _optional_column(arr['ph'], 3, 12),
+        format_fixed(arr['dop'], 3),
+    ]
+
+
+def _runs(mask):
+    """Return (start, stop) pairs of the contiguous True runs of a boolean array."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.view(np.int8), [0]))))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+
+def _row_keys(arr):
+    """Row identity strings (PRN + signal code) of a SAT_ROW_DTYPE array."""
+    return np.char.add(arr['prn'], arr['code'])
+
+
+def _snr_classes(snr):
+    """Map SNR values to brush indices: 0 (<30), 1 (30..40), 2 (>40)."""
+    return (snr >= 30).astype(np.intp) + (snr > 40)
+
+
+class SatTableModel(QAbstractTableModel):
+    """
+    Read-only model over a SAT_ROW_DTYPE structured array.
+
+    set_data() replaces the array incrementally: value-only updates emit
+    dataChanged for the runs of changed rows, and layout changes remove and
+    insert row ranges (a reset only when the layout changed wholesale), so
+    views and filter proxies keep their state for persisting rows.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._data = np.empty(0, dtype=SAT_ROW_DTYPE)
+        self._snr_class = np.empty(0, dtype=np.intp)
+        self._text = _format_columns(self._data)
+        self._sys_char = np.empty(0, dtype='U1')
+        self._masks = {}    # {systems: bool row mask}, rebuilt lazily per layout
+
+        # Formatting resources shared by all cells (no per-cell allocations)
+        self._bg_brushes = (QBrush(QColor("#ffffff")), QBrush(QColor("#b9b9b9")))
+        self._snr_font = QFont("Arial", 9, QFont.Weight.Bold)
+        # Indexed by _snr_classes(): poor (<30), normal, good (>40)
+        self._snr_brushes = (QBrush(QColor("red")), QBrush(QColor("black")), QBrush(QColor("green")))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._data)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(SAT_TABLE_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return SAT_TABLE_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._text[col][row]
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._bg_brushes[self._data['color'][row]]
+
+        if col == _SNR_COL:
+            # Color-code SNR: green (good >40), red (poor <30)
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._snr_brushes[self._snr_class[row]]
+            if role == Qt.ItemDataRole.FontRole:
+                return self._snr_font
+        return None
+
+    def _assign(self, arr):
+        """Install arr as the table contents and rebuild the derived columns."""
+        self._data = arr
+        self._snr_class = _snr_classes(arr['snr'])
+        self._text = _format_columns(arr)
+        self._sys_char = arr['prn'].astype('U1')
+        self._masks.clear()
+
+    def _emit_changed(self, rows):
+        """Emit dataChanged for each run of True rows."""
+        last_col = len(SAT_TABLE_HEADERS) - 1
+        for start, stop in _runs(rows):
+            self.dataChanged.emit(self.index(start, 0), self.index(stop - 1, last_col))
+
+    def set_data(self, arr):
+        """
+        Replace table contents.
+
+        Procedure:
+        1. Same (prn, code) layout: signal only the rows whose values changed
+        2. Otherwise remove vanished rows and insert new ones as grouped ranges,
+           then signal all rows (values and alternating shading may shift)
+        3. Reset the model when no row persists or the change is too fragmented
+
+        Args:
+            arr: Structured array with SAT_ROW_DTYPE, in display order
+        """
+        old = self._data
+        old_keys = _row_keys(old)
+        new_keys = _row_keys(arr)
+
+        # Step 1: Same rows, new values
+        if np.array_equal(old_keys, new_keys):
+            changed = np.zeros(len(arr), dtype=bool)
+            for field in _CHANGE_FIELDS:
+                changed |= arr[field] != old[field]
+            self._assign(arr)
+            self._emit_changed(changed)
+            return
+
+        # Step 2: Diff the layouts; persisting rows keep their relative order
+        removed = ~np.isin(old_keys, new_keys)
+        added = ~np.isin(new_keys, old_keys)
+        removed_runs = _runs(removed)
+        added_runs = _runs(added)
+
+        # Step 3: Wholesale change
+        if removed.all() or len(removed_runs) + len(added_runs) > _MAX_ROW_RUNS:
+            self.beginResetModel()
+            self._assign(arr)
+            self.endResetModel()
+            return
+
+        # Remove from the bottom up so earlier run positions stay valid
+        for start, stop in reversed(removed_runs):
+            self.beginRemoveRows(QModelIndex(), start, stop - 1)
+            self._assign(np.delete(self._data, np.s_[start:stop]))
+            self.endRemoveRows()
+
+        # Insert top down: rows before a run are then exactly arr[:start]
+        for start, stop in added_runs:
+            self.beginInsertRows(QModelIndex(), start, stop - 1)
+            self._assign(np.concatenate((arr[:stop], self._data[start:])))
+            self.endInsertRows()
+
+        self._assign(arr)
+        self._emit_changed(np.ones(len(arr), dtype=bool))
+
+    def system_mask(self, systems):
+        """
+        Return the boolean row mask of rows whose PRN system is in systems.
+
+        Computed with one vectorized comparison per row layout and cached, so
+        proxies filter by indexing instead of matching each row's PRN text.
+
+        Args:
+            systems: String of system letters, e.g. 'G' or 'GRE'
+        """
+        mask = self._masks.get(systems)
+        if mask is None:
+            mask = self._masks[systems] = np.isin(self._sys_char, list(systems))
+        return mask
+
+
+class _SystemFilterProxy(QSortFilterProxyModel):
+    """Proxy accepting rows by the source model's cached system mask."""
+
+    def __init__(self, systems, parent=None):
+        super().__init__(parent)
+        self._systems = ''.join(systems)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return bool(self.sourceModel().system_mask(self._systems)[source_row])
+
+
+def make_system_filter(model, systems, parent=None):
+    """
+    Create a proxy showing only rows whose PRN starts with one of systems.
+
+    Args:
+        model: Source SatTableModel
+        systems: Iterable of system letters, e.g. ['G'] or ['G', 'R', 'E']
+    """
+    proxy = _SystemFilterProxy(systems, parent)
+    proxy.setSourceModel(model)
+    # A row's PRN (hence its system) never changes in place: set_data adds and
+    # drops satellites through row inserts/removes (filtered as they arrive)
+    # or a reset, and emits dataChanged only for rows that keep their
+    # (prn, code) key. So don't re-run the filter on dataChanged updates
+    proxy.setDynamicSortFilter(False)
+    return proxy
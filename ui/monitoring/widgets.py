@@ -1,17 +1,30 @@
 # ui/widgets.py
 import numpy as np
+from datetime import datetime
 import matplotlib
 matplotlib.use('QtAgg')
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 from matplotlib.ticker import ScalarFormatter, MaxNLocator
-from collections import defaultdict
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QApplication
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 
 
-from ui.gnss_colordef import get_sys_color, get_signal_color
+from matplotlib.colors import to_rgba_array
+from ui.gnss_colordef import get_sys_color, get_signal_color, SYS_COLORS, DEFAULT_SYS_COLOR
+
+
+# Per-refresh satellite snapshot shared by the dashboard widgets (one row per PRN, sorted by PRN)
+SAT_SNAPSHOT_DTYPE = np.dtype([
+    ('prn', 'U4'), ('sys', 'U1'), ('el', 'f4'), ('az', 'f4'), ('n_sig', 'u1'), ('max_snr', 'f4'),
+])
+# Signals with SNR > 0, grouped by satellite (sat = row index into the snapshot) and sorted by code
+SIG_SNAPSHOT_DTYPE = np.dtype([('sat', 'i4'), ('code', 'U4'), ('snr', 'f4')])
+
+# matplotlib date number of the unix epoch: unix seconds map to date numbers
+# with one vectorized expression instead of per-sample datetime objects
+_UNIX_EPOCH_DATENUM = mdates.date2num(datetime(1970, 1, 1))
 
 class SkyplotWidget(FigureCanvas):
     def __init__(self, parent=None):
@@ -36,6 +49,10 @@ class SkyplotWidget(FigureCanvas):
         self.scatter_artists = []
         self.text_artists = []
 
+        # 系统颜色查找表（RGBA），最后一行为未知系统的默认颜色
+        self._sys_chars = np.array(list(SYS_COLORS.keys()))
+        self._sys_rgba = to_rgba_array(list(SYS_COLORS.values()) + [DEFAULT_SYS_COLOR])
+
     def init_plot(self):
         ax = self.ax
         ax.set_facecolor(self.theme['bg'])
@@ -69,48 +86,55 @@ class SkyplotWidget(FigureCanvas):
         ax.fill(np.linspace(0, 2*np.pi, 100), np.full(100, 90), 
                 color=self.theme['accent'], alpha=0.03)
 
-    def update_satellites(self, satellites, active_systems):
+    def update_satellites(self, sats, active_systems):
+        """
+        sats: SAT_SNAPSHOT_DTYPE 结构化数组
+        active_systems: 需要显示的系统字符集合
+        """
         while self.scatter_artists:
             self.scatter_artists.pop().remove()
         while self.text_artists:
             self.text_artists.pop().remove()
-            
-        satellites_snapshot = dict(satellites)
-        
-        for key, sat in satellites_snapshot.items():
-            sys_type = key[0]
-            if sys_type not in active_systems: continue
 
-            el = getattr(sat, "el", getattr(sat, "elevation", None))
-            az = getattr(sat, "az", getattr(sat, "azimuth", None))
-            
-            if el is not None and az is not None:
-                color = get_sys_color(sys_type)
-                
-                # 绘制卫星点：增加边缘颜色使其更有立体感
-                scatter = self.ax.scatter(
-                    np.radians(az), el, 
-                    c=color, s=120, 
-                    alpha=0.9, 
-                    edgecolors=self.theme['bg'], 
-                    linewidth=1.5,
-                    zorder=3
-                )
-                
-                # 卫星编号文字：放在圆点中心或略偏移
+        # 只显示启用的系统，且高度角/方位角已知的卫星
+        mask = np.isin(sats['sys'], list(active_systems)) & ~np.isnan(sats['el']) & ~np.isnan(sats['az'])
+        sats = sats[mask]
+
+        if len(sats):
+            theta = np.radians(sats['az'])
+            el = sats['el']
+            # 向量化查表：系统字符 -> RGBA
+            sys_idx = np.full(len(sats), len(self._sys_chars))
+            hit = sats['sys'][:, None] == self._sys_chars[None, :]
+            found = hit.any(axis=1)
+            sys_idx[found] = hit[found].argmax(axis=1)
+            colors = self._sys_rgba[sys_idx]
+
+            # 绘制卫星点（单次 scatter）：增加边缘颜色使其更有立体感
+            scatter = self.ax.scatter(
+                theta, el,
+                c=colors, s=120,
+                alpha=0.9,
+                edgecolors=self.theme['bg'],
+                linewidth=1.5,
+                zorder=3
+            )
+            self.scatter_artists.append(scatter)
+
+            # 卫星编号文字：放在圆点中心或略偏移
+            text_color = 'white' if self.theme['bg'] != "#FFFFFF" else 'black'
+            for key, t, e in zip(sats['prn'], theta, el):
                 text = self.ax.text(
-                    np.radians(az), el, key, 
-                    fontsize=7, 
-                    ha='center', va='center', 
+                    t, e, key,
+                    fontsize=7,
+                    ha='center', va='center',
                     fontweight='bold',
-                    color='white' if self.theme['bg'] != "#FFFFFF" else 'black',
+                    color=text_color,
                     clip_on=True,
                     zorder=4
                 )
-                
-                self.scatter_artists.append(scatter)
                 self.text_artists.append(text)
-        
+
         self.draw_idle()
 
 class MultiSignalBarWidget(FigureCanvas):
@@ -158,14 +182,18 @@ class MultiSignalBarWidget(FigureCanvas):
         
         ax.tick_params(colors=self.theme['muted'], labelsize=9)
 
-    def update_data(self, satellites, active_systems):
+    def update_data(self, sats, sigs, active_systems):
+        """
+        sats: SAT_SNAPSHOT_DTYPE 结构化数组
+        sigs: SIG_SNAPSHOT_DTYPE 结构化数组（按卫星分组、组内按信号排序）
+        active_systems: 需要显示的系统字符集合
+        """
         self.ax.clear()
         self.init_plot() # 重新初始化背景和设置
         self.bar_artists.clear()
         
-        satellites_snapshot = dict(satellites)
-        valid_sats = {k: v for k, v in satellites_snapshot.items() if k[0] in active_systems}
-        sorted_keys = sorted(valid_sats.keys())
+        valid = np.isin(sats['sys'], list(active_systems))
+        sorted_keys = sats['prn'][valid].tolist()
         
         if not sorted_keys:
             self.ax.text(0.5, 0.5, "Waiting for GNSS data...", 
@@ -178,15 +206,9 @@ class MultiSignalBarWidget(FigureCanvas):
         num_sats = len(sorted_keys)
         x_indices = np.arange(num_sats)
         
-        # 收集数据
-        sig_plot_data = defaultdict(list)
-        all_signals = set()
-        
         # 找出每个卫星拥有的最大信号数量，以确定基础柱宽
-        max_sigs_in_any_sat = 1
-        for sat in valid_sats.values():
-            valid_count = len([c for c, s in sat.signals.items() if getattr(s, 'snr', 0) > 0])
-            max_sigs_in_any_sat = max(max_sigs_in_any_sat, valid_count)
+        n_sigs = sats['n_sig'].astype(np.int64)
+        max_sigs_in_any_sat = max(1, int(n_sigs[valid].max()))
 
         # 计算柱宽：保证在卫星很多时，柱子依然有最小宽度
         # 0.8 是组间距比例，max_sigs 决定组内细分
@@ -195,30 +217,28 @@ class MultiSignalBarWidget(FigureCanvas):
         # 限制最小宽度，防止卫星过多时看不见
         bar_width = max(bar_width, 0.05) 
 
-        # 2. 分配位置
-        for i, k in enumerate(sorted_keys):
-            sat = valid_sats[k]
-            # 获取 SNR > 0 的有效信号
-            sigs = {c: s.snr for c, s in sat.signals.items() if getattr(s, 'snr', 0) > 0}
-            sorted_codes = sorted(sigs.keys())
-            
-            n_sigs = len(sorted_codes)
-            # 计算该组信号的起始偏移位置，使其居中对齐刻度
-            start_offset = - (n_sigs * bar_width) / 2 + (bar_width / 2)
-            
-            for j, code in enumerate(sorted_codes):
-                offset = start_offset + j * bar_width
-                sig_plot_data[code].append((i + offset, sigs[code]))
-                all_signals.add(code)
+        # 2. 分配位置（向量化）
+        # 卫星在图中的序号 i（只对启用系统计数）
+        slot = np.cumsum(valid) - 1
+        sigs = sigs[valid[sigs['sat']]]
+        sat_idx = sigs['sat']
+        # 信号在本卫星内的序号 j
+        first = np.searchsorted(sat_idx, sat_idx, side='left')
+        j = np.arange(len(sigs)) - first
+        n = n_sigs[sat_idx]
+        # 计算该组信号的起始偏移位置，使其居中对齐刻度
+        start_offset = - (n * bar_width) / 2 + (bar_width / 2)
+        x_all = slot[sat_idx] + start_offset + j * bar_width
+        codes = sigs['code']
 
         # 3. 绘制
-        sorted_all_signals = sorted(list(all_signals))
+        sorted_all_signals = np.unique(codes).tolist()
         legend_handles = []
         
         for code in sorted_all_signals:
-            points = sig_plot_data[code]
-            x_vals = [p[0] for p in points]
-            y_vals = [p[1] for p in points]
+            sel = codes == code
+            x_vals = x_all[sel]
+            y_vals = sigs['snr'][sel]
             
             color = get_signal_color(code)
             
@@ -284,109 +304,106 @@ class PlotSNRWidget(QWidget):
         # 设置策略，让画布尽可能扩展
         self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-    def update_plot(self, prn, data, mode, signal: str = None):
+        # 网格只设置一次
+        self.ax.grid(True, linestyle=':', alpha=0.6)
+        self.ax.set_ylabel("SNR (dB-Hz)")
+
+        # 复用的绘图对象：每个信号一条 Line2D，刷新时只调用 set_data
+        self._lines = {}          # {signal_code: Line2D}
+        self._axis_mode = None    # 当前 X 轴格式对应的模式
+        self._legend_key = None   # 当前图例对应的信号列表
+
+    def update_plot(self, prn, times, els, snr, mode, signal: str = None):
         """
         mode: "Time Sequence", "Elevation", "sin(Elevation)"
-        优化：只更新数据，不重建坐标轴
+        times: unix 时间戳数组；els: 高度角数组（NaN 表示未知）
+        snr: {signal_code: SNR 数组}，与 times 等长，NaN 表示该历元无观测
+        优化：复用每个信号的曲线对象，只更新数据，不重建坐标轴和图例
         """
-        # 删除旧的绘图对象
-        for line in self.ax.lines:
-            line.remove()
-        for collection in self.ax.collections:
-            collection.remove()
-        
-        if not data:
-            self.canvas.draw_idle()
-            return
-
-        # --- 数据预处理：过滤高度角 <= 0 的数据 ---
-        # 如果是高度角相关模式，我们通常不看地平线以下的数据
-        valid_data = []
-        for d in data:
-            # 如果模式是高度角相关，且高度角为 None、0 或负，则跳过
-            if ("Elevation" in mode or "sin" in mode):
-                el = d.get('el')
-                if el is None or el <= 0:
-                    continue
-            valid_data.append(d)
-        
-        # 如果过滤完没数据了，直接返回
-        if not valid_data:
+        if len(times) and ("Elevation" in mode or "sin" in mode):
+            # --- 数据预处理：过滤高度角 <= 0 的数据 ---
+            # 高度角相关模式不看地平线以下的数据（NaN 比较结果为 False，同样被过滤）
+            mask = els > 0
+            times = times[mask]
+            els = els[mask]
+            snr = {c: v[mask] for c, v in snr.items()}
+
+        # 没有数据：隐藏所有曲线后直接返回
+        if len(times) == 0:
+            for line in self._lines.values():
+                line.set_visible(False)
             self.canvas.draw_idle()
             return
 
         # 提取所有出现的信号（可选按单个 signal 过滤）
-        all_sigs = set()
-        for d in valid_data:
-            all_sigs.update(d['snr'].keys())
-        sorted_sigs = sorted(all_sigs)
+        sorted_sigs = sorted(c for c, v in snr.items() if not np.all(np.isnan(v)))
         if signal and signal != "All":
             # 如果所选 signal 不在出现的集合中，仍然保留但会导致无点绘制
             sorted_sigs = [signal]
 
-        # 提取基础列表
-        times = [d['time'] for d in valid_data]
-        els = [d['el'] for d in valid_data] # 角度制
+        # --- X 轴数据 ---
+        if "Time" in mode:
+            # 时间轴：unix 时间 -> 本地时间的 matplotlib 日期数（与 datetime.now() 显示一致）
+            utc_offset = datetime.fromtimestamp(times[-1]).astimezone().utcoffset().total_seconds()
+            x_vals = (times + utc_offset) / 86400.0 + _UNIX_EPOCH_DATENUM
+        elif "sin" in mode:
+            x_vals = np.sin(np.radians(els))
+        else:
+            x_vals = els
+
+        # --- 绘图逻辑：复用每个信号的 Line2D，只更新数据（不重建绘图对象）---
+        shown = set(sorted_sigs)
+        for sig, line in self._lines.items():
+            if sig not in shown:
+                line.set_visible(False)
 
-        # --- 绘图逻辑 ---
-        plotted_any = False
         all_y_vals = []
+        empty = np.full(len(times), np.nan)
+        alpha = 1.0 if "Time" in mode else 0.8
         for sig in sorted_sigs:
-            vals = [d['snr'].get(sig, np.nan) for d in valid_data]
+            vals = snr.get(sig, empty)
             # 收集用于 autoscale 的 y 值（去掉 nan）
-            clean_vals = [v for v in vals if v is not None and not (isinstance(v, float) and np.isnan(v))]
-            if clean_vals:
-                all_y_vals.extend(clean_vals)
-                plotted_any = True
-            color = get_signal_color(sig) # 确保你有引入这个函数
-
+            clean_vals = vals[~np.isnan(vals)]
+            if clean_vals.size:
+                all_y_vals.append(clean_vals)
+
+            line = self._lines.get(sig)
+            if line is None:
+                line, = self.ax.plot([], [], '.-', markersize=3, label=sig,
+                                     color=get_signal_color(sig), linewidth=1)
+                self._lines[sig] = line
+            line.set_data(x_vals, vals)
+            line.set_alpha(alpha)
+            line.set_visible(True)
+        plotted_any = bool(all_y_vals)
+        if plotted_any:
+            all_y_vals = np.concatenate(all_y_vals)
+
+        # --- 更新 X 轴格式（仅在模式切换时）---
+        if mode != self._axis_mode:
+            self._axis_mode = mode
             if "Time" in mode:
-                self.ax.plot(times, vals, '.-', markersize=3, label=sig, color=color, linewidth=1)
-
-            elif "sin" in mode:
-                x_vals = np.sin(np.radians(els))
-                self.ax.plot(x_vals, vals, '.-', markersize=3, label=sig, color=color, linewidth=1, alpha=0.8)
-
+                # Use date formatter and auto locator for time axis
+                self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+                self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+                try:
+                    self.ax.xaxis_date(True)
+                except Exception:
+                    pass
+                self.ax.set_xlabel("Time")
             else:
-                # Elevation mode: draw line+points for readability
-                self.ax.plot(els, vals, '.-', markersize=3, label=sig, color=color, linewidth=1, alpha=0.8)
-
-        # --- 更新 X 轴格式（不重建）---
-        if "Time" in mode:
-            # Use date formatter and auto locator for time axis
-            self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-            self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-            try:
-                self.ax.xaxis_date(True)
-            except Exception:
-                pass
-            self.ax.set_xlabel("Time")
-
-        elif "sin" in mode:
-            # Numeric axis for sin(Elevation)
-            self.ax.xaxis.set_major_formatter(ScalarFormatter())
-            self.ax.xaxis.set_major_locator(MaxNLocator(nbins=6))
-            try:
-                self.ax.xaxis_date(False)
-            except Exception:
-                pass
-            self.ax.set_xlabel("sin(Elevation)")
-
-        else:
-            # Elevation numeric axis
-            self.ax.xaxis.set_major_formatter(ScalarFormatter())
-            self.ax.xaxis.set_major_locator(MaxNLocator(nbins=6))
-            try:
-                self.ax.xaxis_date(False)
-            except Exception:
-                pass
-            self.ax.set_xlabel("Elevation (°)")
-        # --- 更新通用属性（不重建）---
-        self.ax.set_ylabel("SNR (dB-Hz)")
+                # Numeric axis for Elevation / sin(Elevation)
+                self.ax.xaxis.set_major_formatter(ScalarFormatter())
+                self.ax.xaxis.set_major_locator(MaxNLocator(nbins=6))
+                try:
+                    self.ax.xaxis_date(False)
+                except Exception:
+                    pass
+                self.ax.set_xlabel("sin(Elevation)" if "sin" in mode else "Elevation (°)")
 
         # Autoscale Y based on plotted data (with small padding)
         try:
-            if plotted_any and all_y_vals:
+            if plotted_any:
                 y_min = float(np.min(all_y_vals))
                 y_max = float(np.max(all_y_vals))
                 if y_min == y_max:
@@ -403,43 +420,33 @@ class PlotSNRWidget(QWidget):
 
         # Autoscale X depending on mode
         try:
-            if "Time" in mode and times:
+            if "Time" in mode and len(x_vals) == 1:
                 # If only a single time point, expand a little around it
-                if len(times) == 1:
-                    t = mdates.date2num(times[0])
-                    delta = 1.0 / (24*60*60) * 5  # 5 seconds
-                    self.ax.set_xlim(t - delta, t + delta)
-                else:
-                    self.ax.set_xlim(mdates.date2num(times[0]), mdates.date2num(times[-1]))
-            elif ("sin" in mode) and els:
-                x_vals = np.sin(np.radians(els))
-                xmin, xmax = np.min(x_vals), np.max(x_vals)
-                if xmin == xmax:
-                    self.ax.set_xlim(xmin - 0.01, xmax + 0.01)
-                else:
-                    self.ax.set_xlim(xmin, xmax)
-            elif els:
-                xmin, xmax = np.min(els), np.max(els)
+                t = x_vals[0]
+                delta = 1.0 / (24*60*60) * 5  # 5 seconds
+                self.ax.set_xlim(t - delta, t + delta)
+            else:
+                xmin, xmax = np.nanmin(x_vals), np.nanmax(x_vals)
                 if xmin == xmax:
-                    self.ax.set_xlim(xmin - 1.0, xmax + 1.0)
+                    pad = 0.01 if "sin" in mode else 1.0
+                    self.ax.set_xlim(xmin - pad, xmax + pad)
                 else:
                     self.ax.set_xlim(xmin, xmax)
         except Exception:
             pass
 
         self.ax.set_title(f"Satellite: {prn}", y=1.12, fontsize=10, fontweight='bold')
-        
-        # 网格只设置一次，不需要每次更新
-        if not hasattr(self, '_grid_initialized'):
-            self.ax.grid(True, linestyle=':', alpha=0.6)
-            self._grid_initialized = True
 
-        # 更新图例
-        if self.ax.legend_:
-            self.ax.legend_.remove()
-        self.ax.legend(loc='lower center', bbox_to_anchor=(0.5, 1.02), 
-                       ncol=6, fontsize='small', frameon=False)
-        
+        # 更新图例（仅在显示的信号集合变化时重建）
+        legend_key = tuple(sorted_sigs)
+        if legend_key != self._legend_key:
+            self._legend_key = legend_key
+            if self.ax.legend_:
+                self.ax.legend_.remove()
+            self.ax.legend(handles=[self._lines[s] for s in sorted_sigs],
+                           loc='lower center', bbox_to_anchor=(0.5, 1.02),
+                           ncol=6, fontsize='small', frameon=False)
+
         # 性能优化：使用draw_idle而不是draw，更高效
         self.canvas.draw_idle()
 
@@ -511,25 +518,18 @@ class SatelliteNumWidget(FigureCanvas):
         
         self.fig.tight_layout()
         
-    def update_data(self, satellites_dict, active_systems):
+    def update_data(self, sats, active_systems):
         """
         更新统计数据
         
         Args:
-            satellites_dict: {PRN: SatData, ...}
+            sats: SAT_SNAPSHOT_DTYPE 结构化数组
             active_systems: set of active system chars {'G', 'R', 'E', ...}
         """
         from datetime import datetime
         
         # 统计各系统卫星数
-        sys_counts = {sys: 0 for sys in self.systems.keys()}
-        total_count = 0
-        
-        for prn, sat in satellites_dict.items():
-            sys_char = prn[0]
-            if sys_char in sys_counts:
-                sys_counts[sys_char] += 1
-                total_count += 1
+        sys_counts = {sys: int(np.count_nonzero(sats['sys'] == sys)) for sys in self.systems.keys()}
         
         # 添加时间点到历史
         current_time = datetime.now()
@@ -5,6 +5,7 @@ This module implements the multi-threaded architecture for GNSS real-time monito
   - IOThread: Receives raw RTCM messages from NTRIP server
   - DataProcessingThread: Parses RTCM messages and extracts satellite observations
   - LoggingThread: Records raw RTCM or formatted observations to files
+    (raw RTCM file writes are offloaded to a RtcmWriterProcess subprocess)
   - StreamSignals: Qt signals for inter-thread communication
 
 Architecture follows a producer-consumer pattern with ring buffers for efficient,
@@ -17,6 +18,7 @@ import time
 import os
 import sys
 import csv
+import operator
 from queue import Queue
 from PySide6.QtCore import QObject, Signal
 from pyrtcm import RTCMReader
@@ -25,6 +27,12 @@ from core.global_config import get_global_config
 from core.ntrip_client import NtripClient
 from core.serial_client import SerialClient
 from core.ring_buffer import RingBuffer
+from core.rtcm_writer import RtcmWriterProcess
+from core.fast_fmt import format_fixed
+
+
+# Short system names written to the Sys column of text logs
+_SYS_NAMES = {'G': 'GPS', 'R': 'GLO', 'E': 'GAL', 'C': 'BDS', 'J': 'QZS', 'S': 'SBS'}
 
 
 class StreamSignals(QObject):
@@ -35,10 +43,12 @@ class StreamSignals(QObject):
         log_signal (Signal[str]): Emitted when log messages are generated (status updates, errors).
         epoch_signal (Signal[object]): Emitted when a complete epoch of observations is available (carries EpochObservation).
         status_signal (Signal[str, bool]): Emitted when stream connection status changes (thread_name, connected).
+        epochs_ready (Signal[]): Emitted when an epoch ring becomes non-empty (consumer should drain it).
     """
     log_signal = Signal(str)
     epoch_signal = Signal(object)
     status_signal = Signal(str, bool)
+    epochs_ready = Signal()
 
 
 class IOThread(threading.Thread):
@@ -297,7 +307,7 @@ class DataProcessingThread(threading.Thread):
     This thread is CPU-bound and independent of I/O and logging.
     """
     
-    def __init__(self, name: str, ring_buffer: RingBuffer, handler, signals: StreamSignals):
+    def __init__(self, name: str, ring_buffer: RingBuffer, handler, signals: StreamSignals, epoch_ring: RingBuffer = None):
         """
         Initialize the DataProcessingThread.
         
@@ -306,12 +316,16 @@ class DataProcessingThread(threading.Thread):
             ring_buffer: RingBuffer containing (raw_bytes, RTCMMessage) tuples.
             handler: RTCMHandler instance for message parsing and ephemeris management.
             signals: StreamSignals object for Qt signal emission.
+            epoch_ring: Optional RingBuffer for handing epochs to the UI. When given,
+                epochs are put into it (oldest dropped when full) instead of emitting
+                epoch_signal, and the UI drains it on its own schedule.
         """
         super().__init__()
         self.name = name
         self.ring_buffer = ring_buffer
         self.handler = handler
         self.signals = signals
+        self.epoch_ring = epoch_ring
         self.daemon = True
         self.running = True
         self.epoch_count = 0
@@ -376,8 +390,7 @@ class DataProcessingThread(threading.Thread):
                         pending = self.pending_epochs[key]
                         existing = pending['epoch']
                         # Merge satellite dictionaries (overwrite/extend)
-                        for sat_k, sat_v in epoch_data.satellites.items():
-                            existing.satellites[sat_k] = sat_v
+                        existing.merge(epoch_data)
                         pending['last_update'] = nowt
                     else:
                         # New pending epoch
@@ -397,13 +410,16 @@ class DataProcessingThread(threading.Thread):
                     self.epoch_count += 1
                     if self.first_epoch:
                         n_sats = len(epoch_out.satellites)
-                        n_sigs = sum(len(sat.signals) for sat in epoch_out.satellites.values())
+                        n_sigs = epoch_out.num_signals
                         self.signals.log_signal.emit(
                             f"[{self.name}] First epoch received (merged): {n_sats} satellites, {n_sigs} signals"
                         )
                         self.first_epoch = False
-                    # Emit merged epoch
-                    self.signals.epoch_signal.emit(epoch_out)
+                    # Hand off merged epoch (ring when the UI polls, Qt signal otherwise)
+                    if self.epoch_ring is not None:
+                        self.epoch_ring.put(epoch_out)
+                    else:
+                        self.signals.epoch_signal.emit(epoch_out)
                 
                 # Step 5: Periodic statistics output every 30 seconds
                 now = time.time()
@@ -453,7 +469,7 @@ class LoggingThread(threading.Thread):
     - Real-time status reporting
     """
     
-    def __init__(self, settings: dict, ring_buffers: dict, merged_satellites: dict, signals: StreamSignals, logging_buffer: RingBuffer = None, get_latest_epoch=None):
+    def __init__(self, settings: dict, ring_buffers: dict, merged_satellites: dict, signals: StreamSignals, logging_buffer: RingBuffer = None, get_latest_epoch=None, merged_lock=None):
         """
         Initialize logging thread.
         
@@ -469,11 +485,13 @@ class LoggingThread(threading.Thread):
             signals: StreamSignals instance for emitting log messages
             logging_buffer: RingBuffer专用的logging缓冲区（Binary格式时使用）
             get_latest_epoch: Optional callable that returns the latest EpochObservation
+            merged_lock: Optional lock guarding merged_satellites (shared with monitoring_module)
         """
         super().__init__()
         self.settings = settings
         self.ring_buffers = ring_buffers
         self.merged_satellites = merged_satellites
+        self._merged_lock = merged_lock or threading.Lock()
         self.signals = signals
         self.logging_buffer = logging_buffer
         self.get_latest_epoch = get_latest_epoch
@@ -486,6 +504,35 @@ class LoggingThread(threading.Thread):
         self.start_time = time.time()
         self.current_filename = ""
         
+        # Epoch and layout key of the last text-format snapshot (skip idle/unchanged flushes)
+        self._last_layout_key = None
+        
+        # Fields are fixed for the logger lifetime: extract each row from valmap in C
+        self._row_getter = self._make_row_getter(settings.get('fields', []))
+        
+    # Keys provided by _save_text_format's per-row value map
+    _TEXT_FIELDS = (
+        'UTC Time', 'PRN', 'Sys', 'El(°)', 'Az(°)', 'Freq',
+        'SNR (dBHz)', 'Pseudorange (m)', 'Phase (cyc)', 'Doppler (Hz)',
+    )
+    
+    @classmethod
+    def _make_row_getter(cls, fields):
+        """
+        Build a callable mapping a value map to a row tuple for the given fields.
+        
+        Unknown field names map to the '' key (always present in the value map
+        with an empty value), matching the previous valmap.get(f, '') behavior.
+        """
+        keys = [f if f in cls._TEXT_FIELDS else '' for f in fields]
+        if not keys:
+            return lambda valmap: ()
+        getter = operator.itemgetter(*keys)
+        if len(keys) == 1:
+            # itemgetter with a single key returns a scalar, not a tuple
+            return lambda valmap: (getter(valmap),)
+        return getter
+    
     def get_file_count(self):
         """Get the number of files created so far."""
         return self.file_count
@@ -563,8 +610,10 @@ class LoggingThread(threading.Thread):
                 
                 # Open file based on format (binary vs text mode)
                 if format_type == 'binary':
-                    # Binary mode for raw RTCM data with large buffer
-                    current_file = open(path, 'wb', buffering=65536)  # 64KB buffer
+                    # Raw RTCM data is written by a dedicated subprocess that owns the file
+                    # (keeps disk writes off the GIL shared with the Qt UI thread)
+                    current_file = RtcmWriterProcess(path)
+                    current_file.start()
                     writer = None
                 else:
                     # Text mode for CSV/RINEX formats
@@ -607,10 +656,7 @@ class LoggingThread(threading.Thread):
             try:
                 # Step 2a: Check if file rotation is needed (split_minutes elapsed)
                 if time.time() - file_start >= split_secs:
-                    try:
-                        current_file.close()
-                    except:
-                        pass
+                    self._close_file(current_file)
                     # Open new file with new timestamp
                     current_file, writer = open_new_file()
                     if current_file is None:
@@ -620,6 +666,11 @@ class LoggingThread(threading.Thread):
                 # Step 2b: Write data based on format type
                 current_time = time.time()
                 if format_type == 'binary':
+                    # Stop if the writer subprocess failed (nothing more can be recorded)
+                    err = current_file.poll_error()
+                    if err:
+                        self.signals.log_signal.emit(f"[Logging] Error: {err}")
+                        break
                     # Binary format: write raw RTCM messages in real-time without sampling
                     # Directly reads from logging_buffer and writes to file
                     self._save_binary_rtcm(current_file)
@@ -629,7 +680,7 @@ class LoggingThread(threading.Thread):
                     # CSV/RINEX format: sample and write satellite data at specified interval
                     # Only writes if sample_interval seconds have elapsed since last write
                     if current_time - last_sample_time >= sample_interval:
-                        self._save_text_format(current_file, writer, fields, format_type)
+                        self._save_text_format(current_file, writer, format_type)
                         last_sample_time = current_time
                     # Longer sleep for text formats since sampling is lower frequency
                     time.sleep(0.1)
@@ -643,7 +694,7 @@ class LoggingThread(threading.Thread):
         
         # Step 3: Cleanup on shutdown
         if current_file:
-            current_file.close()
+            self._close_file(current_file)
         
         duration = time.time() - self.start_time
         hours, remainder = divmod(duration, 3600)
@@ -652,9 +703,27 @@ class LoggingThread(threading.Thread):
         
         self.signals.log_signal.emit(f"[Logging] Logging thread stopped. Total files: {self.file_count}, Duration: {duration_str}")
     
+    def _close_file(self, file_handle):
+        """
+        Close a log file; for a RtcmWriterProcess also report writer errors and dropped chunks.
+        """
+        try:
+            file_handle.close()
+        except Exception as e:
+            self.signals.log_signal.emit(f"[Logging] Error closing file: {e}")
+        if isinstance(file_handle, RtcmWriterProcess):
+            err = file_handle.poll_error()
+            if err:
+                self.signals.log_signal.emit(f"[Logging] Error: {err}")
+            if file_handle.dropped:
+                self.signals.log_signal.emit(
+                    f"[Logging] Warning: {file_handle.dropped} RTCM chunks dropped "
+                    f"(writer queue full) in {os.path.basename(file_handle.path)}"
+                )
+    
     def _save_binary_rtcm(self, file_handle):
         """
-        Save raw RTCM binary data directly from ring buffers.
+        Forward raw RTCM binary data from ring buffers to the writer subprocess.
         
         Uses dedicated logging_buffer if available to avoid data loss.
         Falls back to shared OBS buffer if logging_buffer not available.
@@ -667,9 +736,9 @@ class LoggingThread(threading.Thread):
                 return
             
             # 持续读取，直到缓冲区空
-            count = 0
-            bytes_written = 0
-            
+            # file_handle is a RtcmWriterProcess: write() only queues the bytes
+            # (waiting briefly when the queue is full), batching and fsync happen
+            # in the writer subprocess
             while True:
                 try:
                     data = buffer.get(block=False)
@@ -678,33 +747,31 @@ class LoggingThread(threading.Thread):
                     
                     raw, msg = data
                     if raw is not None:
-                        # Write raw binary RTCM data immediately
                         file_handle.write(raw)
-                        bytes_written += len(raw)
-                        count += 1
                 except:
                     break
-            
-            # Flush after writing batch (更频繁的flush确保数据不丢失)
-            if count > 0:
-                file_handle.flush()
                     
         except Exception as e:
             self.signals.log_signal.emit(f"[Logging] Error saving binary RTCM: {e}")
     
-    def _save_text_format(self, file_handle, writer, fields, format_type):
+    def _save_text_format(self, file_handle, writer, format_type):
         """
         Save processed satellite data in text format (CSV or RINEX-like).
         
+        The selected fields are applied by self._row_getter.
+        
         Args:
             file_handle: Open file handle
             writer: CSV writer object (None for RINEX)
-            fields: List of field names to save
             format_type: 'csv' or 'rinex'
         """
         try:
             # Get snapshot of current satellite data
-            snapshot = dict(self.merged_satellites)
+            # A tuple of items avoids rebuilding a hash table; read-only iteration only
+            with self._merged_lock:
+                snapshot = tuple(self.merged_satellites.items())
+            if not snapshot:
+                return
             
             # Get latest epoch data for UTC time
             epoch_data = None
@@ -714,19 +781,33 @@ class LoggingThread(threading.Thread):
                 if epoch_data:
                     utc_datetime = getattr(epoch_data, 'utc_datetime', None)
             
+            # Skip the whole format+write cycle if no new epoch arrived since the last flush
+            # (same epoch time and same satellite/signal layout means identical rows)
+            gps_time = getattr(epoch_data, 'gps_time', None)
+            layout_key = hash((gps_time, tuple((k, tuple(sorted(s.signals))) for k, s in snapshot)))
+            if layout_key == self._last_layout_key:
+                return
+            self._last_layout_key = layout_key
+            
             # Format UTC time string: YYYY-MM-DD HH:MM:SS
             utc_time_str = utc_datetime.strftime('%Y-%m-%d %H:%M:%S') if utc_datetime else ''
             
             rows = []
-            sys_map = {'G': 'GPS', 'R': 'GLO', 'E': 'GAL', 'C': 'BDS', 'J': 'QZS', 'S': 'SBS'}
             
-            for key, sat in sorted(snapshot.items()):
-                sys_char = key[0]
-                el = getattr(sat, 'el', getattr(sat, 'elevation', 0)) or 0
-                az = getattr(sat, 'az', getattr(sat, 'azimuth', 0)) or 0
+            items = sorted(snapshot, key=lambda item: item[0])
+            # System name column computed once per flush, reused by every signal row
+            keys = [item[0] for item in items]
+            syscol = [_SYS_NAMES.get(k[0], k[0]) for k in keys]
+            
+            # Pass 1: collect one entry per signal into flat columns (SoA)
+            sat_idx, codes, snrs, prs, phs, dopplers = [], [], [], [], [], []
+            els, azs = [], []
+            for idx, (key, sat) in enumerate(items):
+                els.append(sat.elevation or 0)
+                azs.append(sat.azimuth or 0)
                 
-                # Process all signals for this satellite
-                sorted_codes = sorted(sat.signals.keys())
+                # Process all signals for this satellite (sort cached on the SatelliteState)
+                sorted_codes = sat.sorted_codes()
                 if not sorted_codes:
                     continue
                 
@@ -734,39 +815,48 @@ class LoggingThread(threading.Thread):
                     sig = sat.signals.get(code)
                     if not sig:
                         continue
-                    
-                    snr = getattr(sig, 'snr', 0) or 0
-                    pr = getattr(sig, 'pseudorange', None)
-                    ph = getattr(sig, 'phase', None)
-                    doppler = getattr(sig, 'doppler', 0) or 0
-                    
-                    # Build value map for flexible field selection
-                    # Include UTC time fields
-                    valmap = {
-                        'UTC Time': utc_time_str,
-                        'PRN': key,
-                        'Sys': sys_map.get(sys_char, sys_char),
-                        'El(°)': f"{el:.1f}",
-                        'Az(°)': f"{az:.1f}",
-                        'Freq': code,
-                        'SNR (dBHz)': f"{snr:.1f}",
-                        'Pseudorange (m)': f"{(pr if pr is not None else '')}",
-                        'Phase (cyc)': f"{(ph if ph is not None else '')}",
-                        'Doppler (Hz)': f"{doppler:.3f}"
-                    }
-                    
-                    row = [valmap.get(f, '') for f in fields]
-                    rows.append(row)
+                    sat_idx.append(idx)
+                    codes.append(code)
+                    snrs.append(sig.snr or 0)
+                    prs.append(sig.pseudorange)
+                    phs.append(sig.phase)
+                    dopplers.append(sig.doppler or 0)
+            
+            # Pass 2: format numeric columns in one call each
+            el_col = format_fixed(els, 1)
+            az_col = format_fixed(azs, 1)
+            snr_col = format_fixed(snrs, 1)
+            doppler_col = format_fixed(dopplers, 3)
+            
+            for i, idx in enumerate(sat_idx):
+                pr = prs[i]
+                ph = phs[i]
+                # Build value map for flexible field selection
+                # Include UTC time fields
+                valmap = {
+                    '': '',
+                    'UTC Time': utc_time_str,
+                    'PRN': keys[idx],
+                    'Sys': syscol[idx],
+                    'El(°)': el_col[idx],
+                    'Az(°)': az_col[idx],
+                    'Freq': codes[i],
+                    'SNR (dBHz)': snr_col[i],
+                    'Pseudorange (m)': f"{(pr if pr is not None else '')}",
+                    'Phase (cyc)': f"{(ph if ph is not None else '')}",
+                    'Doppler (Hz)': doppler_col[i]
+                }
+                
+                rows.append(self._row_getter(valmap))
             
             # Write rows based on format
             if format_type == 'rinex':
                 # Space-separated format for RINEX-like output
-                for row in rows:
-                    file_handle.write(' '.join(str(x) for x in row) + '\n')
+                # Row values are already strings: join lists directly, one writelines call
+                file_handle.writelines([' '.join(row) + '\n' for row in rows])
             else:
                 # CSV format
-                for row in rows:
-                    writer.writerow(row)
+                writer.writerows(rows)
             
             if rows:
                 file_handle.flush()
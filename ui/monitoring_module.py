@@ -11,27 +11,29 @@ Threading model:
   - IOThread: Receives RTCM messages (one per stream)
   - DataProcessingThread: Parses RTCM (one per stream)
   - LoggingThread: Records observations (started on demand)
-  - Cleanup Timer: Removes stale satellites every 1 second
-  - GUI Update Timer: Throttles refresh every 60 seconds
+  - Cleanup QTimer (UI thread): Removes stale satellites every 2 seconds
+  - Deferred refresh (single-shot QTimer): Throttles refresh to one per 0.3 seconds
 
 Signal flow:
   NTRIP → IOThread → ring_buffer → DataProcessingThread → merged_satellites 
-       → epoch_signal → process_gui_epoch() → refresh_all_widgets()
+       → epoch_ring → epochs_ready → _drain_epochs() → _merge_epoch() → refresh_all_widgets()
 """
 
 import time
+import bisect
 import threading
 from datetime import datetime
-from collections import deque, defaultdict
+from collections import deque
 import numpy as np
 
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QTableWidget, QTableWidgetItem, QLabel, QTextEdit, 
+                             QTableView, QLabel, QPlainTextEdit, 
                              QSplitter, QHeaderView, QTabWidget, QComboBox,
                              QCheckBox, QPushButton, QFrame, QApplication, QDialog, QStyle,
-                             QFileDialog, QDialogButtonBox, QSpinBox, QListWidget)
-from PySide6.QtCore import Qt, Slot, QTimer, Signal
-from PySide6.QtGui import QColor, QFont, QIcon
+                             QFileDialog, QDialogButtonBox, QSpinBox, QListWidget,
+                             QAbstractItemView)
+from PySide6.QtCore import Qt, Slot, QTimer, Signal, QSignalBlocker, QEvent
+from PySide6.QtGui import QIcon
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -43,12 +45,52 @@ from ui.monitoring.log_settings import LogSettingsDialog
 from core.rtcm_handler import RTCMHandler
 from core.ring_buffer import RingBuffer
 from core.global_config import get_global_config
-from ui.monitoring.widgets import SkyplotWidget, MultiSignalBarWidget, PlotSNRWidget, SatelliteNumWidget
+from ui.monitoring.history import SatHistory
+from ui.monitoring.table_model import SatTableModel, SAT_ROW_DTYPE, make_system_filter
+from ui.monitoring.widgets import (SkyplotWidget, MultiSignalBarWidget, PlotSNRWidget, SatelliteNumWidget,
+                                   SAT_SNAPSHOT_DTYPE, SIG_SNAPSHOT_DTYPE)
 from ui.ConfigDialog import ConfigDialog
 from ui.style import get_app_stylesheet
 import csv
 
 
+# Samples kept per satellite for the analysis plot
+HISTORY_LEN = 500
+
+# Lines kept in the log area (older lines are dropped by Qt)
+MAX_LOG_LINES = 500
+
+# Stream status label stylesheets (green ON / red OFF), built once
+_STATUS_STYLE_ON = "background-color: #2A692D; color: white; padding: 4px 8px; border-radius: 4px; font-weight: bold;"
+_STATUS_STYLE_OFF = "background-color: #6D2F2B; color: white; padding: 4px 8px; border-radius: 4px; font-weight: bold;"
+
+# Short system names shown in the tables' Sys column
+_SYS_NAMES = {'G': 'GPS', 'R': 'GLO', 'E': 'GAL', 'C': 'BDS', 'J': 'QZS', 'S': 'SBS'}
+
+# Dense satellite index: each system gets a block of 64 slots (MSM satellite mask width)
+_SYS_OFFSET = {s: i * 64 for i, s in enumerate('GRECJSI')}
+_N_SAT_SLOTS = 64 * len(_SYS_OFFSET)
+# PRN preceding a system's first satellite: QZSS (193-202) and SBAS (120-158)
+# keys carry pyrtcm's QZSS_PRN_MAP / SBAS_PRN_MAP numbers, the others start at 1
+_SYS_PRN_BASE = {'J': 192, 'S': 119}
+
+
+def _prn_to_idx(prn: str) -> int:
+    """
+    Map a PRN key such as 'G12' or 'J193' to its dense slot index.
+
+    Returns:
+        The slot index, or -1 for an unknown system or a PRN outside its block.
+    """
+    offset = _SYS_OFFSET.get(prn[:1])
+    if offset is None or not prn[1:].isdigit():
+        return -1
+    n = int(prn[1:]) - _SYS_PRN_BASE.get(prn[0], 0)
+    if not 1 <= n <= 64:
+        return -1
+    return offset + n - 1
+
+
 class MonitoringModule(QMainWindow):
 
     back_to_launcher = Signal()
@@ -74,34 +116,68 @@ class MonitoringModule(QMainWindow):
         # Step 1: Initialize satellite data containers
         # merged_satellites: {prn_str: SatelliteState} - current epoch data from all threads
         self.merged_satellites = {}
-        # sat_last_seen: {prn_str: timestamp} - track stale satellites for cleanup
-        self.sat_last_seen = {}
-
-        # sat_history: {prn_str: deque(maxlen=500)} - historical SNR/elevation for analysis tab
-        # Each entry: {'time': datetime, 'el': elevation_deg, 'snr': {code: snr_value}}
-        self.sat_history = defaultdict(lambda: deque(maxlen=500))
+        # merged_lock: guards merged_satellites against concurrent access from LoggingThread
+        self.merged_lock = threading.Lock()
+        # sat_last_seen: timestamp per dense slot (_prn_to_idx), NaN if not tracked
+        self.sat_last_seen = np.full(_N_SAT_SLOTS, np.nan)
+        # _slot_prns: PRN key per dense slot (None if not tracked)
+        self._slot_prns = [None] * _N_SAT_SLOTS
+        # _sorted_prns: keys of merged_satellites kept in sorted order (bisect on first sight)
+        self._sorted_prns = []
+
+        # sat_history: dense per-PRN rings of time/elevation/SNR for analysis tab
+        self.sat_history = SatHistory(HISTORY_LEN)
         self.current_sat_list = []  # Dropdown list for analysis tab selection
+        self._sat_set = frozenset()  # PRNs of current_sat_list, for cheap change detection
+        # Deferred (singleShot 0) work already queued, so bursts collapse into one call
+        self._sat_combo_pending = False
+        self._analysis_pending = False
         
         # Step 2: Configure GUI update throttling to prevent excessive redrawing
         # Target: 3-5 updates per second (0.3s interval) for responsive but smooth rendering
         self.last_gui_update_time = 0
         self.gui_update_interval = 0.3  # Minimum interval between full widget refreshes (seconds)
-        self.pending_update = False     # Flag: GUI refresh requested but throttled
+        self.pending_update = False     # Flag: deferred (single-shot) refresh already scheduled
         self.current_tab_index = 0      # Track visible tab to skip updates for hidden tabs
-        self.last_table_data_hash = None  # Hash of table data to detect actual changes
+        # Incremental table refresh: per-PRN signature cache + set of PRNs changed since last refresh
+        self._sat_sig_cache = {}        # {prn: (el, az, ((code, snr, pr, ph), ...))}
+        self._dirty_prns = set()        # PRNs whose displayed values changed
+        self._table_layout = None       # Row layout ((prn, code), ...) shown in the tables
+        # Generation counter: bumped whenever merged satellite state changes
+        self._generation = 0
+        self._widgets_key = None        # (generation, systems) last drawn by left-side widgets
+        self._analysis_gen = None       # Generation last drawn by the analysis plot
+        self._last_epoch_counts = (0, 0)  # (satellites, signals) of the last merged epoch
         
         # Step 3: Load active GNSS systems from configuration
         # DEFAULT: G(GPS), R(GLONASS), E(Galileo), C(BeiDou), J(QZSS), S(SBAS)
         config = get_global_config()
-        self.active_systems = set(config.target_systems) if config.target_systems else {'G', 'R', 'E', 'C', 'J', 'S'}
+        # frozenset: O(1) membership in the per-satellite loops and usable directly in change keys
+        self.active_systems = frozenset(config.target_systems) if config.target_systems else frozenset('GRECJS')
         
         # Step 4: Create Qt signal/slot connections for thread communication
         # Signals emitted by IOThread and DataProcessingThread in workers.py
         self.signals = StreamSignals()
         self.signals.log_signal.connect(self.append_log)       # Thread → UI: log messages
-        self.signals.epoch_signal.connect(self.process_gui_epoch)  # Thread → UI: new epoch data
+        # Pending log lines, flushed by log_flush_timer; lines the log area would drop anyway are discarded here
+        self._log_queue = deque(maxlen=MAX_LOG_LINES)
+        # Timestamp prefix of the current second, reformatted only when the second changes
+        self._log_sec = None
+        self._log_prefix = ""
+        # Log flush timer: single-shot, armed by the first queued line, so a burst
+        # of messages is appended in one batch 250ms later and an idle log costs no wake-ups
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(250)
+        self.log_flush_timer.timeout.connect(self._flush_log)
         self.signals.status_signal.connect(self.update_status)  # Thread → UI: connection status
         
+        # Epoch handoff: DataProcessingThreads put epochs here; epochs_ready wakes the UI only when
+        # the ring goes from empty to non-empty, and the UI then drains it completely
+        # (bounded: oldest epochs are dropped if the UI falls far behind)
+        self.signals.epochs_ready.connect(self._drain_epochs)
+        self.epoch_ring = RingBuffer(maxsize=64, on_data=self.signals.epochs_ready.emit)
+        
         # Step 5: Initialize thread management structures
         # io_threads: list of IOThread (one per stream, receives RTCM from NTRIP)
         # processing_threads: list of DataProcessingThread (one per stream, parses RTCM)
@@ -135,6 +211,7 @@ class MonitoringModule(QMainWindow):
                 'baudrate': 115200
             }
         }
+        self._config_dialog = None  # ConfigDialog, created on first open and reused
         # Logging configuration: format, directory, rotation, sampling
         self.logging_settings = {
             'enabled': False,
@@ -154,15 +231,10 @@ class MonitoringModule(QMainWindow):
         # Step 8: Start background maintenance timers
         # Cleanup timer: every 2 seconds, remove satellites not updated for > 5 seconds
         # This prevents accumulation of stale data and releases memory
-        self.cleanup_timer = threading.Timer(1.0, self.cleanup_stale_satellites)
-        self.cleanup_timer.daemon = True
-        self.cleanup_timer.start()
-        
-        # GUI update timer: every 50ms check if pending GUI update is needed
-        # Implements throttling: only refresh if enough time has passed since last update
-        self.gui_update_timer = QTimer()
-        self.gui_update_timer.timeout.connect(self._check_pending_update)
-        self.gui_update_timer.start(50)  # Check every 50ms for pending updates
+        # Runs on the UI thread, so it never races with process_gui_epoch/update_table
+        self.cleanup_qtimer = QTimer(self)
+        self.cleanup_qtimer.timeout.connect(self._cleanup_stale_satellites_ui)
+        self.cleanup_qtimer.start(2000)
 
         # Initial status message
         self.signals.log_signal.emit("=== GNSS RT Monitor Started ===")
@@ -317,28 +389,27 @@ class MonitoringModule(QMainWindow):
         }
         self.tables = {}
 
-        headers = [
-            "PRN", "Sys", "El(°)", "Az(°)", "Freq",
-            "SNR (dBHz)", "Pseudorange (m)", "Phase (cyc)", "Doppler (Hz)"
-        ]
-
-        for tab_name in self.table_groups:
-            table = QTableWidget()
-            table.setColumnCount(len(headers))
-            table.setHorizontalHeaderLabels(headers)
-
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-            header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-            header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-            header.setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)
-            header.setSectionResizeMode(7, QHeaderView.ResizeMode.Stretch)
-            header.setSectionResizeMode(8, QHeaderView.ResizeMode.Stretch)
-
+        # One shared model; each sub-table is a view on a per-system filter proxy
+        self.sat_model = SatTableModel(self)
+        self.table_proxies = {}
+
+        for tab_name, systems in self.table_groups.items():
+            proxy = make_system_filter(self.sat_model, systems, self)
+            table = QTableView()
+            table.setModel(proxy)
+            # Read-only, single-line cells: no editors and no word-wrap text layout on paint
+            table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+            table.setWordWrap(False)
+            self._setup_table_header(table)
             table.verticalHeader().setVisible(False)
 
             self.sub_tabs.addTab(table, tab_name)
             self.tables[tab_name] = table
+            self.table_proxies[tab_name] = proxy
+
+        # Only the visible sub-table's proxy follows the model (see _on_sub_tab_changed)
+        self.sub_tabs.currentChanged.connect(self._on_sub_tab_changed)
+        self._on_sub_tab_changed(self.sub_tabs.currentIndex())
 
         vbox_over.addWidget(self.sub_tabs)
         self.main_tabs.addTab(tab_over, "Dashboard")
@@ -352,21 +423,21 @@ class MonitoringModule(QMainWindow):
         h_ctrl = QHBoxLayout()
         h_ctrl.addWidget(QLabel("Target Satellite:"))
         self.combo_sat = QComboBox()
-        self.combo_sat.currentTextChanged.connect(self.refresh_analysis_plot)
+        self.combo_sat.currentTextChanged.connect(self._schedule_analysis_plot)
         h_ctrl.addWidget(self.combo_sat)
 
         h_ctrl.addWidget(QLabel("Mode:"))
         self.combo_mode = QComboBox()
         self.combo_mode.addItems(["Time Sequence", "Elevation"])
-        self.combo_mode.currentTextChanged.connect(self.refresh_analysis_plot)
+        self.combo_mode.currentTextChanged.connect(self._schedule_analysis_plot)
         h_ctrl.addWidget(self.combo_mode)
 
         h_ctrl.addWidget(QLabel("Signal:"))
         self.combo_sig = QComboBox()
         self.combo_sig.addItem("All")
-        self.combo_sig.currentTextChanged.connect(self.refresh_analysis_plot)
+        self.combo_sig.currentTextChanged.connect(self._schedule_analysis_plot)
         h_ctrl.addWidget(self.combo_sig)
-        self._sig_items = ["All"]
+        self._sig_set = frozenset()  # Signals listed in combo_sig (besides "All")
 
         h_ctrl.addStretch()
         vbox_an.addLayout(h_ctrl)
@@ -386,7 +457,7 @@ class MonitoringModule(QMainWindow):
         # ======================================================================
         # Log output area
         # ======================================================================
-        self.log_area = QTextEdit()
+        self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
         self.log_area.setMaximumHeight(80)
         self.log_area.setStyleSheet(
@@ -394,26 +465,24 @@ class MonitoringModule(QMainWindow):
             "font-family: Monospace; border: 1px solid #ccc;"
         )
 
-        # Limit log growth for performance
-        self.max_log_lines = 500
+        # Limit log growth for performance: Qt drops the oldest lines itself
+        self.log_area.setMaximumBlockCount(MAX_LOG_LINES)
         layout.addWidget(self.log_area)
 
 
     def on_filter_changed(self):
-        self.active_systems = {k for k, chk in self.chk_sys.items() if chk.isChecked()}
+        self.active_systems = frozenset(k for k, chk in self.chk_sys.items() if chk.isChecked())
         self.refresh_all_widgets()
 
-    def cleanup_stale_satellites(self):
+    def _cleanup_stale_satellites_ui(self):
         """
         Periodically remove satellites that have not been updated recently.
 
-        This function runs in a background timer thread and is responsible for:
+        Called by cleanup_qtimer on the UI thread and responsible for:
         - Detecting satellites whose last update exceeds a timeout threshold
         - Cleaning their current state and historical buffers
-        - Rescheduling itself for the next cleanup cycle
 
         Note:
-        - No GUI updates are performed here (thread-safety).
         - Intended to prevent stale data accumulation and memory growth.
         """
 
@@ -423,108 +492,217 @@ class MonitoringModule(QMainWindow):
         # Identify satellites exceeding inactivity timeout
         # ------------------------------------------------------------------
         timeout = 5.0  # seconds
-        to_remove = [
-            prn for prn, last_time in self.sat_last_seen.items()
-            if now - last_time > timeout
-        ]
+        # Single vectorized scan; untracked slots are NaN and never compare as stale
+        stale = np.flatnonzero(now - self.sat_last_seen > timeout).tolist()
+        to_remove = [self._slot_prns[i] for i in stale]
+        self.sat_last_seen[stale] = np.nan
+        for i in stale:
+            self._slot_prns[i] = None
 
         # ------------------------------------------------------------------
         # Remove stale satellites from all tracking containers
         # ------------------------------------------------------------------
         for prn in to_remove:
-            self.merged_satellites.pop(prn, None)
-            self.sat_last_seen.pop(prn, None)
+            # merged_satellites is still read by LoggingThread
+            with self.merged_lock:
+                del self.merged_satellites[prn]
+            self._sorted_prns.remove(prn)
 
             # Remove historical time series to free memory
-            if prn in self.sat_history:
-                del self.sat_history[prn]
+            self.sat_history.remove(prn)
+            del self._sat_sig_cache[prn]
+        if to_remove:
+            self._generation += 1
 
         # GUI will refresh naturally on the next data update
-        # (do NOT touch widgets from this background thread)
-
-        # ------------------------------------------------------------------
-        # Reschedule next cleanup cycle
-        # ------------------------------------------------------------------
-        self.cleanup_timer = threading.Timer(2.0, self.cleanup_stale_satellites)
-        self.cleanup_timer.daemon = True
-        self.cleanup_timer.start()
 
 
     @Slot(object)
     def process_gui_epoch(self, epoch_data):
         """
-        Handle incoming epoch from DataProcessingThread and update UI.
+        Merge one epoch and refresh the UI (subject to throttling).
+
+        Epochs from the stream threads normally arrive through epoch_ring and
+        _drain_epochs; this slot handles a single epoch directly.
+        """
+        self._merge_epoch(epoch_data)
+        self._throttled_refresh()
+
+    def _merge_epoch(self, epoch_data):
+        """
+        Merge an epoch from DataProcessingThread into the UI state (no widget updates).
         
         Procedure:
         1. Store latest epoch data for logging and positioning modules
         2. Extract epoch timestamp and satellite count
         3. Merge epoch satellites into merged_satellites dict (maintains current state)
-        4. Update satellite history (elevation, SNR time series for analysis tab)
-        5. Apply GUI update throttling: only refresh if enough time has elapsed
-        6. Log periodic statistics (every 5 seconds)
+        4. Update satellite history (elevation, SNR time series), only while the Analysis tab is shown
         
-        Thread safety: Runs in UI thread (slot callback), safe to update widgets.
-        Throttling: Limits full widget refresh to 3-5 Hz to avoid excessive redrawing.
+        Thread safety: Runs in UI thread.
         """
         # Step 0: Store latest epoch data
         self.latest_epoch_data = epoch_data
         
         now = time.time()
-        current_dt = datetime.now()
-        n_sats = len(epoch_data.satellites)
-        n_signals = sum(len(sat.signals) for sat in epoch_data.satellites.values())
+        self._last_epoch_counts = (
+            len(epoch_data.satellites),
+            epoch_data.num_signals,
+        )
+
+        # Epoch columns for the history store (filled in the merge loop, written once below);
+        # nothing reads the history while the Analysis tab is hidden
+        record_history = self.current_tab_index == 1
+        hist_prns, hist_els = [], []
+        sig_sat, sig_codes, sig_snr = [], [], []
 
         # Step 1: Merge new epoch data into merged_satellites dictionary
         # This maintains a consistent "current state" of all tracked satellites
         # Each DataProcessingThread emits epochs when it receives all satellites for a time instant
         for prn, sat in epoch_data.satellites.items():
+            # Skip PRNs without a slot (they could never time out)
+            idx = _prn_to_idx(prn)
+            if idx < 0:
+                continue
             # Store or update satellite state (includes position, signals, observations)
-            self.merged_satellites[prn] = sat
+            with self.merged_lock:
+                self.merged_satellites[prn] = sat
             # Record when this satellite was last seen (for timeout detection)
-            self.sat_last_seen[prn] = now
+            if self._slot_prns[idx] is None:
+                self._slot_prns[idx] = prn
+                bisect.insort(self._sorted_prns, prn)
+            self.sat_last_seen[idx] = now
             
-            # Step 2: Update historical data for SNR analysis plots
-            # Extract elevation and SNR map from satellite observations
-            el = getattr(sat, "el", getattr(sat, "elevation", 0)) or None
-            # SNR map: {signal_code: snr_value} e.g., {'1C': 38.5, '5Q': 42.0}
-            snr_map = {c: s.snr for c, s in sat.signals.items() if s and getattr(s, 'snr', 0)}
-            # Append to history deque (maxlen=500 keeps last 500 samples per satellite)
-            self.sat_history[prn].append({'time': current_dt, 'el': el, 'snr': snr_map})
-
-        # Step 3: Apply GUI update throttling mechanism
+            # Mark PRN dirty only if its displayed values changed (incremental table refresh)
+            sig_key = self._sat_signature(sat)
+            if self._sat_sig_cache.get(prn) != sig_key:
+                self._sat_sig_cache[prn] = sig_key
+                self._dirty_prns.add(prn)
+
+            if not record_history:
+                continue
+
+            # Step 2: Collect historical data for SNR analysis plots
+            # Elevation and valid SNR values of this satellite as flat epoch columns
+            sat_i = len(hist_prns)
+            hist_prns.append(prn)
+            hist_els.append(np.nan if sat.elevation is None else sat.elevation)
+            for c, s in sat.signals.items():
+                if s and s.snr:
+                    sig_sat.append(sat_i)
+                    sig_codes.append(c)
+                    sig_snr.append(s.snr)
+
+        # Write the whole epoch into the history rings (keeps last HISTORY_LEN samples per satellite)
+        if record_history:
+            self.sat_history.append_epoch(now, hist_prns, hist_els, sig_sat, sig_codes, sig_snr)
+        self._generation += 1
+
+    def _throttled_refresh(self):
+        """
+        Refresh widgets if the throttle interval has elapsed, otherwise defer.
+        
+        Procedure:
+        1. Apply GUI update throttling: only refresh if enough time has elapsed
+        2. Log periodic statistics (every 5 seconds)
+        
+        Throttling: Limits full widget refresh to 3-5 Hz to avoid excessive redrawing.
+        """
+        now = time.time()
+        # Step 1: Apply GUI update throttling mechanism
         # Only refresh all widgets if sufficient time has passed since last refresh
         # This prevents excessive redrawing which causes CPU/GPU strain
         if now - self.last_gui_update_time >= self.gui_update_interval:
             # Enough time has passed - perform full widget refresh
             self.refresh_all_widgets()
             self.last_gui_update_time = now
-            self.pending_update = False
             
-            # Step 4: Periodic statistics logging (every 5 seconds)
+            # Step 2: Periodic statistics logging (every 5 seconds)
             # Helps monitor system performance and data reception
             if not hasattr(self, '_last_stats_log_time'):
                 self._last_stats_log_time = now
             if now - self._last_stats_log_time >= 5.0:
                 total_sats = len(self.merged_satellites)
+                n_sats, n_signals = self._last_epoch_counts
                 self.signals.log_signal.emit(
                     f"Status: {total_sats} satellites tracked, "
                     f"{n_sats} in epoch, {n_signals} signals"
                 )
                 self._last_stats_log_time = now
-        else:
-            # Not enough time has passed - mark for deferred update
-            # The GUI update timer will check this flag and refresh when throttle expires
+        elif not self.pending_update:
+            # Not enough time has passed - schedule one deferred refresh for when the throttle expires
+            # (later epochs before then are picked up by that same refresh)
+            remaining = self.gui_update_interval - (now - self.last_gui_update_time)
             self.pending_update = True
+            QTimer.singleShot(max(0, int(remaining * 1000)) + 1, self._deferred_refresh)
+
+    def _deferred_refresh(self):
+        """Single-shot target scheduled by _throttled_refresh."""
+        self.pending_update = False
+        self._throttled_refresh()
 
-    def _check_pending_update(self):
-        if self.pending_update:
-            now = time.time()
-            if now - self.last_gui_update_time >= self.gui_update_interval:
-                self.refresh_all_widgets()
-                self.last_gui_update_time = now
-                self.pending_update = False
+    @Slot()
+    def _drain_epochs(self):
+        """
+        Drain queued epochs (woken by epochs_ready) and refresh once.
+
+        All epochs queued since the last wake-up are merged (cheap state
+        updates), then at most one throttled widget refresh is performed for
+        the whole batch.
+        """
+        merged = False
+        while (epoch_data := self.epoch_ring.get(block=False)) is not None:
+            self._merge_epoch(epoch_data)
+            merged = True
+
+        if merged:
+            self._throttled_refresh()
     
+    @staticmethod
+    def _setup_table_header(table):
+        """
+        Apply the column and row sizing of the satellite tables.
+
+        All sizes are fixed up front: ResizeToContents would re-measure every
+        row after each model update. The PRN/Sys/Freq columns get the width of
+        their widest possible content (or header), rows the font's line height.
+        """
+        header = table.horizontalHeader()
+        fm = table.fontMetrics()
+        for col, widest in ((0, "G00"), (1, "GPS"), (4, "5X")):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(col, max(header.sectionSizeHint(col), fm.horizontalAdvance(widest) + 16))
+        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(7, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(8, QHeaderView.ResizeMode.Stretch)
+
+        rows = table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(fm.height() + 6)
+
+    def _on_sub_tab_changed(self, index):
+        """
+        Attach the shared table model only to the visible sub-table's proxy.
+
+        Hidden proxies are detached, so model updates do not re-filter and
+        re-layout tables nobody sees; a proxy filters the current rows once
+        when its tab becomes visible.
+        """
+        visible = self.sub_tabs.widget(index)
+        for tab_name, proxy in self.table_proxies.items():
+            table = self.tables[tab_name]
+            source = self.sat_model if table is visible else None
+            if proxy.sourceModel() is not source:
+                proxy.setSourceModel(source)
+                if source is not None:
+                    # Header sections are recreated on attach with default resize modes
+                    self._setup_table_header(table)
+
     def on_tab_changed(self, index):
+        # History is only recorded while the Analysis tab is shown: restart it
+        # from now rather than plotting across the gap
+        if index == 1 and self.current_tab_index != 1:
+            self.sat_history.clear()
+            self._analysis_gen = None
         self.current_tab_index = index
     
     def refresh_all_widgets(self):
@@ -532,33 +710,43 @@ class MonitoringModule(QMainWindow):
         Refresh all visualization widgets with current satellite data.
         
         Procedure:
-        1. Create snapshot of merged_satellites dict (thread-safe copy)
+        1. Build one structured-array snapshot of merged_satellites (per-PRN + per-signal)
         2. Conditionally update widgets based on visible tab
         3. Always update left-side widgets (skyplot, stats) - always visible
         4. Conditionally update tab-specific widgets (only if tab is active)
         5. Avoid redundant updates by checking current tab index
         
-        Performance: Skips updates for hidden tabs to reduce CPU usage.
-        Thread safety: Creates local dict snapshot to avoid concurrent modification issues.
+        Performance: Skips updates for hidden tabs and for unchanged state
+        (generation counter); the snapshot is built once and shared so widgets
+        use vector operations instead of walking SatelliteState attributes.
+        Nothing is refreshed while the window is hidden or minimized; showEvent
+        and changeEvent catch up when it becomes visible again.
         """
-        # Step 1: Create snapshot of satellite data for thread-safe access
-        # This prevents issues if other threads modify merged_satellites during iteration
-        satellites_snapshot = dict(self.merged_satellites)
-        
-        # Step 2: Always update left-side widgets (they are always visible regardless of tab)
-        # Left side contains: skyplot, satellite count statistics, multi-signal bar chart
-        
-        # Update skyplot with current satellite positions and signals
-        # Filtered by self.active_systems (checkboxes at top)
-        self.skyplot.update_satellites(satellites_snapshot, self.active_systems)
-        
-        # Update satellite count statistics widget (bottom-left)
-        # Shows number of visible satellites per constellation
-        self.sat_stats.update_data(satellites_snapshot, self.active_systems)
-        
-        # Update bar chart (multi-signal SNR overview)
-        # Always visible in Dashboard tab and left side
-        self.bar_chart.update_data(satellites_snapshot, self.active_systems)
+        if not self.isVisible() or self.isMinimized():
+            return
+
+        # Skip left-side widgets if neither satellite state nor system filter changed
+        widgets_key = (self._generation, self.active_systems)
+        if widgets_key != self._widgets_key:
+            self._widgets_key = widgets_key
+
+            # Step 1: Create snapshot arrays of satellite data
+            sats, sigs = self._snapshot_array()
+            
+            # Step 2: Always update left-side widgets (they are always visible regardless of tab)
+            # Left side contains: skyplot, satellite count statistics, multi-signal bar chart
+            
+            # Update skyplot with current satellite positions and signals
+            # Filtered by self.active_systems (checkboxes at top)
+            self.skyplot.update_satellites(sats, self.active_systems)
+            
+            # Update satellite count statistics widget (bottom-left)
+            # Shows number of visible satellites per constellation
+            self.sat_stats.update_data(sats, self.active_systems)
+            
+            # Update bar chart (multi-signal SNR overview)
+            # Always visible in Dashboard tab and left side
+            self.bar_chart.update_data(sats, sigs, self.active_systems)
         
         # Step 3: Update tab-specific widgets
         # Only refresh if the corresponding tab is currently active (avoid hidden widget updates)
@@ -568,225 +756,193 @@ class MonitoringModule(QMainWindow):
             self.update_table()
         
         elif self.current_tab_index == 1:
-            # Analysis tab active: update SNR plot if a satellite is selected
-            if self.combo_sat.currentText():
+            # Analysis tab active: update SNR plot if a satellite is selected and history grew
+            # (selection changes redraw directly through the combo box signals)
+            if self.combo_sat.currentText() and self._analysis_gen != self._generation:
+                self._analysis_gen = self._generation
                 self.refresh_analysis_plot()
 
+    def _snapshot_array(self):
+        """
+        Materialize merged_satellites as structured arrays for the widgets.
+
+        Returns:
+            (sats, sigs): SAT_SNAPSHOT_DTYPE array sorted by PRN and
+            SIG_SNAPSHOT_DTYPE array of signals with SNR > 0 (grouped by
+            satellite, sorted by code).
+        """
+        merged = self.merged_satellites
+        items = [(key, merged[key]) for key in self._sorted_prns]
+
+        sig_rows = []
+
+        def iter_sats():
+            for i, (key, sat) in enumerate(items):
+                el = sat.elevation
+                az = sat.azimuth
+                signals = sat.signals
+                snrs = [
+                    (c, signals[c].snr) for c in sat.sorted_codes()
+                    if signals[c].snr > 0
+                ]
+                sig_rows.extend((i, c, snr) for c, snr in snrs)
+                yield (
+                    key, key[0],
+                    np.nan if el is None else el,
+                    np.nan if az is None else az,
+                    len(snrs),
+                    max((snr for _, snr in snrs), default=0.0),
+                )
+
+        sats = np.fromiter(iter_sats(), dtype=SAT_SNAPSHOT_DTYPE, count=len(items))
+        sigs = np.array(sig_rows, dtype=SIG_SNAPSHOT_DTYPE)
+        return sats, sigs
+
+    @staticmethod
+    def _sat_signature(sat):
+        """
+        Compact signature of the values a satellite displays in the tables.
+
+        Used to decide whether the PRN's table rows need patching.
+        """
+        el = sat.elevation or 0
+        az = sat.azimuth or 0
+        return (
+            round(el, 1),
+            round(az, 1),
+            tuple(
+                (c, round(s.snr or 0.0, 1), round(s.pseudorange or 0, 3), round(s.phase or 0, 3))
+                for c in sat.sorted_codes()
+                for s in (sat.signals[c],) if s
+            ),
+        )
+
     def update_table(self):
         """
-        Update satellite observation table with current epoch data.
+        Update satellite observation tables with current epoch data.
         
         Procedure:
-        1. Create MD5 hash of current table data to detect changes
-        2. Skip update if data hasn't changed (optimization)
-        3. Populate table rows with satellite signals, applying system filters
-        4. Color-code SNR values: green (>40), red (<30), default otherwise
-        5. Maintain alternating row backgrounds for readability
-        6. Update dropdown list for analysis tab with visible satellites
-        
-        Performance: Skips redundant updates if data hash unchanged.
-        Threading: Snapshot copy for safe concurrent access.
+        1. Compute the row layout ((prn, code) per visible signal)
+        2. Return early if the layout is unchanged and no PRN was marked dirty
+        3. Build one structured array row per signal (system filter, zero SNR skipped)
+        4. Hand the array to the shared SatTableModel (one dataChanged or reset)
+        5. Update dropdown list for analysis tab with visible satellites
+        
+        Per-system sub-tables are filter proxies of the same model, so no
+        per-cell items are created; SNR colors and alternating backgrounds are
+        resolved by the model on paint.
         """
-        # Step 1: Create hash of current table data to detect actual changes
-        # This allows us to skip expensive table updates when data hasn't changed
-        import hashlib
-        satellites_snapshot = dict(self.merged_satellites)
-        
-        # Flatten satellite/signal data into hashable format
-        # This captures all parameters that would appear in the table
-        flat_rows = []
-        for key, sat in sorted(satellites_snapshot.items()):
-            el = getattr(sat, "el", getattr(sat, "elevation", 0)) or 0
-            az = getattr(sat, "az", getattr(sat, "azimuth", 0)) or 0
-            for code, sig in sorted(sat.signals.items()):
-                if not sig: 
-                    continue
-                flat_rows.append((
-                    key,
-                    round(el, 1),
-                    round(az, 1),
-                    code,
-                    round(getattr(sig, "snr", 0.0) or 0.0, 1),
-                    round(getattr(sig, "pseudorange", 0.0) or 0.0, 3),
-                    round(getattr(sig, "phase", 0.0) or 0.0, 3),
-                ))
-        # Compute MD5 hash to detect changes
-        data_hash = hashlib.md5(str(flat_rows).encode()).hexdigest()
-        
-        # Step 2: Skip update if data hasn't changed (first call excepted)
-        # This is critical for performance - prevents redrawing on every epoch
-        # even if no new/changed signals are received
-        if data_hash == self.last_table_data_hash and self.last_table_data_hash is not None:
+        # Satellites in PRN order; merged_satellites is only mutated on this (UI) thread
+        merged = self.merged_satellites
+        active = self.active_systems
+
+        # Step 1: Visible satellites with their valid signals, filtered once and
+        # reused for both the row layout and the row values
+        # Alternating background per satellite (all its signals share one shade)
+        visible = []    # (shade, key, sat, [(code, sig), ...])
+        for sat_counter, key in enumerate(self._sorted_prns):
+            if key[0] not in active:
+                continue
+            sat = merged[key]
+            signals = sat.signals
+            # Skip invalid/zero SNR signals
+            sigs = [(code, sig) for code in sat.sorted_codes() if (sig := signals[code]) and sig.snr != 0]
+            if sigs:
+                visible.append((sat_counter % 2, key, sat, sigs))
+
+        # Row layout of visible signals (only PRN/code identity, no values)
+        layout = tuple((key, code) for _, key, _, sigs in visible for code, _ in sigs)
+
+        # Step 2: Nothing changed since last refresh
+        dirty = self._dirty_prns
+        self._dirty_prns = set()
+        if layout == self._table_layout and not dirty:
             return
-        
-        # Step 3: Data has changed - update hash and rebuild table
-        self.last_table_data_hash = data_hash
-        
-        # Disable widget updates during batch operations for performance
-        # This prevents flicker and reduces CPU during table rebuild
-        for t in self.tables.values():
-            t.setUpdatesEnabled(False)
-        
+        self._table_layout = layout
+
+        # Step 3: Build structured array rows (plain tuples, no per-row containers)
+        sys_name_of = _SYS_NAMES.get
+
+        def iter_rows():
+            for shade, key, sat, sigs in visible:
+                sys_name = sys_name_of(key[0], key[0])
+                el = sat.elevation or 0
+                az = sat.azimuth or 0
+                for code, sig in sigs:
+                    yield (
+                        key, sys_name, el, az, code, sig.snr,
+                        sig.pseudorange or 0, sig.phase or 0, sig.doppler or 0,
+                        shade,
+                    )
+
+        arr = np.fromiter(iter_rows(), dtype=SAT_ROW_DTYPE, count=len(layout))
+
+        # Step 4: Single model update for all sub-tables; updates are suspended on
+        # the sub-tab container once so all views repaint together afterwards
+        self.sub_tabs.setUpdatesEnabled(False)
         try:
-            # Step 4: Prepare display data and color scheme
-            active_prns_in_view = []  # Build list of visible satellites for dropdown
-            sys_map = {'G': 'GPS', 'R': 'GLO', 'E': 'GAL', 'C': 'BDS', 'J': 'QZS', 'S': 'SBS'}
-            
-            # Alternating background colors for row pairs (visual grouping)
-            bg_colors = [QColor("#ffffff"), QColor("#b9b9b9")]
-
-            # Step 5: Clear all sub-tables before repopulating
-            for t in self.tables.values():
-                t.setRowCount(0)
-
-            # Sort satellites by key (PRN) for consistent ordering
-            sorted_sats = sorted(satellites_snapshot.items())
-
-            # Step 6: Populate table rows from sorted satellite list
-            sat_counter = 0  # Counter for alternating row colors per satellite
-            
-            for key, sat in sorted_sats:
-                sys_char = key[0]  # Extract constellation system from PRN
-                
-                # Extract position information
-                el = getattr(sat, "el", getattr(sat, "elevation", 0)) or 0
-                az = getattr(sat, "az", getattr(sat, "azimuth", 0)) or 0
-                
-                # Determine background color for this satellite's rows
-                current_bg = bg_colors[sat_counter % 2]
-                sat_counter += 1
-
-                # Iterate through all signals for this satellite
-                # Sort signal codes for consistent display (1C, 2W, 5Q, etc)
-                sorted_codes = sorted(sat.signals.keys())
-                
-                # Skip satellites with no valid signals
-                if not sorted_codes: 
-                    continue
-                
-                # Flag to prevent duplicate dropdown entries
-                added_to_dropdown = False
-
-                # Step 7: Generate one table row per signal code
-                # This allows multiple signals from same satellite on separate rows
-                for code in sorted_codes:
-                    sig = sat.signals[code]
-                    if not sig: 
-                        continue
-
-                    # Extract observation values
-                    snr = getattr(sig, 'snr', 0)
-                    if snr == 0: 
-                        continue  # Skip invalid/zero SNR signals
-                    doppler = getattr(sig, 'doppler', 0)
-                    
-                    # Get pseudorange and phase (may be None/zero if not available)
-                    pr = getattr(sig, 'pseudorange', 0)
-                    ph = getattr(sig, 'phase', 0)
-                    
-                    # Format as strings with appropriate precision
-                    pr_str = f"{pr:12.3f}" if pr else ""
-                    ph_str = f"{ph:12.3f}" if ph else ""
-                    
-                    # Step 8: Build row data for this signal
-                    row_items = [
-                        key,                            # PRN (satellite identifier)
-                        sys_map.get(sys_char, sys_char),# System name (GPS, GLO, GAL, etc)
-                        f"{el:.1f}",                    # Elevation angle [degrees]
-                        f"{az:.1f}",                    # Azimuth angle [degrees]
-                        code,                           # Signal code (1C, 5Q, 2W, etc)
-                        f"{snr:.1f}",                   # SNR [dB-Hz]
-                        pr_str,                         # Pseudorange [meters]
-                        ph_str,                         # Phase [cycles]
-                        f"{doppler:.3f}",               # Doppler [Hz]
-                    ]
-
-                    # Step 9: Add row to applicable tables based on constellation filter
-                    for tab_name, valid_systems in self.table_groups.items():
-                        # Check if satellite's system is in this tab's system list
-                        # (e.g., GPS satellites go in 'GPS' and 'ALL' tabs)
-                        if sys_char in valid_systems:
-                            # Only display if user checked this constellation
-                            if sys_char in self.active_systems:
-                                
-                                if not added_to_dropdown:
-                                    active_prns_in_view.append(key)
-                                    added_to_dropdown = True
-                                
-                                # Get table widget for this tab
-                                table = self.tables[tab_name]
-                                row_idx = table.rowCount()
-                                table.insertRow(row_idx)
-                                
-                                # Populate row cells with data and apply formatting
-                                for col_idx, val in enumerate(row_items):
-                                    item = QTableWidgetItem(str(val))
-                                    # Center-align all cells for consistency
-                                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                                    # Apply background color (alternating per satellite)
-                                    item.setBackground(current_bg)
-                                    
-                                    # Special formatting for SNR column
-                                    if col_idx == 5:  # SNR column index
-                                        # Color-code SNR: green (good >40), red (poor <30)
-                                        if snr > 40: 
-                                            item.setForeground(QColor("green"))
-                                        elif snr < 30: 
-                                            item.setForeground(QColor("red"))
-                                        # Bold font for emphasis
-                                        item.setFont(QFont("Arial", 9, QFont.Weight.Bold))
-                                    
-                                    # Place formatted item in table
-                                    table.setItem(row_idx, col_idx, item)
-
-            # Step 10: Update Analysis tab dropdown list with visible satellites
-            # Build sorted, deduplicated list of visible satellites
-            current_sel = self.combo_sat.currentText()
-            active_prns_in_view = sorted(list(set(active_prns_in_view)))
-            
-            # Update dropdown if list changed (avoid constant rebuilds)
-            if active_prns_in_view != self.current_sat_list:
-                self.current_sat_list = active_prns_in_view
-                self.combo_sat.blockSignals(True)  # Prevent spurious updates
-                self.combo_sat.clear()
-                self.combo_sat.addItems(active_prns_in_view)
-                # Restore previous selection if still valid
-                if current_sel in active_prns_in_view:
-                    self.combo_sat.setCurrentText(current_sel)
-                self.combo_sat.blockSignals(False)
+            self.sat_model.set_data(arr)
         finally:
-            # Re-enable widget updates after batch operations complete
-            # This triggers a single repaint instead of incremental redraws
-            for t in self.tables.values():
-                t.setUpdatesEnabled(True)
+            self.sub_tabs.setUpdatesEnabled(True)
+
+        # Step 5: Update Analysis tab dropdown list with visible satellites
+        # Update dropdown only if the set of PRNs changed (no sort or rebuild otherwise)
+        sat_set = frozenset(key for key, _ in layout)
+        if sat_set != self._sat_set:
+            self._sat_set = sat_set
+            # The dropdown is not needed to paint the tables: rebuild it after
+            # pending user input has been processed
+            if not self._sat_combo_pending:
+                self._sat_combo_pending = True
+                QTimer.singleShot(0, self._rebuild_sat_combo)
+
+    def _rebuild_sat_combo(self):
+        """Refill the Analysis satellite dropdown from the PRNs last shown in the tables."""
+        self._sat_combo_pending = False
+        active_prns_in_view = sorted(self._sat_set)
+        if active_prns_in_view == self.current_sat_list:
+            return
+        current_sel = self.combo_sat.currentText()
+        self.current_sat_list = active_prns_in_view
+        with QSignalBlocker(self.combo_sat):  # Prevent spurious updates
+            self.combo_sat.clear()
+            self.combo_sat.addItems(active_prns_in_view)
+            # Restore previous selection if still valid
+            if current_sel in active_prns_in_view:
+                self.combo_sat.setCurrentText(current_sel)
+
+    def _schedule_analysis_plot(self):
+        """Redraw the analysis plot for a selection change once pending events are processed."""
+        if not self._analysis_pending:
+            self._analysis_pending = True
+            QTimer.singleShot(0, self._run_analysis_plot)
+
+    def _run_analysis_plot(self):
+        self._analysis_pending = False
+        self.refresh_analysis_plot()
 
     def refresh_analysis_plot(self):
         prn = self.combo_sat.currentText()
         mode = self.combo_mode.currentText()
         if prn and mode:
-            data = list(self.sat_history[prn])
-            # Populate signal selector based on available signals for this satellite
-            try:
-                all_sigs = sorted({k for d in data for k in d.get('snr', {}).keys()})
-            except Exception:
-                all_sigs = []
-
-            # Update combo_sig only when its items differ to avoid resetting selection constantly
-            items = ["All"] + all_sigs
-            if items != self._sig_items:
+            times, els, snr = self.sat_history.arrays(prn)
+            # Populate signal selector based on signals present in the retained history
+            sig_set = frozenset(snr)
+
+            # Update combo_sig only when the signal set changed to avoid resetting selection constantly
+            if sig_set != self._sig_set:
+                items = ["All"] + sorted(sig_set)
                 cur = self.combo_sig.currentText()
-                self.combo_sig.blockSignals(True)
-                self.combo_sig.setUpdatesEnabled(False)
-                self.combo_sig.clear()
-                self.combo_sig.addItems(items)
-                if cur in items:
-                    self.combo_sig.setCurrentText(cur)
-                self.combo_sig.setUpdatesEnabled(True)
-                self.combo_sig.blockSignals(False)
-                self._sig_items = items
+                # Item changes only schedule update()s, which Qt coalesces into one paint
+                with QSignalBlocker(self.combo_sig):
+                    self.combo_sig.clear()
+                    self.combo_sig.addItems(items)
+                    if cur in items:
+                        self.combo_sig.setCurrentText(cur)
+                self._sig_set = sig_set
 
             sig = self.combo_sig.currentText() if self.combo_sig.count() else None
-            self.analysis_plot.update_plot(prn, data, mode, signal=(sig if sig != "All" else None))
+            self.analysis_plot.update_plot(prn, times, els, snr, mode, signal=(sig if sig != "All" else None))
 
     # ---- Logging Thread Management ----
     def open_log_settings_dialog(self):
@@ -950,7 +1106,8 @@ class MonitoringModule(QMainWindow):
             merged_satellites=self.merged_satellites,
             signals=self.signals,
             logging_buffer=self.logging_buffer_ref,
-            get_latest_epoch=lambda: self.latest_epoch_data
+            get_latest_epoch=lambda: self.latest_epoch_data,
+            merged_lock=self.merged_lock
         )
         self.logging_active = True
         self.logging_thread.start()
@@ -993,7 +1150,12 @@ class MonitoringModule(QMainWindow):
 
     # --- Config  ---
     def open_config_dialog(self):
-        dlg = ConfigDialog(self, self.settings)
+        # Build the dialog on first use and reset it in place on later opens
+        dlg = self._config_dialog
+        if dlg is None:
+            dlg = self._config_dialog = ConfigDialog(self, self.settings)
+        else:
+            dlg.reload(self.settings)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             self.settings = dlg.get_settings()
             self.restart_streams()
@@ -1029,9 +1191,11 @@ class MonitoringModule(QMainWindow):
                 t.stop()
             for t in self.processing_threads: 
                 t.stop()
-            # Wait for threads to exit (timeout 1 second per thread)
+            # Wait for threads to exit within one shared 1 second budget, so
+            # threads stopping in parallel don't add up their timeouts
+            deadline = time.monotonic() + 1.0
             for t in self.io_threads + self.processing_threads:
-                t.join(timeout=1.0)
+                t.join(timeout=max(0.0, deadline - time.monotonic()))
         
         # Step 2: Close all ring buffers
         # Closing signals buffer exhaustion, triggering thread cleanup
@@ -1055,9 +1219,16 @@ class MonitoringModule(QMainWindow):
 
         # Step 5: Clear satellite state cache
         # Prevents old data from one session appearing in the next
-        self.merged_satellites.clear()
-        self.sat_last_seen.clear()
+        with self.merged_lock:
+            self.merged_satellites.clear()
+        self.sat_last_seen.fill(np.nan)
+        self._slot_prns = [None] * _N_SAT_SLOTS
+        self._sorted_prns.clear()
         self.sat_history.clear()
+        self.epoch_ring.clear()
+        self._sat_sig_cache.clear()
+        self._dirty_prns.clear()
+        self._generation += 1
         self.signals.log_signal.emit("Cleared data cache")
         
         # Step 6: Use shared RTCMHandler instance
@@ -1094,7 +1265,7 @@ class MonitoringModule(QMainWindow):
             self.io_threads.append(io_thread)
             
             # Create DataProcessingThread: parses RTCM, emits epochs
-            proc_thread = DataProcessingThread("OBS", obs_buffer, self.handler, self.signals)
+            proc_thread = DataProcessingThread("OBS", obs_buffer, self.handler, self.signals, self.epoch_ring)
             proc_thread.start()
             self.processing_threads.append(proc_thread)
             self.signals.log_signal.emit("OBS stream threads started")
@@ -1131,7 +1302,7 @@ class MonitoringModule(QMainWindow):
                 
                 # Create DataProcessingThread for EPH stream
                 # Note: Both OBS and EPH threads use same handler, so ephemeris is merged
-                proc_thread = DataProcessingThread("EPH", eph_buffer, self.handler, self.signals)
+                proc_thread = DataProcessingThread("EPH", eph_buffer, self.handler, self.signals, self.epoch_ring)
                 proc_thread.start()
                 self.processing_threads.append(proc_thread)
                 self.signals.log_signal.emit("EPH stream threads started")
@@ -1146,33 +1317,32 @@ class MonitoringModule(QMainWindow):
     @Slot(str)
     def append_log(self, text):
         """
-        Append message to log display area.
+        Queue message for the log display area.
         
         Procedure:
         1. Prepend timestamp to log message
-        2. Append to log text area (QTextEdit)
-        3. Limit log lines to prevent unbounded memory growth
-        4. Remove oldest lines when exceeding max_log_lines threshold
+        2. Queue it and arm the flush timer if this is the first pending line;
+           _flush_log appends all queued lines 250ms later
         
-        Performance: Batch removes 100 lines at a time when limit exceeded.
+        Performance: Bursts of messages (e.g. stream reconnects) cost one
+        plain-text append and one repaint; the QPlainTextEdit block limit
+        trims old lines without Python-side pruning.
         """
-        # Step 1: Format log message with timestamp
-        log_text = f"[{datetime.now().strftime('%H:%M:%S')}] {text}"
-        # Step 2: Append to UI text area
-        self.log_area.append(log_text)
-        
-        # Step 3: Enforce maximum log line limit to prevent memory bloat
-        # Without this, thousands of epochs would accumulate in the QTextEdit
-        doc = self.log_area.document()
-        if doc.blockCount() > self.max_log_lines:
-            # Step 4: Delete oldest 100 lines (batch deletion for efficiency)
-            cursor = self.log_area.textCursor()
-            cursor.movePosition(cursor.MoveOperation.Start)  # Move to document start
-            # Select first 100 lines
-            for _ in range(100):
-                cursor.movePosition(cursor.MoveOperation.Down, cursor.MoveMode.KeepAnchor)
-            # Delete selected text
-            cursor.removeSelectedText()
+        # Step 1: Format log message with timestamp (strftime once per second)
+        sec = int(time.time())
+        if sec != self._log_sec:
+            self._log_sec = sec
+            self._log_prefix = datetime.fromtimestamp(sec).strftime('[%H:%M:%S] ')
+        # Step 2: Queue for the next batched append
+        self._log_queue.append(self._log_prefix + text)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+
+    def _flush_log(self):
+        """Append all queued log lines to the log area in one call."""
+        if self._log_queue:
+            self.log_area.appendPlainText("\n".join(self._log_queue))
+            self._log_queue.clear()
 
     @Slot(str, bool)
     def update_status(self, name, connected):
@@ -1183,17 +1353,30 @@ class MonitoringModule(QMainWindow):
         1. Select label based on stream name (OBS or EPH)
         2. Update label text with connection state (ON/OFF)
         3. Apply color coding: green for connected, red for disconnected
-        4. Update stylesheet to display new status
+        4. Update stylesheet to display new status (only if it changed, since
+           Qt re-parses and re-polishes on every setStyleSheet)
         """
         # Step 1: Choose label to update
         lbl = self.lbl_status_obs if name == "OBS" else self.lbl_status_eph
         
-        # Step 2: Select color based on connection state
-        color = "#2A692D" if connected else "#6D2F2B"  # Green if ON, Red if OFF
+        # Step 2: Select preallocated stylesheet based on connection state
+        style = _STATUS_STYLE_ON if connected else _STATUS_STYLE_OFF  # Green if ON, Red if OFF
         
         # Step 3: Update label text and styling
         lbl.setText(f"{name}: {'ON' if connected else 'OFF'}")
-        lbl.setStyleSheet(f"background-color: {color}; color: white; padding: 4px 8px; border-radius: 4px; font-weight: bold;")
+        if lbl.styleSheet() != style:
+            lbl.setStyleSheet(style)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Widgets were not refreshed while hidden
+        QTimer.singleShot(0, self.refresh_all_widgets)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            # Restored from minimized: catch up on skipped refreshes
+            QTimer.singleShot(0, self.refresh_all_widgets)
 
     def on_back_to_launcher(self):
         """
@@ -1233,13 +1416,13 @@ class MonitoringModule(QMainWindow):
         for rb in self.ring_buffers.values():
             rb.close()
         
-        # Step 5: Cancel background cleanup timer
-        if hasattr(self, 'cleanup_timer'): 
-            self.cleanup_timer.cancel()
+        # Step 5: Stop background cleanup timer
+        if hasattr(self, 'cleanup_qtimer'): 
+            self.cleanup_qtimer.stop()
         
-        # Step 6: Stop GUI update timer
-        if hasattr(self, 'gui_update_timer'): 
-            self.gui_update_timer.stop()
+        # Step 6: Stop log flush timer
+        if hasattr(self, 'log_flush_timer'): 
+            self.log_flush_timer.stop()
         
         # Step 7: Accept close event (proceed with window closure)
         event.accept()
\ No newline at end of file
@@ -1,5 +1,4 @@
 # ui/dialogs.py
-import importlib.util
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QGroupBox, QFormLayout, 
                              QLineEdit, QCheckBox, QHBoxLayout, QPushButton, 
                              QFileDialog, QMessageBox, QStyle, QComboBox, QLabel,
@@ -76,7 +75,7 @@ class ConfigDialog(QDialog):
         # =====================================================================
         self.chk_eph = QCheckBox("Enable Ephemeris Stream (EPH)")
         self.chk_eph.setChecked(self.settings.get('EPH_ENABLED', False))
-        self.chk_eph.stateChanged.connect(self.on_eph_enabled_changed)
+        self.chk_eph.toggled.connect(self.on_eph_enabled_changed)
         layout.addWidget(self.chk_eph)
         
         grp_eph = QGroupBox("Ephemeris Stream (EPH)")
@@ -207,6 +206,7 @@ class ConfigDialog(QDialog):
             return ["COM1", "COM2", "COM3"]
 
     def load_file(self):
+        import importlib.util  # Only needed when a config file is loaded
         f, _ = QFileDialog.getOpenFileName(self, "Select Config", "", "Python (*.py)")
         if f:
             try:
@@ -1,20 +1,48 @@
 """
 GNSS Positioning Module - Real-time SPP/PPP/RTK positioning and visualization.
+
+Public classes are imported on first access (PEP 562), so importing a single
+submodule such as positioning_config_dialog does not pull in the workers and
+the Matplotlib-based widgets.
 """
+import importlib
 
-from ui.positioning.workers import PositioningThread, PositioningSignals
-from ui.positioning.widgets import (
-    PositionMapWidget,
-    PositionInfoWidget,
-    AccuracyWidget,
-    ResidualWidget,
-)
+# {public name: defining submodule}
+_LAZY = {
+    "PositioningThread": "ui.positioning.workers",
+    "PositioningSignals": "ui.positioning.workers",
+    "PositionMapWidget": "ui.positioning.widgets",
+    "PositionMapWidgetWeb": "ui.positioning.widgets",
+    "create_position_map": "ui.positioning.widgets",
+    "PositionInfoWidget": "ui.positioning.widgets",
+    "AccuracyWidget": "ui.positioning.widgets",
+    "ResidualWidget": "ui.positioning.widgets",
+    "PositioningConfigDialog": "ui.positioning.positioning_config_dialog",
+    "PositionHistoryModel": "ui.positioning.table_model",
+}
 
 __all__ = [
     "PositioningThread",
     "PositioningSignals",
     "PositionMapWidget",
+    "PositionMapWidgetWeb",
+    "create_position_map",
     "PositionInfoWidget",
     "AccuracyWidget",
     "ResidualWidget",
+    "PositioningConfigDialog",
+    "PositionHistoryModel",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
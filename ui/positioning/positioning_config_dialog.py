@@ -2,10 +2,21 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QHBoxLayout, QLabel,
     QDoubleSpinBox, QComboBox, QSpinBox, QPushButton, QSizePolicy
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker, Slot
 from core.global_config import update_positioning_settings, get_positioning_settings
 
 
+def _spin_box(cls, lo, hi, value, step=None):
+    """Create a QSpinBox/QDoubleSpinBox with its initial value set without emitting valueChanged."""
+    spin = cls()
+    spin.setRange(lo, hi)
+    if step is not None:
+        spin.setSingleStep(step)
+    with QSignalBlocker(spin):
+        spin.setValue(value)
+    return spin
+
+
 class PositioningConfigDialog(QDialog):
     """Dialog to configure positioning (SPP) parameters."""
 
@@ -14,22 +25,19 @@ class PositioningConfigDialog(QDialog):
         self.setWindowTitle("Positioning Settings")
         self.setMinimumWidth(380)
 
-        self.settings = get_positioning_settings().copy()
+        # Read-only here; the global dict is only updated from the UI thread (on_accept)
+        self.settings = get_positioning_settings()
 
         layout = QVBoxLayout(self)
         form = QFormLayout()
 
         # Cutoff elevation (degrees)
-        self.cutoff_spin = QDoubleSpinBox()
-        self.cutoff_spin.setRange(0.0, 90.0)
-        self.cutoff_spin.setValue(float(self.settings.get('cutoff_elevation_deg', 10.0)))
-        self.cutoff_spin.setSingleStep(0.5)
+        self.cutoff_spin = _spin_box(
+            QDoubleSpinBox, 0.0, 90.0, float(self.settings.get('cutoff_elevation_deg', 10.0)), 0.5)
         form.addRow("Cutoff Elevation (deg):", self.cutoff_spin)
 
         # Minimum satellites
-        self.min_sats_spin = QSpinBox()
-        self.min_sats_spin.setRange(2, 12)
-        self.min_sats_spin.setValue(int(self.settings.get('min_satellites', 4)))
+        self.min_sats_spin = _spin_box(QSpinBox, 2, 12, int(self.settings.get('min_satellites', 4)))
         form.addRow("Minimum Satellites:", self.min_sats_spin)
 
         # Weight mode
@@ -39,48 +47,54 @@ class PositioningConfigDialog(QDialog):
         form.addRow("Weight Mode:", self.weight_mode)
 
         # Random walk (m/sqrt(s)) - optional
-        self.random_walk = QDoubleSpinBox()
-        self.random_walk.setRange(0.0, 100.0)
-        self.random_walk.setValue(float(self.settings.get('random_walk', 0.0)))
-        self.random_walk.setSingleStep(0.1)
+        self.random_walk = _spin_box(
+            QDoubleSpinBox, 0.0, 100.0, float(self.settings.get('random_walk', 0.0)), 0.1)
         form.addRow("Random Walk:", self.random_walk)
 
         # Smoothing window (epochs)
-        self.smoothing_window = QSpinBox()
-        self.smoothing_window.setRange(0, 1000)
-        self.smoothing_window.setValue(int(self.settings.get('smoothing_window', 0)))
+        self.smoothing_window = _spin_box(QSpinBox, 0, 1000, int(self.settings.get('smoothing_window', 0)))
         form.addRow("Smoothing Window (epochs):", self.smoothing_window)
 
         layout.addLayout(form)
 
+        # (settings key, value getter, type) for every form field
+        self._fields = (
+            ('cutoff_elevation_deg', self.cutoff_spin.value, float),
+            ('min_satellites', self.min_sats_spin.value, int),
+            ('weight_mode', self.weight_mode.currentText, str),
+            ('random_walk', self.random_walk.value, float),
+            ('smoothing_window', self.smoothing_window.value, int),
+        )
+        self._accepted = None  # Parameters saved by on_accept
+
         # Buttons
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
         btn_ok = QPushButton("Save")
         btn_ok.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
-        btn_ok.clicked.connect(self.on_accept)
         btn_cancel = QPushButton("Cancel")
-        btn_cancel.clicked.connect(self.reject)
+        self._connect_buttons(btn_ok, btn_cancel)
         btn_layout.addWidget(btn_cancel)
         btn_layout.addWidget(btn_ok)
         layout.addLayout(btn_layout)
 
+    def _connect_buttons(self, btn_ok, btn_cancel):
+        """Connect the dialog buttons to bound slots (no lambdas, so Qt calls the slots directly)."""
+        btn_ok.clicked.connect(self.on_accept)
+        btn_cancel.clicked.connect(self.reject)
+
+    def _collect(self) -> dict:
+        """Read the current parameter values from the form."""
+        return {key: cast(read()) for key, read, cast in self._fields}
+
+    @Slot()
     def on_accept(self):
-        params = {
-            'cutoff_elevation_deg': float(self.cutoff_spin.value()),
-            'min_satellites': int(self.min_sats_spin.value()),
-            'weight_mode': self.weight_mode.currentText(),
-            'random_walk': float(self.random_walk.value()),
-            'smoothing_window': int(self.smoothing_window.value()),
-        }
-        update_positioning_settings(params)
+        # Kept so get_settings() after exec() returns the saved values without re-reading the form
+        self._accepted = self._collect()
+        update_positioning_settings(self._accepted)
         self.accept()
 
     def get_settings(self):
-        return {
-            'cutoff_elevation_deg': float(self.cutoff_spin.value()),
-            'min_satellites': int(self.min_sats_spin.value()),
-            'weight_mode': self.weight_mode.currentText(),
-            'random_walk': float(self.random_walk.value()),
-            'smoothing_window': int(self.smoothing_window.value()),
-        }
+        if self._accepted is not None:
+            return dict(self._accepted)
+        return self._collect()
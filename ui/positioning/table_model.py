@@ -0,0 +1,119 @@
+"""
+Table model for the positioning History tab.
+
+The last solutions are kept as pre-formatted rows in a bounded deque owned by
+PositionHistoryModel (newest first) and served to a QTableView, so a new
+solution is one row insert instead of seven QTableWidgetItems plus a shift of
+every existing row.
+"""
+from collections import deque
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QFont, QBrush
+
+
+HISTORY_HEADERS = ["Time", "Lat (°)", "Lon (°)", "Height (m)", "HDOP", "Sats", "Status"]
+
+_STATUS_COL = 6
+_MAX_ROWS = 100
+
+
+def _status_class(status_text):
+    """Map a status text to a brush index: 0 (Fixed), 1 (Uncertain), 2 (other)."""
+    if "Fixed" in status_text:
+        return 0
+    if "Uncertain" in status_text:
+        return 1
+    return 2
+
+
+class PositionHistoryModel(QAbstractTableModel):
+    """
+    Read-only model over the last _MAX_ROWS solutions, newest in row 0.
+
+    Rows are formatted once when added; data() only indexes them and returns
+    the font and status brushes shared by all cells.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = deque(maxlen=_MAX_ROWS)    # (7 cell strings, status class)
+
+        # Formatting resources shared by all cells (no per-cell allocations)
+        self._font = QFont("Courier", 9)
+        # Indexed by _status_class(): Fixed, Uncertain, other
+        self._status_brushes = (QBrush(QColor("green")), QBrush(QColor("orange")), QBrush(QColor("red")))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HISTORY_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HISTORY_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        cells, status = self._rows[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return cells[index.column()]
+
+        if role == Qt.ItemDataRole.FontRole:
+            return self._font
+
+        # Color code status
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == _STATUS_COL:
+            return self._status_brushes[status]
+        return None
+
+    def add_solutions(self, solutions, time_text):
+        """
+        Add solutions at the top of the table.
+
+        Procedure:
+        1. Remove the oldest rows that the new ones push past _MAX_ROWS
+        2. Insert the new rows at the top as one range (newest first)
+
+        Args:
+            solutions: PositioningSolution objects, oldest first
+            time_text: Time column text for these solutions
+        """
+        new = [
+            ((
+                time_text,
+                f"{s.latitude:.6f}",
+                f"{s.longitude:.6f}",
+                f"{s.height:.2f}",
+                f"{s.hdop:.2f}",
+                str(s.num_satellites),
+                s.status.value,
+            ), _status_class(s.status.value))
+            for s in solutions[-_MAX_ROWS:]
+        ]
+        if not new:
+            return
+
+        # Step 1: Drop rows from the bottom
+        overflow = len(self._rows) + len(new) - _MAX_ROWS
+        if overflow > 0:
+            n = len(self._rows)
+            self.beginRemoveRows(QModelIndex(), n - overflow, n - 1)
+            for _ in range(overflow):
+                self._rows.pop()
+            self.endRemoveRows()
+
+        # Step 2: Insert at the top
+        self.beginInsertRows(QModelIndex(), 0, len(new) - 1)
+        self._rows.extendleft(new)
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all rows."""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
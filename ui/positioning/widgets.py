@@ -2,17 +2,220 @@
 Positioning module UI widgets - map and charts for position visualization.
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QDialog
+)
+from PySide6.QtCore import Qt, QTimer, QUrl
 from PySide6.QtGui import QColor, QFont
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+import matplotlib.patches as patches
 import numpy as np
+import json
+import os
+import tempfile
+import webbrowser
+from collections import deque
 from typing import List, Optional
 
+try:
+    from PySide6.QtWebEngineWidgets import QWebEngineView
+except Exception:   # QtWebEngine is an optional PySide6 component
+    QWebEngineView = None
 
-class PositionMapWidget(QWidget):
+
+# Widgets accept data at solution rate but repaint at most this often (5 Hz)
+_REDRAW_INTERVAL_MS = 200
+
+# Longer tracks are drawn decimated, except for the most recent points
+_MAX_TRACK_POINTS = 2000
+_TRACK_TAIL = 50
+
+# DOP/residual charts: epochs of history kept, and x-axis headroom so the
+# limits (and with them the blitted background) change only every _X_STEP epochs
+_HISTORY_EPOCHS = 300
+_X_STEP = 50
+
+# Shared by all PositionInfoWidget cells
+_FONT = QFont("Courier", 10)
+_COLORS = {'green': QColor('green'), 'orange': QColor('orange'), 'red': QColor('red')}
+
+# Leaflet page of PositionMapWidgetWeb. The track is one polyline that grows
+# with addLatLng(), so the cost of an update does not depend on track length.
+_LEAFLET_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css">
+<script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+<style>html, body, #map { height: 100%; margin: 0; }</style>
+</head>
+<body>
+<div id="map"></div>
+<script>
+var map = L.map('map').setView([0, 0], 2);
+L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
+    maxZoom: 19, attribution: '&copy; OpenStreetMap contributors'
+}).addTo(map);
+var line = L.polyline([], {color: 'blue', weight: 3, opacity: 0.7}).addTo(map);
+var marker = null, circle = null;
+
+window.addPoints = function (points, radius) {
+    points.forEach(function (p) { line.addLatLng(p); });
+    var last = points[points.length - 1];
+    if (marker === null) {
+        marker = L.circleMarker(last, {radius: 6, color: 'darkred', fillColor: 'red', fillOpacity: 1}).addTo(map);
+        circle = L.circle(last, {radius: radius, color: 'red', dashArray: '4', fill: false}).addTo(map);
+        map.setView(last, 17);
+    } else {
+        marker.setLatLng(last);
+        circle.setLatLng(last).setRadius(radius);
+        map.panTo(last);
+    }
+};
+
+window.clearTrack = function () {
+    line.setLatLngs([]);
+    if (marker !== null) {
+        map.removeLayer(marker);
+        map.removeLayer(circle);
+        marker = circle = null;
+    }
+};
+</script>
+</body>
+</html>
+"""
+
+
+class _BlitMixin:
+    """
+    Blitting for widgets owning self.figure, self.canvas and the list of
+    animated artists self._animated (call _init_blit() once they exist).
+    
+    Full draws leave the animated artists out; the background is cached after
+    each of them, so data updates only redraw the animated artists over it.
+    """
+    
+    def _init_blit(self):
+        # Background without the animated artists, cached after every full draw
+        self._bg = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def _on_draw(self, event):
+        """Cache the freshly drawn background and draw the animated artists over it."""
+        self._bg = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self._animated:
+            self.figure.draw_artist(artist)
+    
+    def _blit(self):
+        """Redraw only the animated artists over the cached background."""
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        for artist in self._animated:
+            self.figure.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+
+def _history_array(history: deque) -> np.ndarray:
+    """Copy a history deque into a float64 array."""
+    return np.fromiter(history, dtype=np.float64, count=len(history))
+
+
+def _chart_limits_fit(ax, x, lo, hi) -> bool:
+    """Whether epochs x and the value range [lo, hi] lie within the current limits."""
+    x0, x1 = ax.get_xlim()
+    y0, y1 = ax.get_ylim()
+    return x0 <= x[0] and x[-1] <= x1 and y0 <= lo and hi <= y1
+
+
+def _set_chart_limits(ax, x, lo, hi):
+    """
+    Fit the limits of a history chart to epochs x and the value range [lo, hi].
+    
+    The x range leaves room for the next _X_STEP epochs and the y range gets a
+    5% margin, so the following updates usually fit and can be blitted.
+    """
+    start = x[0] if len(x) else 0
+    ax.set_xlim(start, start + _HISTORY_EPOCHS + _X_STEP)
+    if not (len(x) and np.isfinite(lo) and np.isfinite(hi)):
+        lo, hi = 0.0, 1.0
+    margin = 0.05 * (hi - lo) or 0.5
+    ax.set_ylim(lo - margin, hi + margin)
+
+
+# folium module, imported on first export (False when not installed)
+_FOLIUM = None
+
+
+def _get_folium():
+    """Return the folium module, or None if it is not installed (import tried once)."""
+    global _FOLIUM
+    if _FOLIUM is None:
+        try:
+            import folium
+            _FOLIUM = folium
+        except Exception:
+            _FOLIUM = False
+    return _FOLIUM or None
+
+
+def _simplify_track(lats: np.ndarray, lons: np.ndarray, eps_deg: float = 1e-5) -> np.ndarray:
+    """
+    Simplify a track with the Ramer-Douglas-Peucker algorithm.
+    
+    Procedure:
+    1. Start with the segment between the first and last point
+    2. Find the point of the segment's span farthest from the chord
+    3. Keep it and split the span there if it deviates more than eps_deg,
+       otherwise drop all points of the span
+    
+    Args:
+        lats: Latitudes (degrees)
+        lons: Longitudes (degrees)
+        eps_deg: Maximum deviation of dropped points (1e-5 deg ≈ 1 m)
+    
+    Returns:
+        (m, 2) array of the kept [lat, lon] points, in track order.
+    """
+    n = len(lats)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, n - 1]] = True
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        dy, dx = lats[j] - lats[i], lons[j] - lons[i]
+        py, px = lats[i + 1:j] - lats[i], lons[i + 1:j] - lons[i]
+        chord = np.hypot(dx, dy)
+        if chord > 0:
+            dist = np.abs(dx * py - dy * px) / chord
+        else:
+            dist = np.hypot(px, py)
+        k = int(np.argmax(dist))
+        if dist[k] > eps_deg:
+            mid = i + 1 + k
+            keep[mid] = True
+            stack.append((i, mid))
+            stack.append((mid, j))
+    return np.column_stack((lats[keep], lons[keep]))
+
+
+def _uncertainty_m(hdop: float) -> float:
+    """Radius [m] of the horizontal uncertainty circle drawn for hdop."""
+    # hdop may be unitless (typical DOP) or already in meters.
+    # If hdop looks small (<50) treat as unitless and assume sigma_range~1m.
+    if hdop < 50:
+        sigma_range_m = 1.0
+        return hdop * sigma_range_m
+    # If large, treat hdop as meters directly
+    return hdop
+
+
+class PositionMapWidget(_BlitMixin, QWidget):
     """
     Real-time position map display using matplotlib.
     
@@ -39,76 +242,78 @@ class PositionMapWidget(QWidget):
         self.ax.set_title("GNSS Position Map")
         self.ax.grid(True, alpha=0.3, linestyle='--')
         
-        # Data storage
-        self.lats = []
-        self.lons = []
-        self.first_update = True
+        # Data storage: preallocated coordinate arrays, the first _n entries valid
+        # (capacity doubles when full)
+        self._cap = 1024
+        self._lats = np.empty(self._cap)
+        self._lons = np.empty(self._cap)
+        self._n = 0
+        self._drawn_n = 0   # Samples shown by the last redraw
+        # Track state and path of the last folium export (reused while unchanged)
+        self._last_export_key = None
+        self._last_export_path = None
+        self._hdop = 0.0    # HDOP of the latest sample
+        
+        # Persistent artists, updated in place each epoch. They are animated
+        # (left out of full draws) and blitted over the cached background.
+        self._track_line, = self.ax.plot([], [], 'b-', alpha=0.6, linewidth=1.5, label='Track',
+                                         animated=True)
+        self._hist_scatter = self.ax.scatter([], [], c='blue', s=15, animated=True)
+        # Per-point RGBA of the history points: blue, alpha rewritten per redraw
+        self._hist_rgba = np.zeros((_TRACK_TAIL, 4))
+        self._hist_rgba[:, 2] = 1.0
+        self._current = self.ax.scatter([], [], c='red', s=200, marker='*', label='Current',
+                                        zorder=10, edgecolors='darkred', linewidth=1, animated=True)
+        self._unc_circle = patches.Circle((0, 0), 0, fill=False, color='red', linestyle='--',
+                                          alpha=0.6, linewidth=1.5, animated=True, visible=False)
+        self.ax.add_patch(self._unc_circle)
+        # Current coordinates (in the axes, so blitting updates them with the data)
+        self._pos_text = self.ax.text(0.01, 0.99, "", transform=self.ax.transAxes, va='top',
+                                      fontsize=9, animated=True)
+        self._animated = [self._track_line, self._hist_scatter, self._current,
+                          self._unc_circle, self._pos_text]
+        self.ax.legend(loc='upper right', fontsize=9)
+        self._init_blit()
         
         self.figure.tight_layout()
+        
+        # Redraw timer: positions arriving between ticks are drawn together
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start(_REDRAW_INTERVAL_MS)
     
-    def update_track(self, latitude: float, longitude: float, hdop: float = 0.0):
+    def _track_xy(self, n):
         """
-        Update position on map with actual geographic coordinates.
+        Return the (lons, lats) of the first n positions as drawn by the track line.
         
-        Args:
-            latitude: Current latitude (degrees)
-            longitude: Current longitude (degrees)
-            hdop: Horizontal DOP for uncertainty circle
+        Up to _MAX_TRACK_POINTS positions are returned as array views. Beyond
+        that older positions are strided down to about _MAX_TRACK_POINTS, so
+        the stroke cost stays bounded, while the last _TRACK_TAIL positions are
+        kept at full resolution. The stored track itself is never decimated.
         """
-        self.lats.append(latitude)
-        self.lons.append(longitude)
-        
-        # Update plot
-        self.ax.clear()
-        self.ax.set_xlabel("Longitude (°E)")
-        self.ax.set_ylabel("Latitude (°N)")
-        self.ax.set_title(f"GNSS Position Map - Current: ({longitude:.6f}°E, {latitude:.6f}°N)")
-        self.ax.grid(True, alpha=0.3, linestyle='--')
-        
-        # Plot track line
-        if len(self.lons) > 1:
-            self.ax.plot(self.lons[:-1], self.lats[:-1], 'b-', alpha=0.6, linewidth=1.5, label='Track')
-        
-        # Plot history points (fade effect)
-        if len(self.lons) > 1:
-            # Color gradient from old to new
-            start_idx = max(0, len(self.lons) - 50)
-            denom = max(1, (len(self.lons) - 1) - start_idx)
-            for i in range(start_idx, len(self.lons) - 1):
-                # Safely compute alpha in [0.0, 1.0]
-                rel = (i - start_idx) / denom
-                alpha = 0.3 + 0.7 * rel
-                alpha = max(0.0, min(1.0, alpha))
-                self.ax.scatter(self.lons[i], self.lats[i], c='blue', s=15, alpha=alpha)
-        
-        # Plot current position with large marker
-        if len(self.lons) > 0:
-            self.ax.scatter(self.lons[-1], self.lats[-1], c='red', s=200, 
-                          marker='*', label=f'Current', zorder=10, edgecolors='darkred', linewidth=1)
-        
-        # Add uncertainty circle
-        if hdop > 0 and len(self.lons) > 0:
-            # hdop may be unitless (typical DOP) or already in meters.
-            # If hdop looks small (<50) treat as unitless and assume sigma_range~1m.
-            if hdop < 50:
-                sigma_range_m = 1.0
-                uncertainty_m = hdop * sigma_range_m
-            else:
-                # If large, treat hdop as meters directly
-                uncertainty_m = hdop
-
-            # Convert meters to degrees approximation (1 deg ≈ 111000 m)
-            uncertainty_deg = uncertainty_m / 111000.0
-
-            import matplotlib.patches as patches
-            circle = patches.Circle((self.lons[-1], self.lats[-1]), uncertainty_deg, 
-                                   fill=False, color='red', linestyle='--', alpha=0.6, linewidth=1.5)
-            self.ax.add_patch(circle)
-        
-        # Auto-scale with margin
-        if len(self.lons) > 1:
-            lon_min, lon_max = min(self.lons), max(self.lons)
-            lat_min, lat_max = min(self.lats), max(self.lats)
+        if n <= _MAX_TRACK_POINTS:
+            return self._lons[:n], self._lats[:n]
+        stride = n // _MAX_TRACK_POINTS
+        head = n - _TRACK_TAIL
+        return (np.concatenate((self._lons[:head:stride], self._lons[head:n])),
+                np.concatenate((self._lats[:head:stride], self._lats[head:n])))
+    
+    @property
+    def lats(self):
+        """Latitudes of the track (view of the valid samples)."""
+        return self._lats[:self._n]
+    
+    @property
+    def lons(self):
+        """Longitudes of the track (view of the valid samples)."""
+        return self._lons[:self._n]
+    
+    def _rescale(self):
+        """Fit the axis limits to the track with a margin."""
+        lons, lats = self.lons, self.lats
+        if self._n > 1:
+            lon_min, lon_max = lons.min(), lons.max()
+            lat_min, lat_max = lats.min(), lats.max()
             
             # Add margin (0.1% of range or minimum 0.0005 degrees)
             lon_range = max(lon_max - lon_min, 0.001)
@@ -118,57 +323,139 @@ class PositionMapWidget(QWidget):
             
             self.ax.set_xlim(lon_min - margin_lon, lon_max + margin_lon)
             self.ax.set_ylim(lat_min - margin_lat, lat_max + margin_lat)
-        elif len(self.lons) == 1:
+        elif self._n == 1:
             # Single point - show a reasonable view
-            self.ax.set_xlim(self.lons[0] - 0.01, self.lons[0] + 0.01)
-            self.ax.set_ylim(self.lats[0] - 0.01, self.lats[0] + 0.01)
+            self.ax.set_xlim(lons[0] - 0.01, lons[0] + 0.01)
+            self.ax.set_ylim(lats[0] - 0.01, lats[0] + 0.01)
+    
+    def update_track(self, latitude: float, longitude: float, hdop: float = 0.0):
+        """
+        Add a position with actual geographic coordinates to the track.
         
-        self.ax.legend(loc='upper right', fontsize=9)
-        self.figure.tight_layout()
-        self.canvas.draw()
+        The map itself is redrawn by the redraw timer, so bursts of positions
+        cost one redraw.
+        
+        Args:
+            latitude: Current latitude (degrees)
+            longitude: Current longitude (degrees)
+            hdop: Horizontal DOP for uncertainty circle
+        """
+        if self._n == self._cap:
+            self._cap *= 2
+            self._lats = np.resize(self._lats, self._cap)
+            self._lons = np.resize(self._lons, self._cap)
+        self._lats[self._n] = latitude
+        self._lons[self._n] = longitude
+        self._n += 1
+        self._hdop = hdop
+    
+    def _flush(self):
+        """Redraw if positions arrived since the last redraw."""
+        if self._n != self._drawn_n:
+            self._redraw()
+    
+    def _redraw(self):
+        """
+        Show the track up to the latest position.
+        
+        Procedure:
+        1. Update the persistent track, history, marker and circle artists in place
+        2. Rescale and fully redraw only if a new position left the current view
+           (or nothing was drawn yet); otherwise blit the artists
+        """
+        n = self._n
+        latitude = self._lats[n - 1]
+        longitude = self._lons[n - 1]
+        hdop = self._hdop
+        new_lons = self._lons[self._drawn_n:n]
+        new_lats = self._lats[self._drawn_n:n]
+        self._drawn_n = n
+        
+        # Step 1: Track line (up to the previous position)
+        self._track_line.set_data(*self._track_xy(n - 1))
+        
+        # History points with fade effect from old to new (last 50 before the current one)
+        start_idx = max(0, n - 1 - _TRACK_TAIL)
+        hist = np.column_stack((self._lons[start_idx:n - 1], self._lats[start_idx:n - 1]))
+        self._hist_scatter.set_offsets(hist if len(hist) else np.empty((0, 2)))
+        if len(hist):
+            rgba = self._hist_rgba[:len(hist)]
+            rgba[:, 3] = np.linspace(0.3, 1.0, len(hist))
+            self._hist_scatter.set_facecolors(rgba)
+        
+        # Current position with large marker
+        self._current.set_offsets([[longitude, latitude]])
+        self._pos_text.set_text(f"Current: ({longitude:.6f}°E, {latitude:.6f}°N)")
+        
+        # Uncertainty circle
+        if hdop > 0:
+            # Convert meters to degrees approximation (1 deg ≈ 111000 m)
+            self._unc_circle.set_center((longitude, latitude))
+            self._unc_circle.set_radius(_uncertainty_m(hdop) / 111000.0)
+        self._unc_circle.set_visible(hdop > 0)
+        
+        # Step 2: Full redraw when the view must change, blit otherwise
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        inside = (x0 <= new_lons.min() and new_lons.max() <= x1
+                  and y0 <= new_lats.min() and new_lats.max() <= y1)
+        if self._bg is None or not inside or n <= 2:
+            self._rescale()
+            self.figure.tight_layout()
+            self.canvas.draw_idle()
+        else:
+            self._blit()
     
     def clear_track(self):
         """Clear the position track."""
-        self.lats.clear()
-        self.lons.clear()
-        self.ax.clear()
-        self.ax.set_xlabel("Longitude (°E)")
-        self.ax.set_ylabel("Latitude (°N)")
-        self.ax.set_title("GNSS Position Map")
-        self.ax.grid(True, alpha=0.3, linestyle='--')
-        self.canvas.draw()
+        self._n = 0
+        self._drawn_n = 0
+        self._last_export_key = None
+        self._track_line.set_data([], [])
+        self._hist_scatter.set_offsets(np.empty((0, 2)))
+        self._current.set_offsets(np.empty((0, 2)))
+        self._unc_circle.set_visible(False)
+        self._pos_text.set_text("")
+        self.canvas.draw_idle()
 
     def export_to_folium(self, filename: Optional[str] = None):
         """Export current track to a folium HTML map. Returns path to HTML or None.
 
-        Falls back gracefully if folium not installed.
+        Falls back gracefully if folium not installed. The previous export is
+        returned as is while the track and filename are unchanged.
         """
-        try:
-            import folium
-        except Exception:
+        folium = _get_folium()
+        if folium is None:
             return None
 
-        if len(self.lats) == 0:
+        if self._n == 0:
             return None
 
+        key = (self._n, self._lats[self._n - 1], self._lons[self._n - 1], filename)
+        if (key == self._last_export_key and self._last_export_path
+                and os.path.exists(self._last_export_path)):
+            return self._last_export_path
+
         center = (self.lats[-1], self.lons[-1])
         fmap = folium.Map(location=center, zoom_start=15)
 
-        # Add track polyline
-        coords = list(zip(self.lats, self.lons))
+        # Add track polyline (simplified: long tracks would otherwise put every
+        # epoch into the HTML)
+        coords = _simplify_track(self.lats, self.lons).tolist()
         folium.PolyLine(coords, color='blue', weight=3, opacity=0.7).add_to(fmap)
 
         # Add current marker
         folium.Marker(location=center, icon=folium.Icon(color='red', icon='star')).add_to(fmap)
 
-        import tempfile, os
         if filename is None:
             tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.html')
             filename = tmp.name
             tmp.close()
 
         fmap.save(filename)
-        return os.path.abspath(filename)
+        self._last_export_key = key
+        self._last_export_path = os.path.abspath(filename)
+        return self._last_export_path
 
     def show_in_browser(self):
         """Try to show exported folium map in a QWebEngineView dialog; fallback to default browser."""
@@ -176,24 +463,145 @@ class PositionMapWidget(QWidget):
         if not html_path:
             return False
 
-        # Try to open with QWebEngineView
-        try:
-            from PySide6.QtWebEngineWidgets import QWebEngineView
-            from PySide6.QtWidgets import QDialog, QVBoxLayout
-
+        # Open with QWebEngineView when available
+        if QWebEngineView is not None:
             dlg = QDialog()
             dlg.setWindowTitle('Position Map')
             layout = QVBoxLayout(dlg)
             view = QWebEngineView()
-            view.load('file:///' + html_path.replace('\\', '/'))
+            view.load(QUrl.fromLocalFile(html_path))
             layout.addWidget(view)
             dlg.resize(900, 700)
             dlg.exec()
             return True
-        except Exception:
-            import webbrowser
-            webbrowser.open('file://' + html_path)
-            return True
+
+        webbrowser.open(QUrl.fromLocalFile(html_path).toString())
+        return True
+
+
+class PositionMapWidgetWeb(QWidget):
+    """
+    Position track on a Leaflet map in a QWebEngineView (requires QtWebEngine).
+    
+    The page is loaded once and keeps the track; positions are pushed to it
+    through runJavaScript(), batched per redraw tick. Map rendering happens in
+    the browser engine (GPU composited), so long sessions cost no more per
+    update than short ones. Map tiles and Leaflet are fetched from the network;
+    if Leaflet cannot be loaded (e.g. offline), the widget replaces the page
+    with a Matplotlib PositionMapWidget and forwards positions to it.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self.view = QWebEngineView(self)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.view)
+        
+        # Positions not yet sent to the page (held until the page has loaded)
+        self._pending = []
+        self._hdop = 0.0
+        self._ready = False
+        # Offline replacement for the page (see _fall_back)
+        self._fallback = None
+        self.view.loadFinished.connect(self._on_load_finished)
+        self.view.setHtml(_LEAFLET_HTML, QUrl("https://unpkg.com/"))
+        
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start(_REDRAW_INTERVAL_MS)
+    
+    def _on_load_finished(self, ok):
+        """
+        Check that Leaflet itself loaded before sending positions.
+        
+        The page HTML loads even offline, so a successful load alone does not
+        mean the map scripts are usable.
+        """
+        if not ok:
+            self._fall_back()
+            return
+        self.view.page().runJavaScript("typeof L !== 'undefined'", 0, self._on_leaflet_checked)
+    
+    def _on_leaflet_checked(self, loaded):
+        if loaded is True:
+            self._ready = True
+        else:
+            self._fall_back()
+    
+    def _fall_back(self):
+        """
+        Replace the web view with a Matplotlib PositionMapWidget.
+        
+        Procedure:
+        1. Stop the page flush timer and remove the web view
+        2. Add a PositionMapWidget in its place
+        3. Replay the positions that were waiting for the page
+        """
+        if self._fallback is not None:
+            return
+        # Step 1: Drop the web view
+        self._ready = False
+        self._flush_timer.stop()
+        self.layout().removeWidget(self.view)
+        self.view.deleteLater()
+        
+        # Step 2: Matplotlib map in its place
+        self._fallback = PositionMapWidget(self)
+        self.layout().addWidget(self._fallback)
+        
+        # Step 3: Positions received before the page failed
+        for lat, lon in self._pending:
+            self._fallback.update_track(lat, lon, self._hdop)
+        self._pending.clear()
+    
+    def update_track(self, latitude: float, longitude: float, hdop: float = 0.0):
+        """
+        Add a position to the track (sent to the page on the next redraw tick).
+        
+        Args:
+            latitude: Current latitude (degrees)
+            longitude: Current longitude (degrees)
+            hdop: Horizontal DOP for uncertainty circle
+        """
+        if self._fallback is not None:
+            self._fallback.update_track(latitude, longitude, hdop)
+            return
+        self._pending.append((float(latitude), float(longitude)))
+        self._hdop = hdop
+    
+    def _flush(self):
+        """Send the positions added since the last tick in one script call."""
+        if not self._ready or not self._pending:
+            return
+        points = json.dumps(self._pending)
+        self._pending.clear()
+        radius = _uncertainty_m(self._hdop) if self._hdop > 0 else 0
+        self.view.page().runJavaScript(f"addPoints({points}, {radius})")
+    
+    def clear_track(self):
+        """Clear the position track."""
+        if self._fallback is not None:
+            self._fallback.clear_track()
+            return
+        self._pending.clear()
+        if self._ready:
+            self.view.page().runJavaScript("clearTrack()")
+
+
+def create_position_map(parent=None) -> QWidget:
+    """
+    Create the position track map.
+    
+    Returns:
+        PositionMapWidgetWeb when QtWebEngine is available (it falls back to a
+        Matplotlib map itself when Leaflet cannot be loaded), otherwise the
+        Matplotlib PositionMapWidget. Both provide update_track()/clear_track().
+    """
+    if QWebEngineView is not None:
+        return PositionMapWidgetWeb(parent)
+    return PositionMapWidget(parent)
 
 
 class PositionInfoWidget(QWidget):
@@ -231,24 +639,40 @@ class PositionInfoWidget(QWidget):
         
         self.table.setRowCount(len(parameters))
         self.parameter_rows = {}
+        self._value_items = {}  # {parameter: value cell}, updated in place
         
         for i, param in enumerate(parameters):
             self.parameter_rows[param] = i
             item = QTableWidgetItem(param)
-            item.setFont(QFont("Courier", 10))
+            item.setFont(_FONT)
             self.table.setItem(i, 0, item)
             
             value_item = QTableWidgetItem("--")
-            value_item.setFont(QFont("Courier", 10))
+            value_item.setFont(_FONT)
             self.table.setItem(i, 1, value_item)
+            self._value_items[param] = value_item
         
         layout.addWidget(self.table)
+        
+        # Only the latest solution is shown: keep it until the next redraw tick
+        self._pending = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start(_REDRAW_INTERVAL_MS)
     
     def update_solution(self, solution):
+        """Queue a new solution for display (shown on the next redraw tick)."""
+        if solution is not None:
+            self._pending = solution
+    
+    def _flush(self):
+        """Show the latest queued solution, if any."""
+        if self._pending is not None:
+            solution, self._pending = self._pending, None
+            self._apply(solution)
+    
+    def _apply(self, solution):
         """Update table with new solution."""
-        if solution is None:
-            return
-        
         updates = {
             "Latitude": f"{solution.latitude:.6f}°",
             "Longitude": f"{solution.longitude:.6f}°",
@@ -265,25 +689,28 @@ class PositionInfoWidget(QWidget):
             "Convergence": "Yes" if solution.convergence else "No",
         }
         
-        for param, value in updates.items():
-            if param in self.parameter_rows:
-                row = self.parameter_rows[param]
-                item = QTableWidgetItem(value)
-                item.setFont(QFont("Courier", 10))
+        # One repaint for the whole batch of cell changes
+        self.table.setUpdatesEnabled(False)
+        try:
+            for param, value in updates.items():
+                item = self._value_items.get(param)
+                if item is None:
+                    continue
+                item.setText(value)
                 
                 # Color code status
                 if param == "Solution Status":
                     if "Fixed" in value:
-                        item.setForeground(QColor("green"))
+                        item.setForeground(_COLORS['green'])
                     elif "Uncertain" in value:
-                        item.setForeground(QColor("orange"))
+                        item.setForeground(_COLORS['orange'])
                     else:
-                        item.setForeground(QColor("red"))
-                
-                self.table.setItem(row, 1, item)
+                        item.setForeground(_COLORS['red'])
+        finally:
+            self.table.setUpdatesEnabled(True)
 
 
-class AccuracyWidget(QWidget):
+class AccuracyWidget(_BlitMixin, QWidget):
     """
     Display accuracy metrics and DOP values.
     """
@@ -300,17 +727,36 @@ class AccuracyWidget(QWidget):
         
         layout.addWidget(self.canvas)
         
-        # Variables for plotting
+        # Variables for plotting (the last _HISTORY_EPOCHS epochs)
         self.dop_history = {
-            'HDOP': [],
-            'VDOP': [],
-            'PDOP': [],
-            'GDOP': [],
+            key: deque(maxlen=_HISTORY_EPOCHS) for key in ('HDOP', 'VDOP', 'PDOP', 'GDOP')
         }
         self.epochs = 0
+        
+        # Persistent animated lines, updated in place and blitted (axes
+        # decoration is set up once)
+        self._lines = {
+            key: self.ax_dop.plot([], [], label=key, color=color, animated=True)[0]
+            for key, color in (('HDOP', 'blue'), ('VDOP', 'red'), ('PDOP', 'green'))
+        }
+        self._animated = list(self._lines.values())
+        self.ax_dop.set_xlabel('Epoch')
+        self.ax_dop.set_ylabel('DOP Value')
+        self.ax_dop.set_title('Dilution of Precision (DOP) Over Time')
+        self.ax_dop.legend(loc='upper right')
+        self.ax_dop.grid(True, alpha=0.3)
+        _set_chart_limits(self.ax_dop, [], 0, 0)
+        self.figure.tight_layout()
+        self._init_blit()
+        
+        # History is recorded per solution, the plot redrawn at most once per tick
+        self._dirty = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start(_REDRAW_INTERVAL_MS)
     
     def update_solution(self, solution):
-        """Update DOP values and plot."""
+        """Record DOP values (plotted on the next redraw tick)."""
         if solution is None:
             return
         
@@ -319,40 +765,40 @@ class AccuracyWidget(QWidget):
         self.dop_history['VDOP'].append(solution.vdop)
         self.dop_history['PDOP'].append(solution.pdop)
         self.dop_history['GDOP'].append(solution.gdop)
-        
-        # Keep only last 300 epochs
-        for key in self.dop_history:
-            if len(self.dop_history[key]) > 300:
-                self.dop_history[key] = self.dop_history[key][-300:]
-        
-        # Update plot
-        self.ax_dop.clear()
-        
-        x = range(max(0, self.epochs - 300), self.epochs)
-        
-        if len(self.dop_history['HDOP']) > 0:
-            self.ax_dop.plot(x, self.dop_history['HDOP'], label='HDOP', color='blue')
-            self.ax_dop.plot(x, self.dop_history['VDOP'], label='VDOP', color='red')
-            self.ax_dop.plot(x, self.dop_history['PDOP'], label='PDOP', color='green')
-        
-        self.ax_dop.set_xlabel('Epoch')
-        self.ax_dop.set_ylabel('DOP Value')
-        self.ax_dop.set_title('Dilution of Precision (DOP) Over Time')
-        self.ax_dop.legend(loc='upper right')
-        self.ax_dop.grid(True, alpha=0.3)
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._dirty = True
+    
+    def _flush(self):
+        """Redraw if solutions were recorded since the last redraw."""
+        if self._dirty:
+            self._dirty = False
+            self._redraw()
+    
+    def _redraw(self):
+        """Plot the DOP history (blitted unless the limits must change)."""
+        x = np.arange(self.epochs - len(self.dop_history['HDOP']), self.epochs)
+        values = [_history_array(self.dop_history[key]) for key in self._lines]
+        for line, y in zip(self._lines.values(), values):
+            line.set_data(x, y)
+        
+        if len(x):
+            lo = min(np.nanmin(y) for y in values)
+            hi = max(np.nanmax(y) for y in values)
+        if len(x) and _chart_limits_fit(self.ax_dop, x, lo, hi):
+            self._blit()
+        else:
+            _set_chart_limits(self.ax_dop, x, *((lo, hi) if len(x) else (0, 0)))
+            self.canvas.draw_idle()
     
     def clear(self):
         """Clear history and plot."""
         for key in self.dop_history:
             self.dop_history[key].clear()
         self.epochs = 0
-        self.ax_dop.clear()
-        self.canvas.draw()
+        self._dirty = False
+        self._redraw()
 
 
-class ResidualWidget(QWidget):
+class ResidualWidget(_BlitMixin, QWidget):
     """
     Display pseudorange residuals statistics.
     """
@@ -369,14 +815,39 @@ class ResidualWidget(QWidget):
         
         layout.addWidget(self.canvas)
         
-        # Storage for history
-        self.residuals_mean_hist = []
-        self.residuals_std_hist = []
-        self.residuals_max_hist = []
+        # Storage for history (the last _HISTORY_EPOCHS epochs)
+        self.residuals_mean_hist = deque(maxlen=_HISTORY_EPOCHS)
+        self.residuals_std_hist = deque(maxlen=_HISTORY_EPOCHS)
+        self.residuals_max_hist = deque(maxlen=_HISTORY_EPOCHS)
         self.epochs = 0
+        
+        # Persistent animated lines, updated in place and blitted (axes
+        # decoration is set up once). The ±σ band has no in-place setter and
+        # is replaced on each redraw.
+        self._mean_line, = self.ax.plot([], [], label='Mean', color='blue', animated=True)
+        self._fill = self.ax.fill_between([], [], [], alpha=0.3, color='blue', label='±σ',
+                                          animated=True)
+        self._max_line, = self.ax.plot([], [], label='Max', color='red', linestyle='--',
+                                       animated=True)
+        self._animated = [self._mean_line, self._fill, self._max_line]
+        self.ax.set_xlabel('Epoch')
+        self.ax.set_ylabel('Residual (m)')
+        self.ax.set_title('Pseudorange Residuals Statistics')
+        self.ax.legend(loc='upper right')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
+        _set_chart_limits(self.ax, [], 0, 0)
+        self.figure.tight_layout()
+        self._init_blit()
+        
+        # History is recorded per solution, the plot redrawn at most once per tick
+        self._dirty = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start(_REDRAW_INTERVAL_MS)
     
     def update_solution(self, solution):
-        """Update residuals display."""
+        """Record residual statistics (plotted on the next redraw tick)."""
         if solution is None:
             return
         
@@ -384,36 +855,39 @@ class ResidualWidget(QWidget):
         self.residuals_mean_hist.append(solution.residuals_mean)
         self.residuals_std_hist.append(solution.residuals_std)
         self.residuals_max_hist.append(solution.residuals_max)
-        
-        # Keep only last 300 epochs
-        max_hist = 300
-        if len(self.residuals_mean_hist) > max_hist:
-            self.residuals_mean_hist = self.residuals_mean_hist[-max_hist:]
-            self.residuals_std_hist = self.residuals_std_hist[-max_hist:]
-            self.residuals_max_hist = self.residuals_max_hist[-max_hist:]
-        
-        # Update plot
-        self.ax.clear()
-        
-        x = range(max(0, self.epochs - max_hist), self.epochs)
-        
-        if len(self.residuals_mean_hist) > 0:
-            self.ax.plot(x, self.residuals_mean_hist, label='Mean', color='blue')
-            self.ax.fill_between(x, 
-                                np.array(self.residuals_mean_hist) - np.array(self.residuals_std_hist),
-                                np.array(self.residuals_mean_hist) + np.array(self.residuals_std_hist),
-                                alpha=0.3, color='blue', label='±σ')
-            self.ax.plot(x, self.residuals_max_hist, label='Max', color='red', linestyle='--')
-        
-        self.ax.set_xlabel('Epoch')
-        self.ax.set_ylabel('Residual (m)')
-        self.ax.set_title('Pseudorange Residuals Statistics')
-        self.ax.legend(loc='upper right')
-        self.ax.grid(True, alpha=0.3)
-        self.ax.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._dirty = True
+    
+    def _flush(self):
+        """Redraw if solutions were recorded since the last redraw."""
+        if self._dirty:
+            self._dirty = False
+            self._redraw()
+    
+    def _redraw(self):
+        """Plot the residual statistics history (blitted unless the limits must change)."""
+        x = np.arange(self.epochs - len(self.residuals_mean_hist), self.epochs)
+        mean = _history_array(self.residuals_mean_hist)
+        std = _history_array(self.residuals_std_hist)
+        peak = _history_array(self.residuals_max_hist)
+        
+        self._mean_line.set_data(x, mean)
+        self._max_line.set_data(x, peak)
+        # ±σ band edges, computed once for the band and the limit check
+        band_lo = np.subtract(mean, std)
+        band_hi = np.add(mean, std)
+        self._fill.remove()
+        self._fill = self._animated[1] = self.ax.fill_between(
+            x, band_lo, band_hi, alpha=0.3, color='blue', animated=True)
+        
+        if len(x):
+            # The zero line is part of the background: keep it in view
+            lo = min(0.0, np.nanmin(band_lo))
+            hi = max(0.0, np.nanmax(band_hi), np.nanmax(peak))
+        if len(x) and _chart_limits_fit(self.ax, x, lo, hi):
+            self._blit()
+        else:
+            _set_chart_limits(self.ax, x, *((lo, hi) if len(x) else (0, 0)))
+            self.canvas.draw_idle()
     
     def clear(self):
         """Clear history and plot."""
@@ -421,5 +895,5 @@ class ResidualWidget(QWidget):
         self.residuals_std_hist.clear()
         self.residuals_max_hist.clear()
         self.epochs = 0
-        self.ax.clear()
-        self.canvas.draw()
+        self._dirty = False
+        self._redraw()
@@ -8,7 +8,9 @@ This module implements background threads for GNSS positioning calculations:
 Threading model:
   - Observation data flows from monitoring module via RingBuffer
   - PositioningThread processes each epoch asynchronously
-  - Solutions are emitted as Qt signals back to UI thread
+  - Solutions are emitted as Qt signals back to UI thread, in batches so a
+    burst of epochs posts one event to the UI instead of one per solution;
+    at most one batch is queued at a time (the UI acknowledges each one)
 """
 
 import threading
@@ -28,20 +30,36 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Solutions are emitted once this many are collected, or at the latest this
+# long [s] after the previous emit
+_SOLUTION_BATCH = 8
+_SOLUTION_BATCH_S = 0.1
+
 
 class PositioningSignals(QObject):
     """
     Qt signal container for positioning thread communication.
     
     Attributes:
-        solution_signal (Signal): Emitted when a new positioning solution is available
-                                 Carries: PositioningSolution object
+        solutions_signal (Signal): Emitted when new positioning solutions are available
+                                  Carries: list of PositioningSolution, oldest first
         log_signal (Signal): Emitted for logging and status messages
         status_signal (Signal): Emitted when positioning status changes
     """
-    solution_signal = Signal(object)  # PositioningSolution
+    solutions_signal = Signal(list)  # [PositioningSolution, ...]
     log_signal = Signal(str)
     status_signal = Signal(str, bool)  # (status_name, is_active)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Set while no solutions batch waits in the UI event queue: cleared by the
+        # worker when it emits, set again by the receiver through ack_solutions()
+        self.ui_ready = threading.Event()
+        self.ui_ready.set()
+    
+    def ack_solutions(self):
+        """Called by the receiver of solutions_signal once it has handled a batch."""
+        self.ui_ready.set()
 
 
 class PositioningThread(threading.Thread):
@@ -82,6 +100,7 @@ class PositioningThread(threading.Thread):
         self.position_track = PositionTrack()
         
         # Configuration
+        # approx_position is owned by this thread and updated in place each epoch
         config = get_global_config()
         self.approx_position = np.array(config.approx_rec_pos, dtype=float)
         if np.all(self.approx_position == 0):
@@ -93,9 +112,9 @@ class PositioningThread(threading.Thread):
         self.min_elevation = 10.0
         
         # Epoch caching and merging: combine observations from same UTC time
-        # self.current_epoch_utc: normalized UTC time of the pending epoch (datetime object)
+        # self.current_epoch_utc_ts: UTC time of the pending epoch (whole POSIX seconds)
         # self.pending_epoch: EpochObservation being accumulated
-        self.current_epoch_utc = None
+        self.current_epoch_utc_ts = None
         self.pending_epoch = None
         
         # Statistics
@@ -104,6 +123,10 @@ class PositioningThread(threading.Thread):
         self.last_position = None
         self.first_solution = True
         
+        # Solutions not yet emitted (see _publish)
+        self._out_batch = []
+        self._last_emit = 0.0
+        
     def run(self):
         """
         Main positioning computation loop with epoch caching and merging.
@@ -129,6 +152,10 @@ class PositioningThread(threading.Thread):
                 # Blocks up to 100ms if no data available, allows responsive shutdown
                 epoch_obs = self.ring_buffer.get(block=True, timeout=0.1)
                 
+                # Send solutions that have waited long enough for a full batch
+                if self._out_batch and time.time() - self._last_emit >= _SOLUTION_BATCH_S:
+                    self._emit_solutions()
+                
                 # Check if buffer is closed or empty
                 if epoch_obs is None:
                     if self.ring_buffer.closed:
@@ -136,10 +163,8 @@ class PositioningThread(threading.Thread):
                         if self.pending_epoch is not None:
                             solution = self._process_epoch(self.pending_epoch)
                             if solution is not None:
-                                self.solution_count += 1
-                                self.last_position = solution
-                                self.position_track.add_solution(solution)
-                                self.signals.solution_signal.emit(solution)
+                                self._publish(solution)
+                        self._emit_solutions(force=True)
                         self.signals.log_signal.emit(f"[{self.name}] Buffer closed, stopping")
                         break
                     continue
@@ -150,19 +175,19 @@ class PositioningThread(threading.Thread):
                     logger.warning(f"[{self.name}] epoch_obs missing utc_datetime, skipping")
                     continue
                 
-                # Normalize to whole second (remove microseconds)
-                utc_normalized = utc_dt.replace(microsecond=0)
+                # Normalize to whole second: an int key compares without building
+                # a new datetime (utc_datetime is timezone-aware, so this is exact)
+                utc_ts = int(utc_dt.timestamp())
                 
                 # Step 3 & 4: Handle epoch caching and merging
-                if self.current_epoch_utc is None:
+                if self.current_epoch_utc_ts is None:
                     # First epoch: start caching
-                    self.current_epoch_utc = utc_normalized
+                    self.current_epoch_utc_ts = utc_ts
                     self.pending_epoch = epoch_obs
                     
-                elif utc_normalized == self.current_epoch_utc:
+                elif utc_ts == self.current_epoch_utc_ts:
                     # Same UTC time: merge satellites/signals into pending epoch
-                    for sat_k, sat_v in epoch_obs.satellites.items():
-                        self.pending_epoch.satellites[sat_k] = sat_v
+                    self.pending_epoch.merge(epoch_obs)
                     
                 else:
                     # Different UTC time: process pending epoch, then start new
@@ -170,23 +195,18 @@ class PositioningThread(threading.Thread):
                         solution = self._process_epoch(self.pending_epoch)
                         
                         if solution is not None:
-                            self.solution_count += 1
-                            self.last_position = solution
-                            self.position_track.add_solution(solution)
-                            
                             # Log first solution
                             if self.first_solution:
                                 self.signals.log_signal.emit(
                                     f"[{self.name}] First solution computed: {solution.num_satellites} satellites, "
-                                    f"UTC: {utc_normalized.strftime('%Y-%m-%d %H:%M:%S')}"
+                                    f"UTC: {utc_dt.strftime('%Y-%m-%d %H:%M:%S')}"
                                 )
                                 self.first_solution = False
                             
-                            # Emit solution
-                            self.signals.solution_signal.emit(solution)
+                            self._publish(solution)
                     
                     # Start caching the new epoch
-                    self.current_epoch_utc = utc_normalized
+                    self.current_epoch_utc_ts = utc_ts
                     self.pending_epoch = epoch_obs
                 
                 # Step 5: Periodic status logging every 30 seconds
@@ -207,9 +227,38 @@ class PositioningThread(threading.Thread):
                 self.signals.log_signal.emit(f"[{self.name}] Error: {str(e)}")
                 logger.error(f"[{self.name}] Exception in positioning thread: {str(e)}", exc_info=True)
         
+        self._emit_solutions(force=True)
         self.signals.log_signal.emit(f"[{self.name}] Positioning thread stopped")
         self.signals.status_signal.emit("Stopped", False)
     
+    def _publish(self, solution: PositioningSolution):
+        """Record a new solution and queue it for the UI (emitted in batches)."""
+        self.solution_count += 1
+        self.last_position = solution
+        self.position_track.add_solution(solution)
+        self._out_batch.append(solution)
+        if len(self._out_batch) >= _SOLUTION_BATCH:
+            self._emit_solutions()
+    
+    def _emit_solutions(self, force: bool = False):
+        """
+        Emit the queued solutions as one list.
+        
+        While the UI has not acknowledged the previous batch, solutions keep
+        accumulating instead, so the UI event queue never holds more than one
+        batch however far the UI falls behind.
+        
+        Args:
+            force: Emit even if the previous batch is unacknowledged (shutdown)
+        """
+        if self._out_batch:
+            if not (force or self.signals.ui_ready.is_set()):
+                return
+            self.signals.ui_ready.clear()
+            self.signals.solutions_signal.emit(self._out_batch)
+            self._out_batch = []
+        self._last_emit = time.time()
+    
     def _process_epoch(self, epoch_obs) -> Optional[PositioningSolution]:
         """
         Process a single observation epoch.
@@ -233,8 +282,9 @@ class PositioningThread(threading.Thread):
             if result is None:
                 return None
             
-            # Update approximate position for next epoch
-            self.approx_position = np.array(result.position_ecef)
+            # Update approximate position for next epoch (in place, no new array;
+            # the positioner works on its own copy)
+            np.copyto(self.approx_position, result.position_ecef)
             
             # Convert RTCMHandler's PositioningResult to our PositioningSolution
             solution = self._convert_result_to_solution(result, epoch_obs)
@@ -261,11 +311,6 @@ class PositioningThread(threading.Thread):
         else:
             status = SolutionStatus.NO_FIX
         
-        # Count total signals
-        num_signals = sum(
-            len(sat.signals) for sat in epoch_obs.satellites.values()
-        )
-        
         # Extract GPS week from global config if available
         gps_week = 0  # Placeholder
         
@@ -289,7 +334,7 @@ class PositioningThread(threading.Thread):
             vdop=result.vdop,
             tdop=result.tdop,
             num_satellites=result.num_satellites,
-            num_signals=num_signals,
+            num_signals=epoch_obs.num_signals,
             variance_unit_weight=result.variance,
             convergence=result.convergence,
             status=status,
@@ -298,10 +343,10 @@ class PositioningThread(threading.Thread):
         
         # Compute residuals statistics
         if result.residuals:
-            residuals_array = np.array(result.residuals)
-            solution.residuals_mean = float(np.mean(residuals_array))
-            solution.residuals_std = float(np.std(residuals_array))
-            solution.residuals_max = float(np.max(np.abs(residuals_array)))
+            residuals_array = np.asarray(result.residuals, dtype=np.float64)
+            solution.residuals_mean = float(residuals_array.mean())
+            solution.residuals_std = float(residuals_array.std())
+            solution.residuals_max = float(np.abs(residuals_array).max())
         
         return solution
     
@@ -18,20 +18,20 @@ from collections import deque
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QTableWidget, QTableWidgetItem, QHeaderView, QTabWidget, QFrame, 
-    QSplitter, QStyle, QComboBox, QCheckBox, QTextEdit, QSpinBox,
+    QTableView, QHeaderView, QTabWidget, QFrame, 
+    QSplitter, QStyle, QComboBox, QCheckBox, QPlainTextEdit, QSpinBox,
     QDoubleSpinBox, QDialog
 )
 from PySide6.QtCore import Qt, Slot, QTimer, Signal
-from PySide6.QtGui import QColor, QFont
 
 from ui.positioning.workers import PositioningThread, PositioningSignals
 from ui.positioning.widgets import (
-    PositionMapWidget, PositionInfoWidget, AccuracyWidget, ResidualWidget
+    create_position_map, PositionInfoWidget, AccuracyWidget, ResidualWidget
 )
 from ui.monitoring.workers import IOThread, DataProcessingThread, StreamSignals
 from ui.ConfigDialog import ConfigDialog
 from ui.positioning.positioning_config_dialog import PositioningConfigDialog
+from ui.positioning.table_model import PositionHistoryModel
 from ui.style import get_app_stylesheet
 from core.ring_buffer import RingBuffer
 from core.rtcm_handler import RTCMHandler, get_shared_handler
@@ -72,7 +72,8 @@ class PositioningModule(QMainWindow):
         
         # Positioning computation
         self.positioning_signals = PositioningSignals()
-        self.positioning_signals.solution_signal.connect(self.on_positioning_solution)
+        self.positioning_signals.solutions_signal.connect(
+            self.on_positioning_solutions, Qt.ConnectionType.QueuedConnection)
         self.positioning_signals.log_signal.connect(self.append_log)
         self.positioning_signals.status_signal.connect(self.update_positioning_status)
         
@@ -107,6 +108,7 @@ class PositioningModule(QMainWindow):
                 'baudrate': 115200
             }
         }
+        self._config_dialog = None  # ConfigDialog, created on first open and reused
         
         # ======================================================================
         # UI components
@@ -117,7 +119,10 @@ class PositioningModule(QMainWindow):
         # ======================================================================
         # Status and logging
         # ======================================================================
-        self.log_queue = deque(maxlen=500)
+        self.log_queue = deque(maxlen=500)  # Lines not yet shown, appended by update_ui
+        # Solutions not yet shown, applied by update_ui; not capped: the worker
+        # sends the next batch only after the previous one was acknowledged
+        self._pending_solutions = []
         self.is_running = False
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_ui)
@@ -208,7 +213,7 @@ class PositioningModule(QMainWindow):
         
         # Map
         left_layout.addWidget(QLabel("<b>Position Track</b>"))
-        self.map_widget = PositionMapWidget()
+        self.map_widget = create_position_map()
         self.map_widget.setMinimumHeight(400)
         left_layout.addWidget(self.map_widget)
         
@@ -231,13 +236,10 @@ class PositioningModule(QMainWindow):
         self.residual_widget = ResidualWidget()
         self.right_tabs.addTab(self.residual_widget, "Residuals")
         
-        # Tab 3: Position history
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(7)
-        self.history_table.setHorizontalHeaderLabels([
-            "Time", "Lat (°)", "Lon (°)", "Height (m)", 
-            "HDOP", "Sats", "Status"
-        ])
+        # Tab 3: Position history (last 100 solutions, newest first)
+        self.history_model = PositionHistoryModel(self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.right_tabs.addTab(self.history_table, "History")
         
@@ -245,13 +247,15 @@ class PositioningModule(QMainWindow):
         right_layout.addWidget(QLabel("<b>System Log</b>"))
         
         # Log area
-        self.log_area = QTextEdit()
+        self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
         self.log_area.setMaximumHeight(150)
         self.log_area.setStyleSheet(
             "background: #ffffff; color: #000000; "
             "font-family: Monospace; border: 1px solid #ccc;"
         )
+        # Qt drops the oldest lines itself once the log exceeds 500 lines
+        self.log_area.setMaximumBlockCount(500)
         right_layout.addWidget(self.log_area)
         
         splitter.addWidget(right_panel)
@@ -261,9 +265,12 @@ class PositioningModule(QMainWindow):
 
     def open_config_dialog(self):
         """Open stream configuration dialog."""
-        # Create a simple config dialog (same as monitoring module)
-        from ui.ConfigDialog import ConfigDialog
-        dlg = ConfigDialog(self, self.settings)
+        # Create the config dialog on first use (same as monitoring module), then reuse it
+        dlg = self._config_dialog
+        if dlg is None:
+            dlg = self._config_dialog = ConfigDialog(self, self.settings)
+        else:
+            dlg.reload(self.settings)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             self.settings = dlg.get_settings()
             self.append_log("Settings updated")
@@ -386,19 +393,18 @@ class PositioningModule(QMainWindow):
             except Exception:
                 pass
 
-            # Stop processing threads
-            for thread in list(self.processing_threads):
+            # Stop processing and IO threads: signal all first, then wait
+            # within one shared 2 second budget instead of 2 seconds per thread
+            threads = list(self.processing_threads) + list(self.io_threads)
+            for thread in threads:
                 try:
                     thread.stop()
-                    thread.join(timeout=2)
                 except Exception:
                     pass
-
-            # Stop IO threads
-            for thread in list(self.io_threads):
+            deadline = time.monotonic() + 2.0
+            for thread in threads:
                 try:
-                    thread.stop()
-                    thread.join(timeout=2)
+                    thread.join(timeout=max(0.0, deadline - time.monotonic()))
                 except Exception:
                     pass
 
@@ -432,46 +438,37 @@ class PositioningModule(QMainWindow):
         # Submit to positioning ring buffer
         self.positioning_ring_buffer.put(epoch_obs, block=False)
 
-    @Slot(object)
-    def on_positioning_solution(self, solution):
-        """Receive positioning solution."""
-        # Update UI
-        self.info_widget.update_solution(solution)
-        self.accuracy_widget.update_solution(solution)
-        self.residual_widget.update_solution(solution)
-        self.map_widget.update_track(solution.latitude, solution.longitude, solution.hdop)
-        
-        # Add to history
-        row = self.history_table.rowCount()
-        self.history_table.insertRow(0)  # Insert at top
-        
-        items = [
-            QTableWidgetItem(datetime.utcnow().strftime('%H:%M:%S')),
-            QTableWidgetItem(f"{solution.latitude:.6f}"),
-            QTableWidgetItem(f"{solution.longitude:.6f}"),
-            QTableWidgetItem(f"{solution.height:.2f}"),
-            QTableWidgetItem(f"{solution.hdop:.2f}"),
-            QTableWidgetItem(str(solution.num_satellites)),
-            QTableWidgetItem(solution.status.value),
-        ]
-        
-        for col, item in enumerate(items):
-            item.setFont(QFont("Courier", 9))
-            
-            # Color code status
-            if col == 6:  # Status column
-                if "Fixed" in item.text():
-                    item.setForeground(QColor("green"))
-                elif "Uncertain" in item.text():
-                    item.setForeground(QColor("orange"))
-                else:
-                    item.setForeground(QColor("red"))
-            
-            self.history_table.setItem(0, col, item)
-        
-        # Keep only last 100 rows
-        while self.history_table.rowCount() > 100:
-            self.history_table.removeRow(self.history_table.rowCount() - 1)
+    @Slot(list)
+    def on_positioning_solutions(self, solutions):
+        """Receive a batch of positioning solutions (oldest first); shown by update_ui."""
+        self._pending_solutions.extend(solutions)
+        # Let the worker send its next batch
+        self.positioning_signals.ack_solutions()
+
+    def apply_solutions(self, solutions):
+        """
+        Show the solutions received since the last UI tick.
+        
+        Procedure:
+        1. Show only the latest solution in the info table
+        2. Feed every solution to the DOP/residual histories and the map track
+           (they redraw on their own timers)
+        3. Add all history rows to the history model in one insert
+        
+        Args:
+            solutions: Solutions, oldest first
+        """
+        # Step 1: Latest solution only
+        self.info_widget.update_solution(solutions[-1])
+        
+        # Step 2: Histories and track
+        for solution in solutions:
+            self.accuracy_widget.update_solution(solution)
+            self.residual_widget.update_solution(solution)
+            self.map_widget.update_track(solution.latitude, solution.longitude, solution.hdop)
+        
+        # Step 3: History table
+        self.history_model.add_solutions(solutions, datetime.utcnow().strftime('%H:%M:%S'))
 
     @Slot(str)
     def update_stream_status(self, stream_name: str, connected: bool):
@@ -497,9 +494,17 @@ class PositioningModule(QMainWindow):
     @Slot()
     def update_ui(self):
         """Update UI elements (timer-based)."""
-        # Refresh log display
-        log_text = '\n'.join(list(self.log_queue))
-        self.log_area.setPlainText(log_text)
+        # Solutions received since the last tick, applied as one batch
+        if self._pending_solutions:
+            solutions, self._pending_solutions = self._pending_solutions, []
+            self.apply_solutions(solutions)
+        
+        # Append only the lines logged since the last tick; the document block
+        # limit trims old lines, so the log is never re-set as a whole
+        if not self.log_queue:
+            return
+        self.log_area.appendPlainText('\n'.join(self.log_queue))
+        self.log_queue.clear()
         self.log_area.verticalScrollBar().setValue(
             self.log_area.verticalScrollBar().maximum()
         )